@@ -9,10 +9,25 @@ Window: 3.0 s, hop 1.5 s. Per window we compute a log-mel power spectrogram
 fixed vector: per-band {mean, std, p90} over time plus a handful of global
 spectral-shape statistics. This is the statistical silhouette of the sound;
 it is NOT a per-call detector and carries no whale-count claim.
+
+`window_feature` is the reference definition for one slice. The recording-level
+entry points (`windows_from_wav`, `features_at_starts`) use `window_features`,
+which transforms every distinct STFT frame of the recording once in batched
+blocks, reduces it to per-frame statistics, and aggregates those over each
+window's frame range. Windows whose starts are congruent modulo HOP share
+frames outright. The default 1.5 s hop (72000 samples) is not a multiple of
+512, so neighbouring windows keep their own frame alignment and stay
+numerically equal to `window_feature`.
+
+Recordings are read through `WavReader`, which memory-maps the file and hands
+out mono float32 spans, so the entry points featurize bounded groups of
+windows (`READ_BLOCK_S` of audio each) instead of loading the whole file as
+float64 (`read_wav_mono`, kept for short clips).
 """
 from __future__ import annotations
 
 import numpy as np
+import scipy.fft
 from scipy import signal
 import scipy.io.wavfile as wavfile
 
@@ -24,6 +39,13 @@ FMIN = 50.0
 FMAX = 20000.0
 WIN_S = 3.0
 HOP_S = 1.5
+# Frames transformed per batched FFT block (x FFT float64 = 2 MB); larger
+# blocks measured slower (fresh multi-MB temporaries per block).
+FRAME_BLOCK = 128
+# Windows aggregated at once (their gathered log-mel frames stay ~6 MB).
+WINDOW_BLOCK = 64
+# Audio read from a file per group of windows (60 s mono float32 = 11.5 MB).
+READ_BLOCK_S = 60.0
 
 
 def _hz_to_mel(f: np.ndarray | float) -> np.ndarray | float:
@@ -59,15 +81,65 @@ _FB = mel_filterbank()
 
 def read_wav_mono(path: str) -> tuple[int, np.ndarray]:
     sr, x = wavfile.read(path)
-    if x.ndim > 1:
-        x = x.mean(axis=1)
+    # Scale before the downmix: the channel mean is float, which would skip it.
     if np.issubdtype(x.dtype, np.integer):
         x = x.astype(np.float64) / float(np.iinfo(x.dtype).max)
     else:
         x = x.astype(np.float64)
+    if x.ndim > 1:
+        x = x.mean(axis=1)
     return sr, x
 
 
+class WavReader:
+    """Lazy mono float32 view of a PCM / IEEE-float WAV file.
+
+    The sample data is memory-mapped (`scipy.io.wavfile.read(mmap=True)`), so
+    opening a multi-hour archive costs nothing; `read` and `blocks` scale and
+    downmix only the requested span. 24-bit files cannot be memory-mapped and
+    are loaded whole (still without the float64 copy of `read_wav_mono`).
+    Integer PCM is scaled by the dtype maximum, as in `read_wav_mono`.
+    """
+
+    def __init__(self, path: str):
+        try:
+            self.sr, self._data = wavfile.read(path, mmap=True)
+        except ValueError:
+            self.sr, self._data = wavfile.read(path)
+        dtype = self._data.dtype
+        self._scale = (np.float32(1.0 / float(np.iinfo(dtype).max))
+                       if np.issubdtype(dtype, np.integer) else None)
+
+    @property
+    def n_samples(self) -> int:
+        return int(self._data.shape[0])
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def read(self, start: int, stop: int) -> np.ndarray:
+        """Samples [start, stop) (clipped to the file) as mono float32."""
+        raw = self._data[max(0, start):max(0, min(stop, self.n_samples))]
+        if raw.ndim > 1:
+            x = np.asarray(raw.mean(axis=1, dtype=np.float32))
+        else:
+            x = np.array(raw, dtype=np.float32)
+        if self._scale is not None:
+            x *= self._scale
+        return x
+
+    def blocks(self, block: int, overlap: int = FFT - HOP):
+        """Yield (start_sample, mono float32 block) covering the file.
+
+        Consecutive blocks overlap by `overlap` samples (default: one STFT
+        frame minus a hop) and `block - overlap` is rounded to whole hops, so
+        every frame on the file's HOP grid lies whole inside exactly one block.
+        """
+        step = max(HOP, (block - overlap) // HOP * HOP)
+        for a in range(0, max(1, self.n_samples - overlap), step):
+            yield a, self.read(a, a + step + overlap)
+
+
 def log_mel(x: np.ndarray, sr: int = SR) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Return (log_mel [n_mels, T], magnitude [freq, T], freqs)."""
     f, _, Z = signal.stft(x, fs=sr, window="hann", nperseg=FFT,
@@ -116,6 +188,112 @@ def window_feature(x: np.ndarray, sr: int = SR) -> np.ndarray:
 
 
 N_FEATURES = 3 * N_MELS + 9
+_HANN = signal.get_window("hann", FFT)
+
+
+def frame_stats(x: np.ndarray, sr: int, offsets: np.ndarray,
+                block_frames: int = FRAME_BLOCK) -> dict[str, np.ndarray]:
+    """Per-frame STFT statistics for frames starting at sorted unique `offsets`.
+
+    Each frame is the same Hann-windowed, 1/sum(window)-scaled FFT column that
+    `scipy.signal.stft` produces inside `log_mel`. Returned per frame: `logmel`
+    [n, N_MELS], `centroid`, `bandwidth`, `flatness`, `p_hi` / `p_lo` (power
+    above / below 4 kHz) and `flux_next` (spectral flux to the frame at
+    offset + HOP, NaN when that frame is not among `offsets`).
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    n = offsets.size
+    freqs = scipy.fft.rfftfreq(FFT, 1.0 / sr)
+    hi = freqs >= 4000.0
+    # Every per-frame power sum is one column of a single matmul.
+    moments = np.stack([np.ones_like(freqs), freqs, freqs ** 2, hi, ~hi], axis=1).astype(np.float64)
+    frames = np.lib.stride_tricks.sliding_window_view(x, FFT)
+    scale = 1.0 / _HANN.sum()
+    nxt = np.searchsorted(offsets, offsets + HOP)
+    has_next = nxt < n
+    has_next[has_next] = offsets[nxt[has_next]] == offsets[has_next] + HOP
+    out = {
+        "logmel": np.empty((n, N_MELS)),
+        "centroid": np.empty(n), "bandwidth": np.empty(n), "flatness": np.empty(n),
+        "p_hi": np.empty(n), "p_lo": np.empty(n), "flux_next": np.full(n, np.nan),
+    }
+    eps = 1e-10
+    buf = np.empty((0, FFT))
+    for i0 in range(0, n, block_frames):
+        i1 = min(i0 + block_frames, n)
+        # Extend the block to the next-frames its flux needs.
+        stop = max(i1, int(nxt[i0:i1][has_next[i0:i1]].max(initial=i1 - 1)) + 1)
+        block = offsets[i0:stop]
+        if buf.shape[0] < block.size:
+            buf = np.empty((block.size, FFT))
+        tapered = buf[: block.size]
+        if block.size > 1 and np.all(np.diff(block) == HOP):
+            # One frame grid (e.g. snapped windows): a strided view, no gather.
+            np.multiply(frames[block[0]:block[-1] + 1:HOP], _HANN, out=tapered)
+        else:
+            np.multiply(frames[block], _HANN, out=tapered)
+        spec = scipy.fft.rfft(tapered, axis=1, overwrite_x=True)
+        spec *= scale
+        power = spec.real ** 2 + spec.imag ** 2
+        mag = np.sqrt(power)
+        out["logmel"][i0:i1] = np.log(power[: i1 - i0] @ _FB.T + 1e-10)
+        p = power[: i1 - i0] + eps
+        psum, pf, pf2, out["p_hi"][i0:i1], out["p_lo"][i0:i1] = (p @ moments).T
+        centroid = pf / psum
+        out["centroid"][i0:i1] = centroid
+        # sum((f - c)^2 p) / sum(p), expanded.
+        out["bandwidth"][i0:i1] = np.sqrt(np.maximum(pf2 / psum - centroid ** 2, 0.0))
+        out["flatness"][i0:i1] = np.exp(np.log(p).mean(axis=1)) / (psum / p.shape[1] + eps)
+        local = np.flatnonzero(has_next[i0:i1])
+        diff = mag[nxt[i0 + local] - i0] - mag[local]
+        out["flux_next"][i0 + local] = np.sqrt((diff ** 2).sum(axis=1))
+    return out
+
+
+def window_features(x: np.ndarray, sr: int, starts: np.ndarray, win: int,
+                    window_block: int = WINDOW_BLOCK) -> np.ndarray:
+    """`window_feature(x[a:a + win], sr)` for every start sample `a`, from shared frames.
+
+    Every distinct frame offset across the windows is transformed once
+    (`frame_stats`); per-window rows are then aggregated from frame ranges.
+    Agrees with `window_feature` to floating-point rounding. Every window must
+    lie inside `x`.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    if starts.size == 0:
+        return np.empty((0, N_FEATURES), dtype=np.float64)
+    if win < FFT:
+        return np.asarray([window_feature(x[a:a + win], sr) for a in starts], dtype=np.float64)
+    n_frames = (win - FFT) // HOP + 1
+    wanted = (starts[:, None] + HOP * np.arange(n_frames)[None, :]).ravel()
+    offsets, frame_of = np.unique(wanted, return_inverse=True)
+    frame_of = frame_of.reshape(starts.size, n_frames)
+    st = frame_stats(x, sr, offsets)
+
+    eps = 1e-10
+    feats = np.empty((starts.size, N_FEATURES), dtype=np.float64)
+    for w0 in range(0, starts.size, window_block):
+        idx = frame_of[w0:w0 + window_block]
+        logm = st["logmel"][idx]                       # (W, T, N_MELS)
+        rows = feats[w0:w0 + window_block]
+        rows[:, :N_MELS] = logm.mean(axis=1)
+        rows[:, N_MELS:2 * N_MELS] = logm.std(axis=1)
+        rows[:, 2 * N_MELS:3 * N_MELS] = np.percentile(logm.transpose(0, 2, 1), 90, axis=2)
+        g = rows[:, 3 * N_MELS:]
+        g[:, 0] = st["centroid"][idx].mean(axis=1)
+        g[:, 1] = st["centroid"][idx].std(axis=1)
+        g[:, 2] = st["bandwidth"][idx].mean(axis=1)
+        g[:, 3] = st["flatness"][idx].mean(axis=1)
+        g[:, 4] = st["flux_next"][idx[:, :-1]].mean(axis=1) if n_frames > 1 else 0.0
+        g[:, 7] = np.log(st["p_hi"][idx].sum(axis=1) / (st["p_lo"][idx].sum(axis=1) + eps) + eps)
+    # Sample-domain statistics as `_global_feats` computes them, accumulated in
+    # float64 for float32 input.
+    for i, a in enumerate(starts):
+        seg = x[a:a + win]
+        feats[i, 3 * N_MELS + 5] = np.sqrt(np.square(seg, dtype=np.float64).mean())
+        feats[i, 3 * N_MELS + 6] = seg.std(dtype=np.float64)
+        feats[i, 3 * N_MELS + 8] = np.mean(np.abs(np.diff(np.sign(seg)))) / 2.0
+    return feats
 
 
 def feature_names() -> list[str]:
@@ -127,21 +305,52 @@ def feature_names() -> list[str]:
     return names
 
 
-def windows_from_wav(path: str, win_s: float = WIN_S, hop_s: float = HOP_S
-                     ) -> tuple[np.ndarray, np.ndarray]:
-    """Return (features [n_windows, N_FEATURES], window_start_times_s)."""
-    sr, x = read_wav_mono(path)
+def _snap(starts: np.ndarray, n_samples: int, win: int) -> np.ndarray:
+    """Move each start to the nearest multiple of HOP that keeps the window inside."""
+    snapped = np.rint(starts / HOP).astype(np.int64) * HOP
+    return np.where(snapped + win <= n_samples, snapped, snapped - HOP)
+
+
+def _features_from_reader(reader: WavReader, starts: np.ndarray, win: int,
+                          block_s: float = READ_BLOCK_S) -> np.ndarray:
+    """`window_features` for in-file `starts`, reading one bounded span per group.
+
+    Sorted starts are grouped so each group's audio spans at most
+    max(`block_s`, one window); peak memory is independent of file length.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    order = np.argsort(starts, kind="stable")
+    s = starts[order]
+    feats = np.empty((s.size, N_FEATURES), dtype=np.float64)
+    reach = max(int(block_s * reader.sr) - win, 0)
+    i = 0
+    while i < s.size:
+        j = max(i + 1, int(np.searchsorted(s, s[i] + reach, side="right")))
+        a = int(s[i])
+        x = reader.read(a, int(s[j - 1]) + win)
+        feats[order[i:j]] = window_features(x, reader.sr, s[i:j] - a, win)
+        i = j
+    return feats
+
+
+def windows_from_wav(path: str, win_s: float = WIN_S, hop_s: float = HOP_S,
+                     snap_to_frames: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Return (features [n_windows, N_FEATURES], window_start_times_s).
+
+    `snap_to_frames=True` computes each window at its start rounded to the
+    STFT hop (<= HOP/2 samples, ~5 ms at 48 kHz away), so all windows share
+    one frame grid and the recording is transformed once (about half the
+    FFTs of the default 50%-overlap tiling). Reported start times are the
+    unsnapped tiling either way.
+    """
+    reader = WavReader(path)
+    sr, n = reader.sr, reader.n_samples
     win = int(round(win_s * sr))
     hop = int(round(hop_s * sr))
-    feats: list[np.ndarray] = []
-    starts: list[float] = []
-    for s in range(0, max(1, len(x) - win + 1), hop):
-        seg = x[s:s + win]
-        if len(seg) < win:
-            break
-        feats.append(window_feature(seg, sr))
-        starts.append(s / sr)
-    return np.asarray(feats, dtype=np.float64), np.asarray(starts, dtype=np.float64)
+    starts = np.arange(0, max(1, n - win + 1), hop)
+    starts = starts[starts + win <= n]
+    at = _snap(starts, n, win) if snap_to_frames else starts
+    return _features_from_reader(reader, at, win), starts / sr
 
 
 def feature_for_segment(x: np.ndarray, sr: int, t0: float, t1: float) -> np.ndarray | None:
@@ -156,8 +365,8 @@ def feature_for_segment(x: np.ndarray, sr: int, t0: float, t1: float) -> np.ndar
     return window_feature(seg, sr)
 
 
-def features_at_starts(path: str, starts_s, win_s: float = WIN_S
-                       ) -> tuple[np.ndarray, np.ndarray]:
+def features_at_starts(path: str, starts_s, win_s: float = WIN_S,
+                       snap_to_frames: bool = False) -> tuple[np.ndarray, np.ndarray]:
     """Compute features at a GIVEN set of window start times (seconds), instead
     of re-tiling internally. This is the compute-once contract with the
     window-level labeller (windows.py): pass it the same `starts` that produced
@@ -165,19 +374,15 @@ def features_at_starts(path: str, starts_s, win_s: float = WIN_S
 
     Returns (features [n_kept, N_FEATURES], kept_starts_s). Windows that run past
     the end of the audio are dropped, and the matching label rows must be dropped
-    with `kept_starts_s`."""
-    sr, x = read_wav_mono(path)
+    with `kept_starts_s`. `snap_to_frames` is as in `windows_from_wav`."""
+    reader = WavReader(path)
+    sr, n = reader.sr, reader.n_samples
     win = int(round(win_s * sr))
-    feats: list[np.ndarray] = []
-    kept: list[float] = []
-    for ts in np.asarray(starts_s, dtype=np.float64):
-        a = int(round(ts * sr))
-        seg = x[a:a + win]
-        if len(seg) < win:
-            continue
-        feats.append(window_feature(seg, sr))
-        kept.append(float(ts))
-    return np.asarray(feats, dtype=np.float64), np.asarray(kept, dtype=np.float64)
+    starts_s = np.asarray(starts_s, dtype=np.float64)
+    a = np.asarray([int(round(ts * sr)) for ts in starts_s], dtype=np.int64)
+    keep = (a >= 0) & (a + win <= n)
+    at = _snap(a[keep], n, win) if snap_to_frames else a[keep]
+    return _features_from_reader(reader, at, win), starts_s[keep]
 
 
 if __name__ == "__main__":
@@ -29,7 +29,7 @@ from pathlib import Path
 
 import numpy as np
 
-from features import window_feature, read_wav_mono, WIN_S, N_FEATURES
+from features import window_feature, WavReader, WIN_S, N_FEATURES
 from windows import SALISH_DCLDE_DATASETS
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -73,14 +73,15 @@ def extract_feature(url: str, start_s: float) -> np.ndarray | None:
         )
         if r.returncode != 0 or Path(tf.name).stat().st_size < 1000:
             return None
+        need = int(WIN_S * SR)
         try:
-            sr, x = read_wav_mono(tf.name)
+            reader = WavReader(tf.name)
+            if reader.n_samples < int(need * 0.8):
+                return None
+            x = reader.read(0, need).astype(np.float64)
         except Exception:
             return None
-    need = int(WIN_S * SR)
-    if len(x) < int(need * 0.8):
-        return None
-    return window_feature(x[:need], SR).astype(np.float32)
+    return window_feature(x, SR).astype(np.float32)
 
 
 def file_duration_s(url: str) -> float | None:
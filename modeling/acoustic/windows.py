@@ -92,6 +92,54 @@ def _overlap_s(a0: float, a1: float, b0: float, b1: float) -> float:
     return max(0.0, min(a1, b1) - max(a0, b0))
 
 
+def _window_overlaps(
+    starts: np.ndarray, anns: list[Annotation], win_s: float, min_overlap_s: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per window: largest overlap (s), index into `anns` of the annotation
+    giving it (-1 if none overlaps), and the count of annotations overlapping
+    by at least `min_overlap_s`.
+
+    Same arithmetic as `_overlap_s` per pair, and ties go to the earliest
+    annotation, but without the windows x annotations scan: windows all have
+    length `win_s`, so sorted by start the windows an annotation overlaps are
+    one contiguous run, found by two binary searches. Only overlapping pairs
+    are materialized, O((W + A) log W + pairs).
+    """
+    n = starts.size
+    best_ov = np.zeros(n, dtype=np.float64)
+    best_idx = np.full(n, -1, dtype=np.int64)
+    concurrent = np.zeros(n, dtype=np.int64)
+    if n == 0 or not anns:
+        return best_ov, best_idx, concurrent
+    t0 = np.fromiter((a.t0 for a in anns), dtype=np.float64, count=len(anns))
+    t1 = np.fromiter((a.t1 for a in anns), dtype=np.float64, count=len(anns))
+
+    order = np.argsort(starts, kind="stable")
+    ws = starts[order]
+    we = ws + win_s
+    # Window k overlaps annotation j iff we[k] > t0[j] and ws[k] < t1[j].
+    lo = np.searchsorted(we, t0, side="right")
+    hi = np.searchsorted(ws, t1, side="left")
+    runs = np.maximum(hi - lo, 0)
+    ann = np.repeat(np.arange(len(anns)), runs)
+    win = np.repeat(lo - np.cumsum(runs) + runs, runs) + np.arange(runs.sum())
+    ov = np.maximum(0.0, np.minimum(we[win], t1[ann]) - np.maximum(ws[win], t0[ann]))
+
+    if min_overlap_s <= 0:
+        # Every annotation passes a non-positive gate, overlapping or not.
+        concurrent[:] = len(anns)
+    else:
+        concurrent[order] = np.bincount(win[ov >= min_overlap_s], minlength=n)
+    hit = ov > 0
+    win, ann, ov = win[hit], ann[hit], ov[hit]
+    # Per window the largest overlap, earliest annotation on ties.
+    pick = np.lexsort((ann, -ov, win))
+    first = pick[np.r_[True, win[pick][1:] != win[pick][:-1]]] if pick.size else pick
+    best_ov[order[win[first]]] = ov[first]
+    best_idx[order[win[first]]] = ann[first]
+    return best_ov, best_idx, concurrent
+
+
 def label_windows(
     clip_id: str,
     starts_s: np.ndarray,
@@ -138,22 +186,11 @@ def label_windows(
         group_val = "|".join(str(_first_group(anns, k)) for k in group_by) if anns else "unknown"
     groups = np.full(n, group_val, dtype=object)
 
-    for i, ws in enumerate(starts):
-        we = ws + win_s
-        best_ov = 0.0
-        best_ann: Annotation | None = None
-        concurrent = 0
-        for a in anns:
-            ov = _overlap_s(ws, we, a.t0, a.t1)
-            if ov >= min_overlap_s:
-                concurrent += 1
-            if ov > best_ov:
-                best_ov, best_ann = ov, a
-        overlaps[i] = best_ov / win_s
-        n_concurrent[i] = concurrent
-        if best_ann is None or best_ov < min_overlap_s:
-            continue
-        labels[i] = _scheme_label(scheme, best_ann, concurrent)
+    best_ov, best_idx, concurrent = _window_overlaps(starts, anns, win_s, min_overlap_s)
+    overlaps[:] = best_ov / win_s
+    n_concurrent[:] = concurrent
+    for i in np.flatnonzero((best_idx >= 0) & (best_ov >= min_overlap_s)):
+        labels[i] = _scheme_label(scheme, anns[best_idx[i]], int(concurrent[i]))
 
     return WindowLabels(
         clip_id=clip_id, starts_s=starts, labels=labels.astype(str),
@@ -330,6 +367,25 @@ def _date_only(v) -> str | None:
     return s[:10]
 
 
+def _check_against_pairwise_scan(seed: int = 0) -> None:
+    """`_window_overlaps` equals the direct windows x annotations scan,
+    including overlap ties, zero-length / inverted annotations, unsorted and
+    duplicate starts, and a zero gate."""
+    rng = np.random.default_rng(seed)
+    t0 = rng.integers(0, 200, 400) * 0.5
+    anns = [Annotation(t0=float(a), t1=float(a + d), clip_id="c")
+            for a, d in zip(t0, rng.choice([-1.0, 0.0, 0.5, 1.5, 3.0, 40.0], t0.size))]
+    starts = np.concatenate([window_starts(210.0), rng.uniform(-5, 210, 50), [3.0, 3.0]])
+    for frac in (0.0, 0.25, 0.5, 1.0):
+        got = _window_overlaps(starts, anns, WIN_S, frac * WIN_S)
+        for i, ws in enumerate(starts):
+            ovs = [_overlap_s(ws, ws + WIN_S, a.t0, a.t1) for a in anns]
+            best = int(np.argmax(ovs)) if max(ovs) > 0 else -1
+            assert got[0][i] == max(ovs) and got[1][i] == best, (frac, i)
+            assert got[2][i] == sum(ov >= frac * WIN_S for ov in ovs), (frac, i)
+    print(f"  sorted-interval overlaps match the pairwise scan ({starts.size} windows x {len(anns)} annotations)")
+
+
 def _selftest() -> int:
     """Offline logic check on synthetic intervals. Writes nothing, trains
     nothing, ships nothing. Confirms the labeller and grouping behave."""
@@ -351,6 +407,7 @@ def _selftest() -> int:
         assert non_bg > 0, f"expected some labelled windows for {scheme}"
         print(f"  scheme={scheme:18s} windows={len(starts):3d} "
               f"groups={set(wl.groups)} balance={bal}")
+    _check_against_pairwise_scan()
     print("windows.py self-test OK (synthetic, nothing written)")
     return 0
 
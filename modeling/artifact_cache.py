@@ -0,0 +1,207 @@
+"""Content-addressed memoization for the expensive fit-pipeline stages.
+
+``run_fit`` recomputes its diagnostics (level-0 QC, the Level 1 PSTH nulls,
+cross-station consistency, held-out PIT, time-rescaling with the Hawkes
+diagnostic) on every run, even when the dataset snapshot is pinned and nothing
+changed. This cache memoizes each stage's result under a content ID built from:
+
+* the stage name,
+* the dataset snapshot ID (``snap_id`` already digests every input stream),
+* the stage parameters (covariates, family, seeds, design settings, and for
+  model-dependent stages a digest of the fitted coefficients),
+* a digest of the ``modeling`` sources, so any code change invalidates
+  every entry rather than serving results from older code.
+
+Entries are JSON files in a local directory with least-recently-used eviction
+once the directory exceeds its byte budget. An optional S3 tier is consulted
+on a local miss and written through on store, so a fresh container can reuse
+artifacts from earlier runs. A stage result is only cached if it survives a
+JSON round trip unchanged, so a hit always returns exactly what a recompute
+would. Hit/miss counts per stage are kept for the run manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_SCHEMA = "orcast/artifact/v1"
+_MODELING_DIR = Path(__file__).resolve().parent
+_COVARIATES_SRC = _MODELING_DIR.parent / "src" / "aws_backend" / "covariates.py"
+_SOURCE_DIGEST: Optional[str] = None
+
+
+def source_digest() -> str:
+    """sha256 over the modeling sources (tests excluded) and the covariate helpers."""
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        digest = hashlib.sha256()
+        paths = sorted(p for p in _MODELING_DIR.rglob("*.py") if "tests" not in p.relative_to(_MODELING_DIR).parts)
+        if _COVARIATES_SRC.exists():
+            paths.append(_COVARIATES_SRC)
+        for path in paths:
+            digest.update(str(path.relative_to(_MODELING_DIR.parent)).encode("utf-8"))
+            digest.update(path.read_bytes())
+        _SOURCE_DIGEST = digest.hexdigest()
+    return _SOURCE_DIGEST
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Serialized ``value`` if it round-trips through JSON unchanged, else ``None``."""
+    try:
+        text = json.dumps(value, allow_nan=True)
+    except (TypeError, ValueError):
+        return None
+    return text if _same(json.loads(text), value) else None
+
+
+def _same(loaded: Any, original: Any) -> bool:
+    # Exact types except that float subclasses (numpy float64) come back as
+    # float, which serializes identically; NaN equals NaN.
+    if isinstance(original, float):
+        return type(loaded) is float and (loaded == original or (loaded != loaded and original != original))
+    if type(loaded) is not type(original):
+        return False
+    if isinstance(original, dict):
+        return list(loaded) == list(original) and all(_same(loaded[k], original[k]) for k in original)
+    if isinstance(original, list):
+        return len(loaded) == len(original) and all(_same(x, y) for x, y in zip(loaded, original))
+    return loaded == original
+
+
+class ArtifactCache:
+    """Local LRU directory of stage results with an optional S3 tier."""
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: str = "artifacts/",
+        s3_client: Any = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.s3_bucket = s3_bucket
+        self.s3_prefix = s3_prefix
+        self._s3 = s3_client
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, stage: str, outcome: str) -> None:
+        counts = self.stats.setdefault(stage, {"hits": 0, "s3_hits": 0, "misses": 0, "uncacheable": 0})
+        counts[outcome] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        totals = {"hits": 0, "s3_hits": 0, "misses": 0, "uncacheable": 0}
+        for counts in self.stats.values():
+            for outcome, n in counts.items():
+                totals[outcome] += n
+        return {**totals, "stages": {stage: dict(c) for stage, c in sorted(self.stats.items())}}
+
+    @staticmethod
+    def key(stage: str, snap_id: str, params: Dict[str, Any]) -> str:
+        body = {"schema": CACHE_SCHEMA, "stage": stage, "snap_id": snap_id, "params": params, "code": source_digest()}
+        text = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+        return f"art_{hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _s3_client(self):
+        if self._s3 is None and self.s3_bucket:
+            try:
+                import boto3
+                from src.aws_backend.config import settings
+
+                self._s3 = boto3.client("s3", region_name=settings.aws_region)
+            except Exception as exc:
+                logger.warning("Artifact cache S3 tier disabled (%s)", exc)
+                self.s3_bucket = None
+        return self._s3
+
+    def _read_local(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # recency for LRU eviction
+        except OSError:
+            pass
+        return text
+
+    def _read_s3(self, key: str) -> Optional[str]:
+        s3 = self._s3_client()
+        if s3 is None:
+            return None
+        try:
+            response = s3.get_object(Bucket=self.s3_bucket, Key=f"{self.s3_prefix}{key}.json")
+            return response["Body"].read().decode("utf-8")
+        except Exception:
+            return None
+
+    def _write(self, key: str, text: str) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / f"{key}.json.tmp"
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self._path(key))
+            self._evict()
+        except OSError as exc:
+            logger.warning("Could not store artifact %s (%s)", key, exc)
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("art_*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def memoize(self, stage: str, snap_id: str, params: Dict[str, Any], compute: Callable[[], Any]) -> Any:
+        """Cached result of ``compute()`` for this stage, snapshot and parameters."""
+        key = self.key(stage, snap_id, params)
+        text = self._read_local(key)
+        if text is not None:
+            self._count(stage, "hits")
+            return json.loads(text)
+        text = self._read_s3(key)
+        if text is not None:
+            self._count(stage, "s3_hits")
+            self._write(key, text)
+            return json.loads(text)
+
+        value = compute()
+        text = _to_json(value)
+        if text is None:
+            self._count(stage, "uncacheable")
+            return value
+        self._count(stage, "misses")
+        self._write(key, text)
+        s3 = self._s3_client()
+        if s3 is not None:
+            try:
+                s3.put_object(
+                    Bucket=self.s3_bucket, Key=f"{self.s3_prefix}{key}.json",
+                    Body=text.encode("utf-8"), ContentType="application/json",
+                )
+            except Exception as exc:
+                logger.warning("Artifact %s not written to S3 (%s)", key, exc)
+        return value
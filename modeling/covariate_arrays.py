@@ -0,0 +1,170 @@
+"""Array-native counterparts of the ``src/aws_backend/covariates`` phase math.
+
+``src/aws_backend/covariates`` is stdlib-only (it ships in the serving image,
+which has no numpy) and works on one ``datetime`` at a time. The offline design
+build evaluates the same formulas at every bin centre, so this module re-states
+them over NumPy arrays of *hours since the Unix epoch* (the pipeline's time
+axis, see ``modeling.timeutil``).
+
+Exactness: ``from_hours`` rounds to whole microseconds (``datetime``
+resolution) before the calendar fields are read, and :func:`utc_fields` does
+the same rounding. The diel, lunar and season phases then repeat the scalar
+code's float operations in the same order, so they are bit-identical to
+``diel_phase(from_hours(t), lng)``, ``lunar_phase(from_hours(t))["phase"]`` and
+``season_phase_hours(t)``. The solar position goes through ``numpy``'s
+trigonometry instead of ``math``'s and agrees to float rounding.
+
+Every function takes the times in hours; callers evaluating several phases at
+the same times can pass ``fields=utc_fields(hours)`` to decompose them once.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.aws_backend.covariates import _NEW_MOON_EPOCH_JD, _SYNODIC_MONTH
+
+_US_PER_SECOND = 1_000_000
+
+
+def epoch_microseconds(hours) -> np.ndarray:
+    """Whole microseconds since the epoch, rounded exactly as ``from_hours`` does.
+
+    ``datetime.fromtimestamp`` splits the float seconds into integer and
+    fractional parts and rounds the fraction half-to-even to microseconds.
+    """
+    seconds = np.asarray(hours, dtype=float) * 3600.0
+    whole = np.trunc(seconds)
+    us = np.rint((seconds - whole) * 1e6)
+    carry = us >= 1e6
+    whole = np.where(carry, whole + 1.0, whole)
+    us = np.where(carry, us - 1e6, us)
+    borrow = us < 0
+    whole = np.where(borrow, whole - 1.0, whole)
+    us = np.where(borrow, us + 1e6, us)
+    return whole.astype(np.int64) * _US_PER_SECOND + us.astype(np.int64)
+
+
+def utc_fields(hours) -> Dict[str, np.ndarray]:
+    """Calendar fields of ``from_hours(t)`` for each ``t`` (all int64 arrays).
+
+    Keys: ``year``, ``month``, ``day``, ``hour``, ``minute``, ``second``,
+    ``microsecond``, plus ``us`` (epoch microseconds) and ``year_start_us``
+    (epoch microseconds of Jan 1 00:00 of that year).
+    """
+    us = epoch_microseconds(hours)
+    stamp = us.astype("datetime64[us]")
+    days = stamp.astype("datetime64[D]")
+    months = stamp.astype("datetime64[M]")
+    years = stamp.astype("datetime64[Y]")
+    tod = us - days.astype("datetime64[us]").astype(np.int64)
+    return {
+        "year": years.astype(np.int64) + 1970,
+        "month": (months - years.astype("datetime64[M]")).astype(np.int64) + 1,
+        "day": (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+        "hour": tod // 3_600_000_000,
+        "minute": tod // 60_000_000 % 60,
+        "second": tod // _US_PER_SECOND % 60,
+        "microsecond": tod % _US_PER_SECOND,
+        "us": us,
+        "year_start_us": years.astype("datetime64[us]").astype(np.int64),
+    }
+
+
+def _minutes_of_day(f: Dict[str, np.ndarray]) -> np.ndarray:
+    return f["hour"] * 60.0 + f["minute"] + (f["second"] + f["microsecond"] / 1e6) / 60.0
+
+
+def julian_day(f: Dict[str, np.ndarray]) -> np.ndarray:
+    """``covariates._julian_day`` over :func:`utc_fields` output."""
+    day = f["day"] + (f["hour"] + f["minute"] / 60.0 + (f["second"] + f["microsecond"] / 1e6) / 3600.0) / 24.0
+    early = f["month"] <= 2
+    year = np.where(early, f["year"] - 1, f["year"])
+    month = np.where(early, f["month"] + 12, f["month"])
+    a = year // 100
+    b = 2 - a + a // 4
+    whole = np.floor(365.25 * (year + 4716)).astype(np.int64) + np.floor(30.6001 * (month + 1)).astype(np.int64)
+    return whole + day + b - 1524.5
+
+
+def diel_phase(hours, lng: float, fields: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """``covariates.diel_phase(from_hours(t), lng)`` for each ``t``."""
+    f = utc_fields(hours) if fields is None else fields
+    return (_minutes_of_day(f) + 4.0 * lng) % 1440.0 / 1440.0
+
+
+def lunar_phase(hours, fields: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """``covariates.lunar_phase(from_hours(t))["phase"]`` for each ``t``."""
+    f = utc_fields(hours) if fields is None else fields
+    return (julian_day(f) - _NEW_MOON_EPOCH_JD) % _SYNODIC_MONTH / _SYNODIC_MONTH
+
+
+def season_phase(hours, fields: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """``design.season_phase_hours(t)`` for each ``t`` (leap years use 366 days)."""
+    f = utc_fields(hours) if fields is None else fields
+    year = f["year"]
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_year = np.where(leap, 366.0, 365.0)
+    elapsed = (f["us"] - f["year_start_us"]) / 1e6 / 86400.0
+    return (elapsed / days_in_year) % 1.0
+
+
+def isoformat(hours) -> List[str]:
+    """``from_hours(t).isoformat()`` for each ``t`` (microseconds only when non-zero)."""
+    us = epoch_microseconds(hours)
+    text = np.datetime_as_string(us.astype("datetime64[us]"), unit="us").tolist()
+    whole = (us % _US_PER_SECOND == 0).tolist()
+    return [s[:-7] + "+00:00" if w else s + "+00:00" for s, w in zip(text, whole)]
+
+
+def solar_position(hours, lat: float, lng: float) -> Dict[str, np.ndarray]:
+    """``covariates.solar_position`` for each ``t`` (NOAA equations, arrays)."""
+    f = utc_fields(hours)
+    jc = (julian_day(f) - 2451545.0) / 36525.0
+
+    geom_mean_long = (280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360.0
+    geom_mean_anom = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+    eccent = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+    m = np.radians(geom_mean_anom)
+    sun_eq_ctr = (
+        np.sin(m) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + np.sin(2 * m) * (0.019993 - 0.000101 * jc)
+        + np.sin(3 * m) * 0.000289
+    )
+    sun_app_long = geom_mean_long + sun_eq_ctr - 0.00569 - 0.00478 * np.sin(np.radians(125.04 - 1934.136 * jc))
+    mean_obliq = 23.0 + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0) / 60.0
+    obliq_corr = mean_obliq + 0.00256 * np.cos(np.radians(125.04 - 1934.136 * jc))
+    decl = np.arcsin(np.sin(np.radians(obliq_corr)) * np.sin(np.radians(sun_app_long)))
+
+    var_y = np.tan(np.radians(obliq_corr / 2.0)) ** 2
+    gl = np.radians(geom_mean_long)
+    eot = 4.0 * np.degrees(
+        var_y * np.sin(2 * gl)
+        - 2 * eccent * np.sin(m)
+        + 4 * eccent * var_y * np.sin(m) * np.cos(2 * gl)
+        - 0.5 * var_y * var_y * np.sin(4 * gl)
+        - 1.25 * eccent * eccent * np.sin(2 * m)
+    )
+
+    hour_angle = (_minutes_of_day(f) + eot + 4.0 * lng) % 1440.0 / 4.0 - 180.0
+    lat_r = np.radians(lat)
+    ha_r = np.radians(hour_angle)
+    cos_zenith = np.clip(np.sin(lat_r) * np.sin(decl) + np.cos(lat_r) * np.cos(decl) * np.cos(ha_r), -1.0, 1.0)
+    zenith = np.arccos(cos_zenith)
+    elevation = 90.0 - np.degrees(zenith)
+
+    sin_zenith = np.sin(zenith)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_az = np.clip((np.sin(lat_r) * cos_zenith - np.sin(decl)) / (np.cos(lat_r) * sin_zenith), -1.0, 1.0)
+    az = np.degrees(np.arccos(cos_az))
+    azimuth = np.where(hour_angle > 0, (180.0 + az) % 360.0, (540.0 - az) % 360.0)
+    azimuth = np.where(sin_zenith < 1e-9, 0.0, azimuth)
+    return {
+        "solar_elevation_deg": elevation,
+        "solar_azimuth_deg": azimuth,
+        "is_daytime": elevation > -0.833,
+        "hour_angle_deg": hour_angle,
+    }
@@ -21,7 +21,7 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
-from src.aws_backend import covariates
+from . import covariate_arrays
 from .ais_noise import detectability_factor
 from .effort import exposure_for_bins, uptime_binds, FALLBACK_CONTINUOUS
 from .timeutil import from_hours, to_hours
@@ -146,6 +146,10 @@ def build_design(
     log_exposure, diel, lunar, season`` and ``tide`` (NaN when no tidal series is
     supplied). Rows with non-positive exposure are dropped.
 
+    Built column-wise: the covariate phases come from ``modeling.covariate_arrays``,
+    which reproduces the per-datetime ``src/aws_backend/covariates`` values
+    exactly, so the frame matches a row-by-row build bit for bit.
+
     TA3 effort: when ``noise_by_station`` (a per-station AIS proximity-noise index)
     and ``ais_kappa > 0`` are supplied, the per-bin exposure is multiplied by the
     detectability factor ``D_ais`` (vessel-noise masking is an effort/exposure
@@ -163,7 +167,7 @@ def build_design(
     """
     uptime_by_station = uptime_by_station or {}
     station_coords = station_coords or {}
-    rows: List[dict] = []
+    frames: List[pd.DataFrame] = []
     effort_assumed = True  # flips false as soon as any station has real uptime
 
     for station, records in acoustic_by_station.items():
@@ -215,28 +219,30 @@ def build_design(
                 vals = np.interp(centers, ct, cv, left=math.nan, right=math.nan)
                 lin_cols[cov_name] = vals
 
-        for i, (center, y, exposure) in enumerate(zip(centers, counts, exposure_bins)):
-            exposure = float(exposure)
-            if exposure <= min_exposure:
-                continue
-            dt = from_hours(center)
-            row = {
-                "station": station,
-                "t": float(center),
-                "bin_start": from_hours(center - bin_hours / 2.0).isoformat(),
-                "y": float(y),
-                "exposure": exposure,
-                "log_exposure": float(np.log(exposure)),
-                "diel": float(covariates.diel_phase(dt, lng)),
-                "lunar": float(covariates.lunar_phase(dt)["phase"]),
-                "season": float(season_phase_hours(center)),
-                "tide": float(tide_phase.phase(center)) if tide_phase is not None else math.nan,
-            }
-            for cov_name, vals in lin_cols.items():
-                row[cov_name] = float(vals[i])
-            rows.append(row)
-
-    df = pd.DataFrame(rows)
+        exposure_bins = np.asarray(exposure_bins, dtype=float)
+        keep = ~(exposure_bins <= min_exposure)
+        if not keep.any():
+            continue
+        kept = centers[keep]
+        exposure = exposure_bins[keep]
+        fields = covariate_arrays.utc_fields(kept)
+        columns = {
+            "station": station,
+            "t": kept,
+            "bin_start": covariate_arrays.isoformat(kept - bin_hours / 2.0),
+            "y": counts[keep].astype(float),
+            "exposure": exposure,
+            "log_exposure": np.log(exposure),
+            "diel": covariate_arrays.diel_phase(kept, lng, fields),
+            "lunar": covariate_arrays.lunar_phase(kept, fields),
+            "season": covariate_arrays.season_phase(kept, fields),
+            "tide": tide_phase.phases(kept) if tide_phase is not None else np.full(kept.shape, math.nan),
+        }
+        for cov_name, vals in lin_cols.items():
+            columns[cov_name] = vals[keep]
+        frames.append(pd.DataFrame(columns))
+
+    df = pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
     df.attrs["bin_hours"] = bin_hours
     df.attrs["effort_assumed_continuous"] = effort_assumed
     df.attrs["confirmed_only"] = confirmed_only
@@ -216,12 +216,13 @@ def _estimate_nb_alpha(y: np.ndarray, mu: np.ndarray) -> float:
     return max(alpha, _MIN_ALPHA)
 
 
-def _fit_result(X: pd.DataFrame, y: np.ndarray, offset: np.ndarray, sm_family, groups):
+def _fit_result(X: pd.DataFrame, y: np.ndarray, offset: np.ndarray, sm_family, groups, start_params=None):
     """Fit an sm.GLM with cluster-robust SEs when there are multiple stations."""
     model = sm.GLM(y, X, family=sm_family, offset=offset)
+    kwargs = {} if start_params is None else {"start_params": start_params}
     if groups is not None and len(set(groups)) > 1:
-        return model.fit(cov_type="cluster", cov_kwds={"groups": groups})
-    return model.fit()
+        return model.fit(cov_type="cluster", cov_kwds={"groups": groups}, **kwargs)
+    return model.fit(**kwargs)
 
 
 def _penalty_vector(
@@ -279,7 +280,9 @@ def _penalty_vector(
     return pen if any_nonzero else None
 
 
-def _fit_regularized_result(X: pd.DataFrame, y: np.ndarray, offset: np.ndarray, sm_family, penalty_vec):
+def _fit_regularized_result(
+    X: pd.DataFrame, y: np.ndarray, offset: np.ndarray, sm_family, penalty_vec, start_params=None,
+):
     """Pure-L2 (ridge) fit = the smoothness penalty in the Fourier basis.
 
     ``L1_wt=0.0`` makes elastic-net a pure ridge; ``alpha`` is the per-coefficient
@@ -287,7 +290,8 @@ def _fit_regularized_result(X: pd.DataFrame, y: np.ndarray, offset: np.ndarray,
     suppress the delta-method CI bands (``FittedModel.penalized``).
     """
     model = sm.GLM(y, X, family=sm_family, offset=offset)
-    return model.fit_regularized(alpha=penalty_vec, L1_wt=0.0)
+    kwargs = {} if start_params is None else {"start_params": start_params}
+    return model.fit_regularized(alpha=penalty_vec, L1_wt=0.0, **kwargs)
 
 
 def fit_glm(
@@ -301,6 +305,7 @@ def fit_glm(
     ridge_lambda: float = 0.0,
     pooling_tau: float = 0.0,
     linear_covariates: Sequence[str] = (),
+    start_params: Optional[Dict[str, float]] = None,
 ) -> FittedModel:
     """Fit the joint GLM (``family`` in {"poisson", "negbin"}) and reconstruct kernels.
 
@@ -327,6 +332,11 @@ def fit_glm(
       Fourier kernel, only when present and finite. The empty default is a strict
       no-op. The covariate feed is operator-gated; for the B.2 season-orthogonal
       role the residualization is applied per fold upstream (``make_fit_predict``).
+
+    ``start_params`` warm-starts every solve from a previous fit's coefficients
+    (``{column: value}``; columns it lacks start at 0). It moves the optimizer's
+    starting point only, so results agree with a cold fit to solver tolerance;
+    ``None`` (default) is the historical cold start.
     """
     family = (family or "poisson").lower()
     if family not in ("poisson", "negbin"):
@@ -402,15 +412,18 @@ def fit_glm(
         station_cols=station_cols if partial_pool else None,
     )
     penalized = penalty_vec is not None
+    start = None
+    if start_params:
+        start = np.array([float(start_params.get(col, 0.0)) for col in X.columns])
 
     # NB2 alpha seed + Pearson-phi source. The all-station partial-pool design is
     # collinear (const + every station dummy), so it cannot be fit unpenalized --
     # seed from the same penalized design in that case; otherwise the historical
     # unpenalized Poisson seed.
     if partial_pool:
-        poisson_result = _fit_regularized_result(X, y, offset, sm.families.Poisson(), penalty_vec)
+        poisson_result = _fit_regularized_result(X, y, offset, sm.families.Poisson(), penalty_vec, start)
     else:
-        poisson_result = _fit_result(X, y, offset, sm.families.Poisson(), groups)
+        poisson_result = _fit_result(X, y, offset, sm.families.Poisson(), groups, start)
 
     dispersion_alpha: Optional[float] = None
     if family == "negbin":
@@ -418,12 +431,12 @@ def fit_glm(
         dispersion_alpha = _estimate_nb_alpha(y, mu_p)
         nb_family = sm.families.NegativeBinomial(alpha=dispersion_alpha)
         if penalized:
-            result = _fit_regularized_result(X, y, offset, nb_family, penalty_vec)
+            result = _fit_regularized_result(X, y, offset, nb_family, penalty_vec, start)
         else:
-            result = _fit_result(X, y, offset, nb_family, groups)
+            result = _fit_result(X, y, offset, nb_family, groups, start)
     else:
         if penalized:
-            result = _fit_regularized_result(X, y, offset, sm.families.Poisson(), penalty_vec)
+            result = _fit_regularized_result(X, y, offset, sm.families.Poisson(), penalty_vec, start)
         else:
             result = poisson_result
 
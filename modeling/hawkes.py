@@ -0,0 +1,248 @@
+"""Exponential-kernel Hawkes processes: vectorized likelihood, fitting, rescaling.
+
+The model (``M`` marks, shared decay ``beta``) is
+
+    lambda_m(t) = mu_m + beta * sum_n alpha[m, n] * A_n(t),
+    A_n(t) = sum_{t_i^n < t} exp(-beta (t - t_i^n)),
+
+so ``alpha[m, n]`` is the expected number of mark-``m`` offspring of one
+mark-``n`` event and the spectral radius of ``alpha`` is the branching ratio
+(``< 1`` is sub-critical). One mark is the single-station diagnostic in
+``fit_kernels``; one mark per station is cross-station excitation.
+
+The Ogata recursion ``A_k = r_k (A_{k-1} + 1[mark_{k-1}])`` with
+``r_k = exp(-beta dt_k)`` is a first-order linear recurrence, evaluated here by
+a log-depth doubling scan (:func:`linear_scan`) instead of a per-event Python
+loop: only products of decays in ``(0, 1]`` and sums of non-negative terms, so
+it never overflows. The same scan carries ``B_k = sum (t_k - t_i) exp(...)``
+for the analytic ``d/d beta``, giving an O(n) log-likelihood with its exact
+gradient for L-BFGS-B.
+
+Fitting multistarts L-BFGS-B over ``beta`` (:data:`BETA_STARTS`);
+:func:`fit_hawkes_many` fits many stations' streams, :func:`fit_hawkes` with
+``marks`` fits the cross-station model on the merged stream.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Multistart over the decay (per hour): detector chatter (minutes) through
+# encounter-scale (hours) excitation.
+BETA_STARTS = (0.5, 1.0, 4.0, 12.0, 48.0)
+MIN_EVENTS = 20
+_ALPHA_MAX = 0.999
+
+
+@dataclass(frozen=True)
+class HawkesFit:
+    """MLE of an ``M``-mark exponential Hawkes process on ``[start, end]`` (hours)."""
+
+    mu: np.ndarray      # (M,) background rate per hour
+    alpha: np.ndarray   # (M, M) branching matrix, row = excited mark
+    beta: float         # decay per hour
+    neg_ll: float
+    n_events: int
+    start: float
+    end: float
+
+    @property
+    def n_marks(self) -> int:
+        return int(self.mu.size)
+
+    @property
+    def branching_ratio(self) -> float:
+        """Spectral radius of ``alpha`` (``alpha`` itself for one mark)."""
+        if self.alpha.size == 1:
+            return float(self.alpha[0, 0])
+        return float(np.max(np.abs(np.linalg.eigvals(self.alpha))))
+
+
+def linear_scan(decay: np.ndarray, drive: np.ndarray) -> np.ndarray:
+    """``x_k = decay_k * x_{k-1} + drive_k`` (``x_{-1} = 0``) in ``log2(n)`` vector steps.
+
+    ``decay`` is ``(n,)``; ``drive`` is ``(n,)`` or ``(n, M)`` (columns share
+    the decay). A zero decay restarts the recurrence at that element.
+    """
+    a = np.asarray(decay, dtype=float).copy()
+    b = np.asarray(drive, dtype=float).copy()
+    col = (slice(None),) + (None,) * (b.ndim - 1)
+    shift = 1
+    n = a.shape[0]
+    while shift < n:
+        b[shift:] = a[shift:][col] * b[:-shift] + b[shift:]
+        a[shift:] = a[shift:] * a[:-shift]
+        shift *= 2
+    return b
+
+
+@dataclass(frozen=True)
+class _Events:
+    """Sorted events of one window with the static scan inputs."""
+
+    t: np.ndarray        # (n,) hours since the first event
+    marks: np.ndarray    # (n,) int mark
+    onehot: np.ndarray   # (n, M) mark indicator
+    dt: np.ndarray       # (n,) gap to the previous event (0 for the first)
+    to_end: np.ndarray   # (n,) last event - t
+    counts: np.ndarray   # (M,) events per mark
+    span: float
+    start: float
+
+    @classmethod
+    def build(cls, times: np.ndarray, marks: np.ndarray, n_marks: int) -> "_Events":
+        order = np.argsort(times, kind="stable")
+        start = float(times[order[0]])
+        t = times[order] - start
+        marks = marks[order].astype(np.int64)
+        onehot = np.zeros((t.size, n_marks))
+        onehot[np.arange(t.size), marks] = 1.0
+        span = float(t[-1])
+        return cls(t, marks, onehot, np.diff(t, prepend=0.0), span - t,
+                   np.bincount(marks, minlength=n_marks), span, start)
+
+    @property
+    def n_marks(self) -> int:
+        return self.onehot.shape[1]
+
+
+def _unpack(x: np.ndarray, M: int) -> Tuple[np.ndarray, np.ndarray, float]:
+    return x[:M], x[M: M + M * M].reshape(M, M), float(x[-1])
+
+
+def _excitation(ev: _Events, beta: float, with_b: bool):
+    """``A`` (and ``B``) at every event, each ``(n, M)``, plus the decays ``r``."""
+    r = np.exp(-beta * ev.dt)
+    r[0] = 0.0
+    prev = np.zeros_like(ev.onehot)
+    prev[1:] = ev.onehot[:-1]
+    A = linear_scan(r, r[:, None] * prev)
+    B = linear_scan(r, ev.dt[:, None] * A) if with_b else None
+    return r, A, B
+
+
+def _neg_ll_and_grad(x: np.ndarray, ev: _Events) -> Tuple[float, np.ndarray]:
+    """Negative log-likelihood and its exact gradient in ``x = (mu, alpha.ravel(), beta)``."""
+    M = ev.n_marks
+    mu, alpha, beta = _unpack(x, M)
+    _, A, B = _excitation(ev, beta, with_b=True)
+    w = alpha[ev.marks]                                # (n, M): alpha[m_k, :]
+    lam = mu[ev.marks] + beta * np.einsum("ij,ij->i", w, A)
+    if np.any(lam <= 0):
+        return np.inf, np.zeros_like(x)
+    inv = 1.0 / lam
+
+    decay_to_end = np.exp(-beta * ev.to_end)
+    G = np.bincount(ev.marks, weights=1.0 - decay_to_end, minlength=M)
+    H = np.bincount(ev.marks, weights=ev.to_end * decay_to_end, minlength=M)
+    col_alpha = alpha.sum(axis=0)                      # total offspring per parent mark
+    neg_ll = float(mu.sum() * ev.span + col_alpha @ G - np.sum(np.log(lam)))
+
+    g_mu = ev.span - np.bincount(ev.marks, weights=inv, minlength=M)
+    # d/d alpha[m, n] = sum_{k: m_k = m} beta A_kn / lam_k - G[n]
+    g_alpha = G[None, :] - ev.onehot.T @ ((beta * inv)[:, None] * A)
+    g_beta = col_alpha @ H - np.sum(np.einsum("ij,ij->i", w, A - beta * B) * inv)
+    return neg_ll, np.concatenate([g_mu, g_alpha.ravel(), [g_beta]])
+
+
+def _fit_events(ev: _Events, beta_starts: Sequence[float]) -> Optional[HawkesFit]:
+    from scipy.optimize import minimize
+
+    M = ev.n_marks
+    mu0 = np.maximum(ev.counts / ev.span * 0.5, 1e-6)
+    bounds = [(1e-9, None)] * M + [(1e-6, _ALPHA_MAX)] * (M * M) + [(1e-6, None)]
+
+    def objective(x):
+        f, g = _neg_ll_and_grad(x, ev)
+        return (f, g) if np.isfinite(f) else (1e12, np.zeros_like(x))
+
+    best = None
+    for beta0 in beta_starts:
+        x0 = np.concatenate([mu0, np.full(M * M, 0.5 / M), [float(beta0)]])
+        try:
+            res = minimize(objective, x0, jac=True, method="L-BFGS-B", bounds=bounds)
+        except Exception:  # noqa: BLE001
+            continue
+        if np.isfinite(res.fun) and (best is None or res.fun < best.fun):
+            best = res
+    if best is None:
+        return None
+    mu, alpha, beta = _unpack(best.x, M)
+    return HawkesFit(mu=mu.copy(), alpha=alpha.copy(), beta=beta, neg_ll=float(best.fun),
+                     n_events=int(ev.t.size), start=ev.start, end=ev.start + ev.span)
+
+
+def _fittable(times: np.ndarray, min_events: int) -> bool:
+    return times.size >= min_events and float(times.max() - times.min()) > 0
+
+
+def fit_hawkes(
+    times: np.ndarray,
+    marks: Optional[np.ndarray] = None,
+    n_marks: Optional[int] = None,
+    beta_starts: Sequence[float] = BETA_STARTS,
+    min_events: int = MIN_EVENTS,
+) -> Optional[HawkesFit]:
+    """MLE of a (multi-mark) exponential Hawkes process, or ``None`` if too few events.
+
+    ``marks`` are ints in ``[0, n_marks)`` (default: one mark). The observation
+    window runs from the first to the last event.
+    """
+    times = np.asarray(times, dtype=float)
+    marks = np.zeros(times.size, dtype=np.int64) if marks is None else np.asarray(marks, dtype=np.int64)
+    if n_marks is None:
+        n_marks = int(marks.max()) + 1 if marks.size else 1
+    if not _fittable(times, min_events):
+        return None
+    return _fit_events(_Events.build(times, marks, int(n_marks)), beta_starts)
+
+
+def fit_hawkes_many(
+    event_sets: Sequence[np.ndarray],
+    beta_starts: Sequence[float] = BETA_STARTS,
+    min_events: int = MIN_EVENTS,
+) -> List[Optional[HawkesFit]]:
+    """Independent single-mark fits for many streams (``None`` where too few events).
+
+    Each stream is optimized on its own: one L-BFGS-B over all streams'
+    (block-separable) parameters measured slower, as the joint quasi-Newton
+    needs many more iterations than the per-stream ones combined.
+    """
+    return [fit_hawkes(ev, beta_starts=beta_starts, min_events=min_events) for ev in event_sets]
+
+
+def rescaled_intervals(
+    times: np.ndarray,
+    fit: HawkesFit,
+    marks: Optional[np.ndarray] = None,
+) -> List[np.ndarray]:
+    """Compensator increments between consecutive same-mark events, per mark.
+
+    ``Exp(1)`` under a correct model (time-rescaling theorem). Each increment
+    is a sum of non-negative per-gap terms
+    ``mu_m dt_k + sum_n alpha[m, n] (A_{k-1,n} + 1[mark_{k-1} = n]) (1 - r_k)``,
+    so short intervals are not lost to cancellation. Only positive increments
+    are kept.
+    """
+    times = np.asarray(times, dtype=float)
+    marks = np.zeros(times.size, dtype=np.int64) if marks is None else np.asarray(marks, dtype=np.int64)
+    M = fit.n_marks
+    if times.size < 2:
+        return [np.asarray([], dtype=float) for _ in range(M)]
+    ev = _Events.build(times, marks, M)
+    r, A, _ = _excitation(ev, fit.beta, with_b=False)
+    carried = A[:-1] + ev.onehot[:-1]                  # excitation entering gap k
+    gap = np.zeros((ev.t.size, M))
+    gap[1:] = fit.mu[None, :] * ev.dt[1:, None] + (carried * (1.0 - r[1:, None])) @ fit.alpha.T
+    out = []
+    for m in range(M):
+        pos = np.flatnonzero(ev.marks == m)
+        if pos.size < 2:
+            out.append(np.asarray([], dtype=float))
+            continue
+        taus = np.add.reduceat(gap[: pos[-1] + 1, m], pos[:-1] + 1)
+        out.append(taus[taus > 0])
+    return out
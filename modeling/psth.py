@@ -17,7 +17,8 @@ from typing import Dict, Optional
 
 import numpy as np
 
-from .validation.null_tests import modulation_depth, permutation_null
+from .resampling import DEFAULT_MAX_ELEMENTS, binned_sums, bootstrap_indices, permutation_indices
+from .validation.null_tests import modulation_depth, modulation_depth_rows, null_summary
 
 _EPS = 1e-9
 
@@ -29,11 +30,13 @@ def psth(
     n_bins: int = 24,
     n_boot: int = 1000,
     rng: Optional[np.random.Generator] = None,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
 ) -> Dict[str, object]:
     """Effort-normalized rate vs phase with bootstrap confidence bands.
 
     ``rate[b] = sum(y in bin b) / sum(exposure in bin b)``. Confidence bands come
-    from resampling the rows with replacement ``n_boot`` times.
+    from resampling the rows with replacement ``n_boot`` times, drawn and binned
+    in chunks of at most ``max_elements`` indices (see ``modeling.resampling``).
     """
     rng = rng or np.random.default_rng()
     phase = np.asarray(phase, dtype=float) % 1.0
@@ -44,19 +47,15 @@ def psth(
     centers = 0.5 * (edges[:-1] + edges[1:])
     idx = np.clip(np.digitize(phase, edges[1:-1]), 0, n_bins - 1)
 
-    def _rates(sel: np.ndarray) -> np.ndarray:
-        yb = np.bincount(idx[sel], weights=y[sel], minlength=n_bins)
-        eb = np.bincount(idx[sel], weights=exposure[sel], minlength=n_bins)
-        return yb / np.clip(eb, _EPS, None)
-
-    all_rows = np.arange(phase.size)
-    rate = _rates(all_rows)
+    yb = np.bincount(idx, weights=y, minlength=n_bins)
+    eb = np.bincount(idx, weights=exposure, minlength=n_bins)
+    rate = yb / np.clip(eb, _EPS, None)
     counts = np.bincount(idx, minlength=n_bins)
 
     boot = np.empty((n_boot, n_bins))
-    for b in range(n_boot):
-        sample = rng.integers(0, phase.size, size=phase.size)
-        boot[b] = _rates(sample)
+    for lo, sample in bootstrap_indices(rng, phase.size, n_boot, max_elements):
+        yb, eb = binned_sums(idx[sample], (y[sample], exposure[sample]), n_bins)
+        boot[lo:lo + sample.shape[0]] = yb / np.clip(eb, _EPS, None)
     ci_lo = np.percentile(boot, 2.5, axis=0)
     ci_hi = np.percentile(boot, 97.5, axis=0)
 
@@ -78,6 +77,7 @@ def psth_with_null(
     n_boot: int = 500,
     n_shuffles: int = 500,
     rng: Optional[np.random.Generator] = None,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
 ) -> Dict[str, object]:
     """PSTH plus a phase-shuffle null on its modulation depth (Level 1 gate).
 
@@ -86,20 +86,20 @@ def psth_with_null(
     A real tuning curve must beat this null.
     """
     rng = rng or np.random.default_rng()
-    result = psth(phase, y, exposure, n_bins=n_bins, n_boot=n_boot, rng=rng)
+    result = psth(phase, y, exposure, n_bins=n_bins, n_boot=n_boot, rng=rng, max_elements=max_elements)
     observed = result["modulation"]
 
     phase = np.asarray(phase, dtype=float) % 1.0
     y = np.asarray(y, dtype=float)
     exposure = np.clip(np.asarray(exposure, dtype=float), _EPS, None)
     edges = np.linspace(0.0, 1.0, n_bins + 1)
+    idx = np.clip(np.digitize(phase, edges[1:-1]), 0, n_bins - 1)
 
-    def sample_null(r: np.random.Generator) -> float:
-        shuffled = r.permutation(phase)
-        idx = np.clip(np.digitize(shuffled, edges[1:-1]), 0, n_bins - 1)
-        yb = np.bincount(idx, weights=y, minlength=n_bins)
-        eb = np.bincount(idx, weights=exposure, minlength=n_bins)
-        return modulation_depth(yb / np.clip(eb, _EPS, None))
+    # Shuffling the phases is shuffling their bin labels; y and exposure stay put.
+    null = np.empty(n_shuffles)
+    for lo, perm in permutation_indices(rng, phase.size, n_shuffles, max_elements):
+        yb, eb = binned_sums(idx[perm], (y, exposure), n_bins)
+        null[lo:lo + perm.shape[0]] = modulation_depth_rows(yb / np.clip(eb, _EPS, None))
 
-    result["null"] = permutation_null(observed, sample_null, n_shuffles=n_shuffles, rng=rng)
+    result["null"] = null_summary(observed, null)
     return result
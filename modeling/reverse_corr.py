@@ -18,6 +18,8 @@ from typing import Dict, Optional
 
 import numpy as np
 
+from .resampling import DEFAULT_MAX_ELEMENTS, chunk_bounds
+
 
 def detection_triggered_average(
     event_times: np.ndarray,
@@ -47,16 +49,28 @@ def shuffled_baseline(
     lags: np.ndarray,
     n_shuffles: int = 200,
     rng: Optional[np.random.Generator] = None,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
 ) -> Dict[str, np.ndarray]:
-    """Mean/std STA under random detection times (the null), per lag."""
+    """Mean/std STA under random detection times (the null), per lag.
+
+    The fake detection times are drawn a ``(shuffles, n_events)`` block at a
+    time (see ``modeling.resampling``), in the same order as one draw per
+    shuffle.
+    """
     rng = rng or np.random.default_rng()
     cov_times = np.asarray(cov_times, dtype=float)
+    cov_values = np.asarray(cov_values, dtype=float)
+    lags = np.asarray(lags, dtype=float)
     t_lo, t_hi = cov_times.min(), cov_times.max()
 
     draws = np.empty((n_shuffles, lags.size))
-    for s in range(n_shuffles):
-        fake = rng.uniform(t_lo, t_hi, size=n_events)
-        draws[s] = detection_triggered_average(fake, cov_times, cov_values, lags)
+    if n_events == 0:
+        draws[:] = np.nan
+        return {"mean": draws.mean(axis=0), "std": draws.std(axis=0)}
+    for lo, hi in chunk_bounds(n_shuffles, n_events, max_elements):
+        fake = rng.uniform(t_lo, t_hi, size=(hi - lo, n_events))
+        for i, lag in enumerate(lags):
+            draws[lo:hi, i] = np.interp(fake - lag, cov_times, cov_values).mean(axis=1)
     return {"mean": draws.mean(axis=0), "std": draws.std(axis=0)}
 
 
@@ -53,7 +53,7 @@ from modeling.design import build_design, event_times_hours, phase_coverage
 from modeling.psth import psth
 from modeling.tide_phase import HarmonicTidalPhase, TidalPhase
 from src.aws_backend.config import settings
-from src.aws_backend.timeseries import MemoryTimeSeriesStore, build_timeseries_store
+from src.aws_backend.timeseries import ColumnarTimeSeriesStore, build_timeseries_store
 
 from .common import ORCAHELLO_CACHE, STATION_COORDS
 
@@ -118,7 +118,7 @@ def _build_multistation_store():
     if settings.storage_backend.lower() != "aws":
         return None, "needs ORCAST_STORAGE_BACKEND=aws + the raw-payload bucket to read haro_strait + currents"
 
-    mem = MemoryTimeSeriesStore()
+    mem = ColumnarTimeSeriesStore()
     haro = src.get_series(ACOUSTIC, "haro_strait", _WIDE0, _WIDE1)
     mem.put_series(ACOUSTIC, "haro_strait", haro)
     for station, recs in _cached_acoustic_by_station().items():
@@ -29,7 +29,7 @@ from typing import Dict, List
 
 import modeling.fit_kernels as fk
 from src.aws_backend.config import settings
-from src.aws_backend.timeseries import MemoryTimeSeriesStore, build_timeseries_store
+from src.aws_backend.timeseries import ColumnarTimeSeriesStore, build_timeseries_store
 
 from .common import (
     GATE_FAIL,
@@ -77,7 +77,7 @@ def run() -> GateResult:
             reason="Needs ORCAST_STORAGE_BACKEND=aws + the raw-payload bucket to read haro_strait + currents.",
         )
 
-    mem = MemoryTimeSeriesStore()
+    mem = ColumnarTimeSeriesStore()
     # Production single-station stream.
     haro = src.get_series(ACOUSTIC, "haro_strait", _WIDE0, _WIDE1)
     mem.put_series(ACOUSTIC, "haro_strait", haro)
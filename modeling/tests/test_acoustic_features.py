@@ -0,0 +1,82 @@
+"""Shared-frame BAM feature extraction agrees with the per-window definition."""
+
+import numpy as np
+import scipy.io.wavfile as wavfile
+
+from modeling.acoustic.features import (
+    FFT,
+    HOP,
+    N_FEATURES,
+    SR,
+    WavReader,
+    _features_from_reader,
+    features_at_starts,
+    read_wav_mono,
+    window_feature,
+    window_features,
+    windows_from_wav,
+)
+
+
+def _audio(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SR)) / SR
+    return 0.05 * rng.normal(size=t.size) + 0.2 * np.sin(2 * np.pi * (3000 + 1500 * np.sin(t)) * t) * (np.sin(3 * t) > 0)
+
+
+def test_window_features_match_window_feature_for_any_starts():
+    x = _audio(12.0)
+    win = 3 * SR
+    # Unaligned 1.5 s tiling, two windows sharing a frame grid, and a duplicate.
+    starts = np.array([0, 72000, 144000, 216000, 100 * HOP, 200 * HOP, 72000, 9 * SR - 1])
+    got = window_features(x, SR, starts, win)
+    assert got.shape == (starts.size, N_FEATURES)
+    ref = np.asarray([window_feature(x[a:a + win], SR) for a in starts])
+    np.testing.assert_allclose(got, ref, rtol=1e-10, atol=1e-12)
+
+
+def test_wav_entry_points_keep_starts_and_snap_within_a_hop(tmp_path):
+    x = _audio(10.0, seed=1)
+    path = tmp_path / "clip.wav"
+    wavfile.write(path, SR, (x / np.abs(x).max() * 30000).astype(np.int16))
+
+    feats, starts = windows_from_wav(str(path))
+    assert np.array_equal(starts, np.arange(5) * 1.5) and feats.shape == (5, N_FEATURES)
+    snapped, snapped_starts = windows_from_wav(str(path), snap_to_frames=True)
+    assert np.array_equal(snapped_starts, starts)
+    # Start 0 is already on the frame grid; elsewhere a <= HOP/2 sample shift
+    # moves the silhouette only slightly.
+    np.testing.assert_allclose(snapped[0], feats[0], rtol=1e-10, atol=1e-12)
+    assert np.median(np.abs(snapped - feats) / (np.abs(feats) + 1e-6)) < 0.01
+
+    kept_feats, kept = features_at_starts(str(path), [-1.0, 0.5, 6.0, 7.5])
+    assert np.array_equal(kept, [0.5, 6.0])
+    np.testing.assert_allclose(kept_feats[1], feats[4], rtol=1e-10, atol=1e-12)
+
+
+def test_wav_reader_downmixes_lazily_and_streams_the_same_features(tmp_path):
+    x = _audio(20.0, seed=2)
+    stereo = np.stack([x, 0.5 * x[::-1]], axis=1)
+    path = tmp_path / "stereo.wav"
+    wavfile.write(path, SR, (stereo / np.abs(stereo).max() * 30000).astype(np.int16))
+    _, ref = read_wav_mono(str(path))
+
+    reader = WavReader(str(path))
+    assert len(reader) == ref.size and reader.sr == SR
+    part = reader.read(1000, 5000)
+    assert part.dtype == np.float32 and part.size == 4000
+    np.testing.assert_allclose(part, ref[1000:5000], rtol=1e-6, atol=1e-7)
+
+    # Blocks overlap by FFT - HOP, so each frame of the HOP grid is whole in one block.
+    blocks = list(reader.blocks(10 * SR))
+    assert blocks[0][0] == 0 and all(a % HOP == 0 for a, _ in blocks)
+    for (a, blk), (b, _) in zip(blocks, blocks[1:]):
+        assert a + blk.size == b + FFT - HOP
+    assert blocks[-1][0] + blocks[-1][1].size == ref.size
+
+    # Grouped reads (2 s spans here) give the whole-file float64 features.
+    win = 3 * SR
+    starts = np.array([17 * SR, 0, 72000, 5 * SR + 7, 144000, 0])
+    got = _features_from_reader(reader, starts, win, block_s=2.0)
+    want = np.asarray([window_feature(ref[a:a + win], SR) for a in starts])
+    np.testing.assert_allclose(got, want, rtol=1e-4, atol=1e-6)
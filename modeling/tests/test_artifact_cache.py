@@ -0,0 +1,75 @@
+"""ArtifactCache: keys, JSON-exact round trips, LRU eviction, S3 tier."""
+
+import io
+import math
+import os
+
+import numpy as np
+
+from modeling.artifact_cache import ArtifactCache
+
+
+def test_memoize_hits_and_keys_on_params(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"b": np.float64(0.25), "a": [1, True, None, "x", math.nan]}
+
+    first = cache.memoize("stage", "snap_1", {"seed": 1}, compute)
+    second = cache.memoize("stage", "snap_1", {"seed": 1}, compute)
+    assert len(calls) == 1
+    assert list(second) == ["b", "a"] and second["b"] == 0.25 and math.isnan(second["a"][4])
+    assert second["a"][:4] == first["a"][:4]
+
+    cache.memoize("stage", "snap_1", {"seed": 2}, compute)
+    cache.memoize("stage", "snap_2", {"seed": 1}, compute)
+    assert len(calls) == 3
+    assert cache.summary()["stages"]["stage"] == {"hits": 1, "s3_hits": 0, "misses": 3, "uncacheable": 0}
+
+
+def test_values_that_do_not_round_trip_are_not_cached(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    for value in ({"n": np.int64(3)}, {"ok": np.bool_(True)}, {"pair": (1, 2)}, {1: "int key"}):
+        assert cache.memoize("stage", "snap", {"v": repr(value)}, lambda: value) is value
+    assert cache.summary()["uncacheable"] == 4
+    assert not list(tmp_path.glob("art_*.json"))
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = ArtifactCache(tmp_path, max_bytes=2500)
+    payload = "x" * 1000
+    cache.memoize("s", "snap", {"i": 0}, lambda: payload)
+    cache.memoize("s", "snap", {"i": 1}, lambda: payload)
+    oldest = tmp_path / f"{cache.key('s', 'snap', {'i': 0})}.json"
+    os.utime(oldest, (1, 1))
+    cache.memoize("s", "snap", {"i": 1}, lambda: payload)  # hit refreshes recency
+    cache.memoize("s", "snap", {"i": 2}, lambda: payload)
+    assert not oldest.exists()
+    assert len(list(tmp_path.glob("art_*.json"))) == 2
+
+
+class _FakeS3:
+    def __init__(self):
+        self.objects = {}
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(Key)
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+
+def test_s3_tier_serves_a_fresh_directory(tmp_path):
+    s3 = _FakeS3()
+    writer = ArtifactCache(tmp_path / "a", s3_bucket="models", s3_client=s3)
+    writer.memoize("s", "snap", {}, lambda: {"z": 1.5})
+    assert len(s3.objects) == 1
+
+    reader = ArtifactCache(tmp_path / "b", s3_bucket="models", s3_client=s3)
+    assert reader.memoize("s", "snap", {}, lambda: {"z": -1.0}) == {"z": 1.5}
+    assert reader.summary()["s3_hits"] == 1
+    assert (tmp_path / "b" / f"{reader.key('s', 'snap', {})}.json").exists()
@@ -106,6 +106,55 @@ def test_tidal_phase_in_unit_interval_and_value_interp():
     assert tide.value_at(t0 + 0.0) is not None
 
 
+def test_tidal_phases_match_scalar_phase_on_every_branch():
+    records, t0 = _current_records()
+    tide = TidalPhase.from_records(records)
+    times = np.concatenate([
+        t0 - 30.0 + np.arange(0, 30, 0.37),                        # before the first onset
+        t0 + np.arange(0, 90, 0.23),                               # between onsets
+        tide.onsets[-1] + np.arange(0, 40, 0.41),                  # after the last onset
+        tide.onsets[:3],                                           # exactly on onsets
+    ])
+    np.testing.assert_array_equal(tide.phases(times), [tide.phase(float(t)) for t in times])
+
+    clock = TidalPhase(onsets_hours=[], period_hours=12.42)
+    np.testing.assert_array_equal(clock.phases(times), [clock.phase(float(t)) for t in times])
+
+
+def test_harmonic_phases_match_model_and_table_lookups(tmp_path):
+    from modeling.tide_phase import HarmonicTidalPhase, TidePhaseTable
+
+    records, t0 = _current_records()
+    harmonic = HarmonicTidalPhase.from_records(records)
+    times = t0 + np.arange(-50.0, 200.0, 0.173)
+    np.testing.assert_array_equal(harmonic.phases(times), harmonic.model.phase(times))
+    assert harmonic.phase(times[5]) == harmonic.model.phase([times[5]])[0]
+
+    table = TidePhaseTable.load_or_build(harmonic, t0, t0 + 120.0, tmp_path)
+    looked_up = table.phases(times)
+    # Harmonic phase is linear in time, so interpolation only adds rounding
+    # (compare on the circle); outside the grid the exact model answers.
+    diff = np.abs(looked_up - harmonic.phases(times))
+    assert np.all(np.minimum(diff, 1.0 - diff) < 1e-9)
+    outside = (times < t0) | (times > t0 + 120.0)
+    np.testing.assert_array_equal(looked_up[outside], harmonic.phases(times[outside]))
+
+    again = TidePhaseTable.load_or_build(harmonic, t0, t0 + 120.0, tmp_path)
+    assert isinstance(again.values, np.memmap)
+    np.testing.assert_array_equal(again.phases(times), looked_up)
+
+
+def test_onset_table_error_is_bounded_by_the_grid_step(tmp_path):
+    from modeling.tide_phase import TidePhaseTable
+
+    records, t0 = _current_records()
+    tide = TidalPhase.from_records(records)
+    table = TidePhaseTable.load_or_build(tide, t0, t0 + 100.0, tmp_path, step_hours=0.05)
+    times = t0 + np.random.default_rng(1).uniform(0, 100.0, 2000)
+    diff = np.abs(table.phases(times) - tide.phases(times))
+    assert np.max(np.minimum(diff, 1.0 - diff)) <= 0.05 / np.min(np.diff(tide.onsets)) + 1e-9
+
+
 # --- design ------------------------------------------------------------------
 
 def _detections(station, start_iso, n, step_h=1.0, lat=48.5, lng=-123.0):
@@ -163,3 +212,84 @@ def test_event_times_hours_sorted_and_confirmed_filter():
     assert np.all(np.diff(all_ev) > 0)
     confirmed = event_times_hours(recs, confirmed_only=True)
     assert confirmed.size == 2
+
+
+def _row_by_row_design(acoustic_by_station, uptime_by_station, tide, bin_hours):
+    """The original per-bin dict build, kept as the reference for build_design."""
+    from modeling.design import _station_coords, season_phase_hours
+    from modeling.effort import exposure_for_bins, FALLBACK_CONTINUOUS
+    from src.aws_backend import covariates
+
+    rows = []
+    for station, records in acoustic_by_station.items():
+        events = event_times_hours(records)
+        _lat, lng = _station_coords(records, None)
+        lo = math.floor(events.min() / bin_hours) * bin_hours
+        hi = math.ceil(events.max() / bin_hours) * bin_hours + bin_hours
+        edges = np.arange(lo, hi + bin_hours, bin_hours)
+        counts, _ = np.histogram(events, bins=edges)
+        centers = edges[:-1] + bin_hours / 2.0
+        exposure_bins = exposure_for_bins(
+            uptime_by_station, station, centers,
+            bin_hours=bin_hours, fallback=FALLBACK_CONTINUOUS, detection_times=events,
+        )
+        for center, y, exposure in zip(centers, counts, exposure_bins):
+            if float(exposure) <= 1e-6:
+                continue
+            dt = from_hours(center)
+            rows.append({
+                "station": station,
+                "t": float(center),
+                "bin_start": from_hours(center - bin_hours / 2.0).isoformat(),
+                "y": float(y),
+                "exposure": float(exposure),
+                "log_exposure": float(np.log(float(exposure))),
+                "diel": float(covariates.diel_phase(dt, lng)),
+                "lunar": float(covariates.lunar_phase(dt)["phase"]),
+                "season": float(season_phase_hours(center)),
+                "tide": float(tide.phase(center)),
+            })
+    return pd.DataFrame(rows)
+
+
+def test_vectorized_build_design_matches_row_by_row_build():
+    rng = np.random.default_rng(9)
+    t0 = to_hours("2027-12-20T00:00:00+00:00")  # spans a year boundary into a leap year
+    acoustic = {}
+    for station, lng in (("haro_strait", -123.15), ("port_townsend", -122.76)):
+        times = np.sort(t0 + rng.uniform(0, 24 * 40, size=300))
+        acoustic[station] = [{"t": from_hours(t).isoformat(), "latitude": 48.1, "longitude": lng} for t in times]
+    uptime = {"haro_strait": [
+        {"t": from_hours(t0 - 1).isoformat(), "up": 1},
+        {"t": from_hours(t0 + 100).isoformat(), "up": 0},
+        {"t": from_hours(t0 + 300).isoformat(), "up": 1},
+    ]}
+    currents = [{"t": from_hours(t0 + h).isoformat(), "value": math.sin(2 * math.pi * h / 12.42)} for h in range(24 * 45)]
+    tide = TidalPhase.from_records(currents)
+
+    for bin_hours in (1.0, 0.35):
+        df = build_design(acoustic, uptime, tide_phase=tide, bin_hours=bin_hours)
+        pd.testing.assert_frame_equal(df, _row_by_row_design(acoustic, uptime, tide, bin_hours), check_exact=True)
+
+
+def test_covariate_arrays_match_scalar_covariates():
+    from modeling import covariate_arrays
+    from modeling.design import season_phase_hours
+    from src.aws_backend import covariates
+
+    rng = np.random.default_rng(3)
+    hours = np.concatenate([rng.uniform(0.0, 600_000.0, 500), np.arange(5) / 3.0 + 473_040.0])
+    diel = covariate_arrays.diel_phase(hours, -123.15)
+    lunar = covariate_arrays.lunar_phase(hours)
+    season = covariate_arrays.season_phase(hours)
+    stamps = covariate_arrays.isoformat(hours)
+    solar = covariate_arrays.solar_position(hours, 48.5, -123.15)
+    for i, h in enumerate(hours):
+        dt = from_hours(h)
+        assert diel[i] == covariates.diel_phase(dt, -123.15)
+        assert lunar[i] == covariates.lunar_phase(dt)["phase"]
+        assert season[i] == season_phase_hours(h)
+        assert stamps[i] == dt.isoformat()
+        expected = covariates.solar_position(dt, 48.5, -123.15)
+        assert math.isclose(solar["solar_elevation_deg"][i], expected["solar_elevation_deg"], abs_tol=1e-8)
+        assert bool(solar["is_daytime"][i]) == expected["is_daytime"]
@@ -161,3 +161,89 @@ def test_level0_detector_qc_activates_with_reviewed_labels():
     assert qc["status"] == "active"
     assert qc["truth_label"] == "live"
     assert qc["outcome_counts"]["confirmed"] == 1
+
+
+def test_incremental_run_fit_warm_starts_from_the_previous_fit(tmp_path, monkeypatch):
+    import modeling.fit_kernels as fk
+
+    monkeypatch.setattr(fk, "WARM_START_PATH", tmp_path / "warm_start.json")
+    store = _seed_store(seed=1)
+
+    # A dry run never writes the warm start.
+    dry = run_fit(store, bin_hours=1.0, write_outputs=False, incremental=True)
+    assert dry["incremental_fit"] == {"enabled": True, "warm_start": False}
+    assert not (tmp_path / "warm_start.json").exists()
+
+    # Writing runs save it; the report/coefficient writers are not under test.
+    for writer in ("_write_fit_plan", "_write_snapshot_manifest", "_write_coefficients",
+                   "_write_report", "_write_report_json", "_maybe_write_s3"):
+        monkeypatch.setattr(fk, writer, lambda *args, **kwargs: None)
+    first = run_fit(store, bin_hours=1.0, make_figures=False, incremental=True)
+    second = run_fit(store, bin_hours=1.0, make_figures=False, incremental=True)
+
+    assert first["incremental_fit"]["warm_start"] is False
+    assert second["incremental_fit"]["warm_start"] is True
+    # Same design, same optimum: the warm start agrees with the cold first fit
+    # to solver tolerance.
+    assert first["n_bins"] == second["n_bins"]
+    assert np.isclose(second["intercept"], first["intercept"], atol=1e-6)
+
+
+def test_artifact_cache_reuses_stage_results(tmp_path):
+    from modeling.artifact_cache import ArtifactCache
+
+    store = _seed_store(seed=2)
+    cold = ArtifactCache(tmp_path / "artifacts")
+    first = run_fit(store, bin_hours=1.0, write_outputs=False, artifact_cache=cold)
+    warm = ArtifactCache(tmp_path / "artifacts")
+    second = run_fit(store, bin_hours=1.0, write_outputs=False, artifact_cache=warm)
+
+    assert first["artifact_cache"]["hits"] == 0
+    assert first["artifact_cache"]["uncacheable"] == 0
+    assert second["artifact_cache"]["hits"] == first["artifact_cache"]["misses"] > 0
+    assert second["artifact_cache"]["misses"] == 0
+    for key in ("level0_detector_qc", "level1_psth", "level1_cross_station", "pit", "pit_poisson", "time_rescaling"):
+        assert second[key] == first[key]
+    # run_id varies with generated_at; the representation must not move.
+    assert second["repr_id"] == first["repr_id"]
+    assert second["confidence"] == first["confidence"]
+
+
+def test_cross_station_consistency_process_pool_matches_serial():
+    from modeling.design import build_design
+    from modeling.fit_kernels import _cross_station_consistency, read_streams, _wide_window
+
+    acoustic, uptime, _currents = read_streams(_seed_store(seed=3), *_wide_window())
+    df = build_design(acoustic, uptime, bin_hours=1.0)
+    serial = _cross_station_consistency(df, ["diel", "season"])
+    pooled = _cross_station_consistency(df, ["diel", "season"], workers=2)
+
+    assert serial["testable"] is True
+    split = serial["kernels"]["diel"]["split_half_reliability"]
+    assert split["mean"] is not None and set(split["per_station"]) == {"haro_strait", "lime_kiln"}
+    assert pooled == serial
+
+
+def test_split_halves_keep_the_shared_seed_draw_order():
+    import numpy as np
+
+    from modeling.design import build_design
+    from modeling.fit_kernels import (
+        XSTN_HEADLINE_BINS, XSTN_MIN_BIN_COUNT, XSTN_SEED, XSTN_SPLIT_HALF_REPS,
+        _station_subframes, _xstn_split_half_reps, _xstn_split_halves, read_streams, _wide_window,
+    )
+
+    acoustic, uptime, _currents = read_streams(_seed_store(seed=3), *_wide_window())
+    df = build_design(acoustic, uptime, bin_hours=1.0)
+    stations = sorted(df["station"].astype(str).unique())
+    subs = _station_subframes(df, stations)
+    units = _xstn_split_halves((subs,), ["diel"], stations, XSTN_HEADLINE_BINS, XSTN_MIN_BIN_COUNT)
+
+    # The first unit (diel, raw, first station) consumes the seed stream first.
+    first = subs[stations[0]]
+    reps = _xstn_split_half_reps(
+        first["diel"].to_numpy(dtype=float), first["y"].to_numpy(dtype=float),
+        first["exposure"].to_numpy(dtype=float), XSTN_HEADLINE_BINS, XSTN_MIN_BIN_COUNT,
+        np.random.default_rng(XSTN_SEED), XSTN_SPLIT_HALF_REPS,
+    )
+    assert units[(0, "diel", stations[0])] == float(np.mean([c for c in reps if c is not None]))
@@ -82,3 +82,65 @@ def test_reverse_correlation_finds_covariate_signal():
     assert res["max_abs_z"] > 4.0
     # The STA peaks near lag 0 (detections track the instantaneous covariate).
     assert abs(lags[np.argmax(res["sta"])]) <= 1.0
+
+
+# --- batched resampling: identical to the per-resample loops ----------------------
+
+def _loop_psth_with_null(phase, y, exposure, n_bins, n_boot, n_shuffles, rng):
+    """The original one-resample-per-iteration PSTH bootstrap and shuffle null."""
+    from modeling.validation.null_tests import modulation_depth, permutation_null
+
+    phase = np.asarray(phase, dtype=float) % 1.0
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    idx = np.clip(np.digitize(phase, edges[1:-1]), 0, n_bins - 1)
+    exposure = np.clip(exposure, 1e-9, None)
+
+    def rates(bins, yy, ee):
+        return np.bincount(bins, weights=yy, minlength=n_bins) / np.clip(
+            np.bincount(bins, weights=ee, minlength=n_bins), 1e-9, None)
+
+    boot = np.empty((n_boot, n_bins))
+    for b in range(n_boot):
+        s = rng.integers(0, phase.size, size=phase.size)
+        boot[b] = rates(idx[s], y[s], exposure[s])
+    observed = modulation_depth(rates(idx, y, exposure))
+
+    def sample_null(r):
+        shuffled = r.permutation(phase)
+        return modulation_depth(rates(np.clip(np.digitize(shuffled, edges[1:-1]), 0, n_bins - 1), y, exposure))
+
+    null = permutation_null(observed, sample_null, n_shuffles=n_shuffles, rng=rng)
+    return np.percentile(boot, 2.5, axis=0), np.percentile(boot, 97.5, axis=0), null
+
+
+def test_batched_psth_matches_loop_for_any_chunk_size():
+    rng = np.random.default_rng(4)
+    n = 1501
+    phase = rng.uniform(size=n)
+    y = rng.poisson(1.0 + 0.5 * np.cos(2 * np.pi * phase)).astype(float)
+    exposure = rng.uniform(0.2, 1.0, n)
+
+    lo, hi, null = _loop_psth_with_null(phase, y, exposure, 24, 97, 113, np.random.default_rng(7))
+    for max_elements in (1, 4000, 10**7):
+        out = psth_with_null(phase, y, exposure, n_bins=24, n_boot=97, n_shuffles=113,
+                             rng=np.random.default_rng(7), max_elements=max_elements)
+        np.testing.assert_array_equal(out["ci_lo"], lo)
+        np.testing.assert_array_equal(out["ci_hi"], hi)
+        assert out["null"] == null
+
+
+def test_batched_shuffled_baseline_matches_loop():
+    from modeling.reverse_corr import detection_triggered_average, shuffled_baseline
+
+    cov_times = np.arange(0.0, 300.0, 0.5)
+    cov_values = np.sin(cov_times / 5.0)
+    lags = np.linspace(-2, 2, 9)
+    rng = np.random.default_rng(3)
+    draws = np.array([
+        detection_triggered_average(rng.uniform(0.0, cov_times[-1], size=23), cov_times, cov_values, lags)
+        for _ in range(61)
+    ])
+    out = shuffled_baseline(23, cov_times, cov_values, lags, n_shuffles=61,
+                            rng=np.random.default_rng(3), max_elements=100)
+    np.testing.assert_array_equal(out["mean"], draws.mean(axis=0))
+    np.testing.assert_array_equal(out["std"], draws.std(axis=0))
@@ -7,7 +7,16 @@ gate (a) passes when the model is right and (b) fails when it is wrong.
 import numpy as np
 import pandas as pd
 
-from modeling.validation.time_rescaling import run_time_rescaling
+from scipy import stats
+
+from modeling.validation.time_rescaling import (
+    CumulativeHazard,
+    cumulative_hazard,
+    ks_many,
+    run_time_rescaling,
+    time_rescaling_test,
+    time_rescaling_tests,
+)
 from modeling.validation.diagnostics import (
     poisson_deviance,
     deviance_residuals,
@@ -71,6 +80,57 @@ def test_time_rescaling_inhomogeneous_true_vs_mean():
     assert mean_fit["pass_exp"] is False
 
 
+def test_cumulative_hazard_trapezoid_and_scaled_match_direct_integration():
+    rng = np.random.default_rng(3)
+    events = np.sort(rng.uniform(0, 200, 300))
+    intensity = lambda t: 2.0 + np.sin(t / 5.0)
+    hazard = CumulativeHazard.for_events(events, intensity, grid_step=0.1)
+    grid = hazard.grid_times
+    assert np.array_equal(hazard.at(events), cumulative_hazard(events, grid, intensity(grid)))
+
+    # Rescaling the level reuses the evaluated grid: identical to integrating the
+    # scaled intensity afresh over the same grid.
+    subset = events[::7]
+    direct = cumulative_hazard(subset, grid, intensity(grid) * 0.3)
+    assert np.array_equal(hazard.scaled(0.3).at(subset), direct)
+
+
+def test_cumulative_hazard_piecewise_constant_is_exact():
+    grid = np.arange(0.0, 10.5, 0.5)
+    rates = np.where(np.arange(grid.size - 1) % 2 == 0, 1.0, 3.0)
+    hazard = CumulativeHazard(grid, rates, rule="piecewise_constant")
+    # 0.25 h into the first bin, 0.5 h of rate 1 + 0.5 h of rate 3 + 0.1 h at rate 1.
+    np.testing.assert_allclose(hazard.at([0.25, 1.1]), [0.25, 0.5 + 1.5 + 0.1])
+    np.testing.assert_allclose(hazard.at([10.0]), [20 / 2 * 0.5 + 20 / 2 * 1.5])
+
+    rng = np.random.default_rng(4)
+    events = _homogeneous_poisson(2.0, T=2000.0, rng=rng)
+    res = run_time_rescaling(events, intensity=lambda t: np.full_like(t, 2.0), grid_step=0.05,
+                             rule="piecewise_constant")
+    assert res["pass_exp"] is True
+
+
+def test_batched_ks_matches_per_sample_scipy():
+    rng = np.random.default_rng(5)
+    samples = [rng.exponential(size=n) * s for n, s in ((25, 1.0), (400, 1.3), (3, 0.7), (0, 1.0))]
+    stat, pval = ks_many(samples, stats.expon.cdf)
+    for x, d, p in zip(samples[:3], stat, pval):
+        ref = stats.kstest(x, "expon", args=(0, 1))
+        assert d == ref.statistic and p == ref.pvalue
+    assert np.isnan(stat[3]) and np.isnan(pval[3])
+
+    events = [np.sort(rng.uniform(0, 100, n)) for n in (50, 8, 120)]
+    cums = [np.cumsum(rng.exponential(size=e.size)) for e in events]
+    batched = time_rescaling_tests(events, cums, min_ieis=10)
+    assert "error" in batched[1] and batched[1]["pass_exp"] is False
+    for c, got in zip(cums[::2], batched[::2]):
+        rescaled = np.diff(c)
+        assert np.array_equal(got["rescaled_ieis"], rescaled)
+        assert got["ks_exp_pval"] == stats.kstest(rescaled, "expon", args=(0, 1)).pvalue
+        assert got["ks_unif_stat"] == stats.kstest(1.0 - np.exp(-rescaled), "uniform").statistic
+    assert time_rescaling_test(events[2], cums[2], min_ieis=10)["ks_exp_stat"] == batched[2]["ks_exp_stat"]
+
+
 # --- binomial pass test ------------------------------------------------------
 
 def test_binomial_modest_pass_not_significant():
@@ -8,7 +8,7 @@ harmonic predictor, not observed current measurements.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import numpy as np
 
@@ -80,21 +80,35 @@ class HarmonicTide:
 
     def phase(self, times_hours: Iterable[float]) -> np.ndarray:
         """Tidal phase in [0,1), derived from the fitted M2 constituent."""
-        coef = self._require_fit()
         t = np.asarray(list(times_hours), dtype=float).reshape(-1)
+        return self.phase_array(t, self.m2_phase_terms())
+
+    def m2_phase_terms(self) -> Tuple[float, Optional[float], float]:
+        """``(omega, delta, period_hours)`` of the fitted M2 component.
 
+        ``delta`` is ``None`` when the M2 amplitude vanishes (phase then falls
+        back to a fixed-period clock). Computed once by callers that evaluate
+        phase repeatedly.
+        """
+        coef = self._require_fit()
         m2_index = next(i for i, c in enumerate(self._constituents) if c.name == "M2")
         a = float(coef[1 + 2 * m2_index])
         b = float(coef[1 + 2 * m2_index + 1])
-        omega = 2.0 * np.pi / self._constituents[m2_index].period_hours
-
+        period = self._constituents[m2_index].period_hours
+        omega = 2.0 * np.pi / period
         amp = float(np.hypot(a, b))
         if amp <= 1e-12:
-            return np.mod(t / self._constituents[m2_index].period_hours, 1.0)
-
+            return omega, None, period
         # With s(t) = a cos(wt) + b sin(wt), this maps phase=0 to an upward
         # mean crossing of the M2 component.
-        delta = np.arctan2(a, b)
+        return omega, np.arctan2(a, b), period
+
+    @staticmethod
+    def phase_array(t: np.ndarray, terms: Tuple[float, Optional[float], float]) -> np.ndarray:
+        """Phase at float times ``t`` given :meth:`m2_phase_terms`."""
+        omega, delta, period = terms
+        if delta is None:
+            return np.mod(t / period, 1.0)
         return np.mod((omega * t + delta) / (2.0 * np.pi), 1.0)
 
     def _design_matrix(self, times_hours: np.ndarray) -> np.ndarray:
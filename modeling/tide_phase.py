@@ -9,10 +9,20 @@ the anchor falls back to the rising mean-crossing (water level has no sign).
 The phase at a time ``t`` is the fraction of the way from the most recent onset
 to the next, in ``[0, 1)``. Outside the observed span it extrapolates with the
 mean detected period (or the ~12.42 h semidiurnal period as a last resort).
+
+``TidePhaseTable`` samples either model on a fixed grid for bulk lookups
+(fine-grid integrators, forecast spans) and persists it as a memory-mapped
+``.npy`` keyed by the model's digest.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import math
+import os
+from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
 import numpy as np
@@ -20,9 +30,15 @@ import numpy as np
 from .timeutil import to_hours
 from .tide_harmonic import HarmonicTide
 
+logger = logging.getLogger(__name__)
+
 # Mean semidiurnal tidal period (principal lunar M2), hours.
 _M2_PERIOD_HOURS = 12.4206
 
+# TidePhaseTable grid: 3-minute spacing (~175k points per year of span).
+TIDE_TABLE_STEP_HOURS = 0.05
+TIDE_TABLE_VERSION = 1
+
 
 class TidalPhase:
     """Maps timestamps to a tidal phase in ``[0, 1)`` anchored at flood onset."""
@@ -84,7 +100,29 @@ class TidalPhase:
         return float((time_hours - self.onsets[idx]) / span)
 
     def phases(self, times_hours: Sequence[float]) -> np.ndarray:
-        return np.array([self.phase(float(t)) for t in times_hours], dtype=float)
+        """:meth:`phase` over an array of times (same branches, element-wise)."""
+        t = np.asarray(times_hours, dtype=float)
+        period = self.period
+        if self.onsets.size == 0:
+            return (t % period) / period
+
+        onsets = self.onsets
+        idx = np.searchsorted(onsets, t, side="right") - 1
+        out = np.empty(t.shape, dtype=float)
+        before = idx < 0
+        after = idx >= onsets.size - 1
+        between = ~(before | after)
+        if before.any():
+            delta = (onsets[0] - t[before]) % period
+            out[before] = (period - delta) % period / period
+        if after.any():
+            out[after] = ((t[after] - onsets[idx[after]]) % period) / period
+        if between.any():
+            i = idx[between]
+            span = onsets[i + 1] - onsets[i]
+            span = np.where(span > 0, span, period)
+            out[between] = (t[between] - onsets[i]) / span
+        return out
 
     def value_at(self, time_hours: float) -> Optional[float]:
         """Interpolated raw series value at a time (for STA on continuous tide)."""
@@ -119,6 +157,7 @@ class HarmonicTidalPhase:
         self._t = times_hours
         self._v = values
         self.reconstruction_r2 = float(getattr(model, "reconstruction_r2", float("nan")))
+        self._terms = None
 
     @classmethod
     def from_records(cls, records: List[dict], min_samples: int = 24) -> Optional["HarmonicTidalPhase"]:
@@ -154,23 +193,135 @@ class HarmonicTidalPhase:
         period = float(np.median(np.diff(onsets))) if onsets.size >= 2 else _M2_PERIOD_HOURS
         return cls(model, onsets, period, times, values)
 
+    def _phase_terms(self):
+        if self._terms is None:
+            self._terms = self.model.m2_phase_terms()
+        return self._terms
+
     def phase(self, time_hours: float) -> float:
-        return float(self.model.phase([float(time_hours)])[0])
+        return float(self.model.phase_array(np.array([float(time_hours)]), self._phase_terms())[0])
 
     def phases(self, times_hours: Sequence[float]) -> np.ndarray:
-        return np.asarray(self.model.phase([float(t) for t in times_hours]), dtype=float)
+        return self.model.phase_array(np.asarray(times_hours, dtype=float), self._phase_terms())
 
     def value_at(self, time_hours: float) -> Optional[float]:
         return float(self.model.predict([float(time_hours)])[0])
 
 
+def tide_digest(tide) -> str:
+    """Content digest of a tide-phase model (what its phases depend on)."""
+    digest = hashlib.sha256(type(tide).__name__.encode("utf-8"))
+    digest.update(np.ascontiguousarray(tide.onsets, dtype="<f8").tobytes())
+    digest.update(repr(float(tide.period)).encode("utf-8"))
+    if isinstance(tide, HarmonicTidalPhase):
+        digest.update(repr(tide.model.m2_phase_terms()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TidePhaseTable:
+    """A tide model's phase sampled on a fixed time grid, with interpolated lookups.
+
+    The table stores the wrapped phase at ``start + k * step``; a lookup finds
+    its cell by arithmetic (no search) and interpolates along the shorter way
+    round the cycle, so ``n`` queries cost O(n). Times outside the grid fall
+    back to the exact model. For ``HarmonicTidalPhase`` (phase linear in time)
+    the interpolation is exact up to rounding; for the onset-interpolated
+    ``TidalPhase`` the only error is inside the one cell holding each onset,
+    bounded by ``step / span``.
+
+    Tables are ``.npy`` files (memory-mapped on load) beside a JSON header that
+    records the source model's digest and the grid, so a stale table is rebuilt.
+    """
+
+    def __init__(self, tide, start_hours: float, step_hours: float, values: np.ndarray) -> None:
+        if values.shape[0] < 2:
+            raise ValueError("a tide-phase table needs at least two grid points")
+        self.tide = tide
+        self.start = float(start_hours)
+        self.step = float(step_hours)
+        self.values = values
+        self.end = self.start + self.step * (values.shape[0] - 1)
+        self.onsets = tide.onsets
+        self.period = tide.period
+
+    @classmethod
+    def build(cls, tide, start_hours: float, end_hours: float, step_hours: float = TIDE_TABLE_STEP_HOURS) -> "TidePhaseTable":
+        n = max(2, int(math.ceil((end_hours - start_hours) / step_hours)) + 1)
+        grid = start_hours + step_hours * np.arange(n, dtype=float)
+        return cls(tide, start_hours, step_hours, tide.phases(grid))
+
+    @classmethod
+    def load_or_build(
+        cls,
+        tide,
+        start_hours: float,
+        end_hours: float,
+        directory: Path,
+        step_hours: float = TIDE_TABLE_STEP_HOURS,
+    ) -> "TidePhaseTable":
+        """Memory-map the stored table for this model and grid, building it if absent."""
+        header = {
+            "version": TIDE_TABLE_VERSION,
+            "source_sha256": tide_digest(tide),
+            "start_hours": float(start_hours),
+            "end_hours": float(end_hours),
+            "step_hours": float(step_hours),
+        }
+        key = hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+        header_path = Path(directory) / f"tide_{key}.json"
+        data_path = Path(directory) / f"tide_{key}.npy"
+        try:
+            stored = json.loads(header_path.read_text(encoding="utf-8"))
+            if stored == header:
+                return cls(tide, start_hours, step_hours, np.load(data_path, mmap_mode="r"))
+        except (OSError, ValueError):
+            pass
+
+        table = cls.build(tide, start_hours, end_hours, step_hours)
+        try:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            tmp = data_path.with_name(data_path.name + ".tmp.npy")
+            np.save(tmp, np.ascontiguousarray(table.values))
+            os.replace(tmp, data_path)
+            header_path.write_text(json.dumps(header, indent=2) + "\n", encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Could not store tide-phase table in %s (%s); keeping it in memory only", directory, exc)
+        return table
+
+    def phases(self, times_hours: Sequence[float]) -> np.ndarray:
+        t = np.asarray(times_hours, dtype=float)
+        pos = (t - self.start) / self.step
+        inside = (pos >= 0.0) & (pos <= self.values.shape[0] - 1)
+        if inside.all():
+            return self._interpolate(pos)
+        out = np.empty(t.shape, dtype=float)
+        out[inside] = self._interpolate(pos[inside])
+        out[~inside] = self.tide.phases(t[~inside])
+        return out
+
+    def _interpolate(self, pos: np.ndarray) -> np.ndarray:
+        i = np.minimum(pos.astype(np.int64), self.values.shape[0] - 2)
+        lo = self.values[i]
+        d = self.values[i + 1] - lo
+        d -= np.round(d)  # shorter way round the cycle
+        return (lo + (pos - i) * d) % 1.0
+
+    def phase(self, time_hours: float) -> float:
+        return float(self.phases(np.array([float(time_hours)]))[0])
+
+    def value_at(self, time_hours: float) -> Optional[float]:
+        return self.tide.value_at(time_hours)
+
+
 def _upward_zero_crossings(times: np.ndarray, series: np.ndarray) -> np.ndarray:
     """Times where ``series`` crosses zero going negative -> positive."""
-    onsets: List[float] = []
-    for i in range(1, series.size):
-        a, b = series[i - 1], series[i]
-        if a <= 0.0 < b:
-            # Linear interpolation of the crossing time.
-            frac = -a / (b - a) if (b - a) != 0 else 0.0
-            onsets.append(float(times[i - 1] + frac * (times[i] - times[i - 1])))
-    return np.array(onsets, dtype=float)
+    series = np.asarray(series, dtype=float)
+    if series.size < 2:
+        return np.array([], dtype=float)
+    times = np.asarray(times, dtype=float)
+    a, b = series[:-1], series[1:]
+    cross = np.flatnonzero((a <= 0.0) & (0.0 < b))
+    a, b = a[cross], b[cross]
+    # Linear interpolation of the crossing time.
+    frac = -a / (b - a)  # b > 0 >= a, so b - a > 0
+    return times[cross] + frac * (times[cross + 1] - times[cross])
@@ -28,15 +28,25 @@ reading), plus a ``logged_at`` UTC stamp added on append. Binning uses
 Traffic patterns are local (rush hour), so timestamps and ``depart_dt`` are bucketed
 in a local timezone (default America/Los_Angeles). The history stamps are UTC; a
 naive ``depart_dt`` is interpreted as already-local.
+
+The log only ever grows, and the planner asks for every corridor route on every
+trip plan, so ``predict_eta`` answers from a :class:`CorridorIndex` rather than
+re-parsing the whole file per call. The index tail-reads the log from the byte
+offset it last consumed, keeps per-route, per-bucket sorted readings, and
+rebuilds from scratch if the log is truncated or replaced. Set
+``ORCAST_CORRIDOR_INDEX_SNAPSHOT`` to a JSON path to persist it between
+processes. Results are identical to a full re-read.
 """
 
 from __future__ import annotations
 
+import bisect
 import json
-import statistics
+import os
+import threading
 from datetime import datetime, timezone, tzinfo
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 try:  # zoneinfo is stdlib (3.9+); degrade to UTC bucketing if tzdata is absent.
     from zoneinfo import ZoneInfo
@@ -153,27 +163,220 @@ def _load_samples(route_id: int, path: Path) -> List[Tuple[datetime, float]]:
     samples: List[Tuple[datetime, float]] = []
     with open(path, "r", encoding="utf-8") as handle:
         for line in handle:
-            line = line.strip()
-            if not line:
+            parsed = _parse_row(line)
+            if parsed is None or parsed[0] != route_id:
                 continue
+            samples.append(parsed[1:])
+    return samples
+
+
+def _parse_row(line: str) -> Optional[Tuple[Any, datetime, float]]:
+    """Parse one log line to ``(travel_time_id, timestamp, current_time)``.
+
+    Returns ``None`` for blank / malformed lines and for rows without a numeric,
+    non-negative ``current_time`` or a parseable timestamp.
+    """
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(row, dict):
+        return None
+    observed = row.get("current_time")
+    if not isinstance(observed, (int, float)) or isinstance(observed, bool):
+        return None
+    if observed < 0:
+        return None
+    ts = _parse_ts(row.get("time_updated")) or _parse_ts(row.get("logged_at"))
+    if ts is None:
+        return None
+    return row.get("travel_time_id"), ts, float(observed)
+
+
+# --------------------------------------------------------------------------- #
+# Incremental index
+# --------------------------------------------------------------------------- #
+
+_SNAPSHOT_VERSION = 1
+# Leading bytes remembered to notice a log rewritten in place (same inode).
+_HEAD_BYTES = 256
+
+
+class _RouteHistory:
+    """One route's readings: sorted per bucket and overall, plus the latest one."""
+
+    __slots__ = ("buckets", "values", "latest_ts", "latest_value")
+
+    def __init__(self) -> None:
+        self.buckets: Dict[Tuple[int, int], List[float]] = {}
+        self.values: List[float] = []
+        self.latest_ts: Optional[datetime] = None
+        self.latest_value = 0.0
+
+    def add(self, bucket: Tuple[int, int], ts: datetime, observed: float) -> None:
+        bisect.insort(self.buckets.setdefault(bucket, []), observed)
+        bisect.insort(self.values, observed)
+        # Strictly later only: ties keep the earliest logged row, like max().
+        if self.latest_ts is None or ts > self.latest_ts:
+            self.latest_ts, self.latest_value = ts, observed
+
+
+class CorridorIndex:
+    """Incrementally maintained day-of-week x time-bin index over the history log.
+
+    :meth:`refresh` reads only the bytes appended since the last call (a
+    trailing line without its newline is left for the next call unless it is
+    already a complete row) and re-reads from the start when the log shrinks,
+    is replaced, or its first bytes change. With ``snapshot_path`` the index state and the log offset are
+    saved as JSON after each refresh that added rows, and a later index for the
+    same log, timezone and bin width resumes from it.
+    """
+
+    def __init__(
+        self,
+        path: Any,
+        *,
+        tz: Any = DEFAULT_TZ_NAME,
+        bin_minutes: int = DEFAULT_BIN_MINUTES,
+        snapshot_path: Optional[Any] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.tz = _resolve_tz(tz)
+        self.bin_minutes = bin_minutes
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._routes: Dict[Hashable, _RouteHistory] = {}
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._head = b""
+        self._lock = threading.Lock()
+        if self.snapshot_path is not None:
+            self._load_snapshot()
+
+    def refresh(self) -> int:
+        """Fold newly appended log rows into the index; returns how many were added."""
+        with self._lock:
             try:
-                row = json.loads(line)
-            except (ValueError, TypeError):
-                continue
-            if not isinstance(row, dict):
-                continue
-            if row.get("travel_time_id") != route_id:
-                continue
-            observed = row.get("current_time")
-            if not isinstance(observed, (int, float)) or isinstance(observed, bool):
-                continue
-            if observed < 0:
+                stat = os.stat(self.path)
+            except OSError:
+                self._reset(None)
+                return 0
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._reset(stat.st_ino)
+            with open(self.path, "rb") as handle:
+                if self._offset and handle.read(len(self._head)) != self._head:
+                    self._reset(stat.st_ino)
+                if stat.st_size == self._offset:
+                    return 0
+                if not self._offset:
+                    handle.seek(0)
+                    self._head = handle.read(_HEAD_BYTES)
+                handle.seek(self._offset)
+                chunk = handle.read(stat.st_size - self._offset)
+            added = self._consume(chunk)
+            if added and self.snapshot_path is not None:
+                self._save_snapshot()
+            return added
+
+    def route(self, route_id: Any) -> Optional[_RouteHistory]:
+        try:
+            return self._routes.get(route_id)
+        except TypeError:  # unhashable id never matches a logged row
+            return None
+
+    def _reset(self, inode: Optional[int]) -> None:
+        self._routes = {}
+        self._offset = 0
+        self._inode = inode
+        self._head = b""
+
+    def _consume(self, chunk: bytes) -> int:
+        complete = chunk.rfind(b"\n") + 1
+        tail = chunk[complete:]
+        consumed = complete
+        lines = chunk[:complete].split(b"\n")
+        if tail.strip() and _parse_row(tail.decode("utf-8", errors="replace")) is not None:
+            lines.append(tail)
+            consumed = len(chunk)
+        added = 0
+        for raw in lines:
+            parsed = _parse_row(raw.decode("utf-8", errors="replace"))
+            if parsed is None:
                 continue
-            ts = _parse_ts(row.get("time_updated")) or _parse_ts(row.get("logged_at"))
-            if ts is None:
+            route_id, ts, observed = parsed
+            try:
+                history = self._routes.get(route_id)
+            except TypeError:
                 continue
-            samples.append((ts, float(observed)))
-    return samples
+            if history is None:
+                history = self._routes[route_id] = _RouteHistory()
+            history.add(_bucket(ts, self.tz, self.bin_minutes), ts, observed)
+            added += 1
+        self._offset += consumed
+        return added
+
+    def _identity(self) -> Dict[str, Any]:
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "log": str(self.path.resolve()),
+            "tz": str(self.tz),
+            "bin_minutes": self.bin_minutes,
+        }
+
+    def _save_snapshot(self) -> None:
+        routes = []
+        for route_id, history in self._routes.items():
+            routes.append(
+                {
+                    "route_id": route_id,
+                    "buckets": [[dow, time_bin, values] for (dow, time_bin), values in history.buckets.items()],
+                    "latest": [history.latest_ts.isoformat(), history.latest_value],
+                }
+            )
+        payload = {**self._identity(), "inode": self._inode, "offset": self._offset, "head": self._head.hex(), "routes": routes}
+        assert self.snapshot_path is not None
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, self.snapshot_path)
+
+    def _load_snapshot(self) -> None:
+        """Adopt a saved index when it describes this log; otherwise start empty."""
+        assert self.snapshot_path is not None
+        try:
+            payload = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if {key: payload.get(key) for key in self._identity()} != self._identity():
+                return
+            routes: Dict[Hashable, _RouteHistory] = {}
+            for entry in payload["routes"]:
+                history = _RouteHistory()
+                for dow, time_bin, values in entry["buckets"]:
+                    history.buckets[(int(dow), int(time_bin))] = [float(v) for v in values]
+                history.values = sorted(v for values in history.buckets.values() for v in values)
+                history.latest_ts = _parse_ts(entry["latest"][0])
+                history.latest_value = float(entry["latest"][1])
+                routes[entry["route_id"]] = history
+            inode, offset, head = int(payload["inode"]), int(payload["offset"]), bytes.fromhex(payload["head"])
+        except (OSError, ValueError, TypeError, KeyError, IndexError):
+            return
+        self._routes, self._inode, self._offset, self._head = routes, inode, offset, head
+
+
+_INDEXES: Dict[Tuple[str, tzinfo, int], CorridorIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _shared_index(path: Path, tz: tzinfo, bin_minutes: int) -> CorridorIndex:
+    """The process-wide index for one (log, timezone, bin width)."""
+    key = (os.path.abspath(path), tz, bin_minutes)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            snapshot = os.getenv("ORCAST_CORRIDOR_INDEX_SNAPSHOT", "").strip() or None
+            index = _INDEXES[key] = CorridorIndex(path, tz=tz, bin_minutes=bin_minutes, snapshot_path=snapshot)
+        return index
 
 
 # --------------------------------------------------------------------------- #
@@ -193,7 +396,15 @@ def _percentile(sorted_values: List[float], pct: float) -> float:
     return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * frac
 
 
-def _interval(values: List[float], center: float) -> Tuple[float, float]:
+def _median(sorted_values: List[float]) -> float:
+    """``statistics.median`` of a pre-sorted, non-empty list without re-sorting it."""
+    mid = len(sorted_values) // 2
+    if len(sorted_values) % 2:
+        return sorted_values[mid]
+    return (sorted_values[mid - 1] + sorted_values[mid]) / 2
+
+
+def _interval(values: List[float], center: float, *, presorted: bool = False) -> Tuple[float, float]:
     """A robust prediction interval around ``center``.
 
     With enough samples use the empirical 25th/75th percentiles; otherwise fall
@@ -201,7 +412,7 @@ def _interval(values: List[float], center: float) -> Tuple[float, float]:
     still communicates uncertainty rather than false precision.
     """
     if len(values) >= 4:
-        ordered = sorted(values)
+        ordered = values if presorted else sorted(values)
         return (
             round(_percentile(ordered, 25.0), 1),
             round(_percentile(ordered, 75.0), 1),
@@ -227,6 +438,7 @@ def predict_eta(
     history_path: Optional[Any] = None,
     tz: Any = DEFAULT_TZ_NAME,
     bin_minutes: int = DEFAULT_BIN_MINUTES,
+    index: Optional[CorridorIndex] = None,
 ) -> Dict[str, Any]:
     """Predict a future-departure ETA for one measured corridor route.
 
@@ -243,6 +455,9 @@ def predict_eta(
             ``wsdot_traffic.history_path()``.
         tz: Bucketing timezone (name, tzinfo, or None for the Pacific default).
         bin_minutes: Width of a time-of-day bucket, in minutes.
+        index: A :class:`CorridorIndex` to answer from (its own log, ``tz`` and
+            ``bin_minutes`` then apply). Defaults to the process-wide index for
+            ``history_path`` / ``tz`` / ``bin_minutes``, refreshed on each call.
 
     Returns:
         ``{"eta_minutes", "interval", "basis", "label"}`` where:
@@ -253,9 +468,11 @@ def predict_eta(
             ``"no_history"``), ``n_samples``, and bucket / freshness detail;
           - ``label`` is always ``"MODELED"``.
     """
-    tzinfo_obj = _resolve_tz(tz)
-    path = _history_path(history_path)
-    samples = _load_samples(route_id, path)
+    if index is None:
+        index = _shared_index(_history_path(history_path), _resolve_tz(tz), bin_minutes)
+    index.refresh()
+    tzinfo_obj, bin_minutes = index.tz, index.bin_minutes
+    history = index.route(route_id)
 
     target_dow, target_bin = _bucket(depart_dt, tzinfo_obj, bin_minutes)
     bucket_detail = {
@@ -265,18 +482,14 @@ def predict_eta(
         "bin_minutes": bin_minutes,
     }
 
-    if not samples:
+    if history is None:
         return _empty_result(bucket_detail)
 
-    in_bucket = [
-        observed
-        for ts, observed in samples
-        if _bucket(ts, tzinfo_obj, bin_minutes) == (target_dow, target_bin)
-    ]
+    in_bucket = history.buckets.get((target_dow, target_bin))
 
     if in_bucket:
-        eta = round(statistics.median(in_bucket), 1)
-        low, high = _interval(in_bucket, eta)
+        eta = round(_median(in_bucket), 1)
+        low, high = _interval(in_bucket, eta, presorted=True)
         basis = {"method": "modeled_history", "n_samples": len(in_bucket)}
         basis.update(bucket_detail)
         return {
@@ -287,15 +500,13 @@ def predict_eta(
         }
 
     # Empty bucket -> latest measured travel time for this route, clearly flagged.
-    latest_ts, latest_value = max(samples, key=lambda item: item[0])
-    eta = round(latest_value, 1)
-    all_values = [observed for _, observed in samples]
-    low, high = _interval(all_values, eta)
+    eta = round(history.latest_value, 1)
+    low, high = _interval(history.values, eta, presorted=True)
     basis = {
         "method": "fallback_latest_measured",
         "n_samples": 0,
-        "fallback_from_total_samples": len(samples),
-        "measured_at": latest_ts.astimezone(timezone.utc).isoformat(),
+        "fallback_from_total_samples": len(history.values),
+        "measured_at": history.latest_ts.astimezone(timezone.utc).isoformat(),
     }
     basis.update(bucket_detail)
     return {
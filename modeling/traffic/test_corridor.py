@@ -118,3 +118,111 @@ def test_aware_depart_dt_is_converted_into_bucket_tz(history_file):
     assert result["label"] == "MODELED"
     assert result["basis"]["day_of_week"] == "Mon"
     assert result["basis"]["time_bin"] == "08:00-09:00"
+
+
+# --------------------------------------------------------------------------- #
+# Incremental index
+# --------------------------------------------------------------------------- #
+
+def _full_scan_eta(route_id, depart_dt, path):
+    """The pre-index model: re-read the whole log and filter by bucket."""
+    import statistics
+    from datetime import timezone as tz_utc
+
+    from modeling.traffic.corridor import _bucket, _interval, _load_samples
+
+    utc = tz_utc.utc
+    samples = _load_samples(route_id, path)
+    if not samples:
+        return None
+    target = _bucket(depart_dt, utc, 60)
+    in_bucket = [v for ts, v in samples if _bucket(ts, utc, 60) == target]
+    if in_bucket:
+        eta = round(statistics.median(in_bucket), 1)
+        return eta, _interval(in_bucket, eta), len(in_bucket)
+    latest_ts, latest = max(samples, key=lambda item: item[0])
+    eta = round(latest, 1)
+    return eta, _interval([v for _, v in samples], eta), latest_ts
+
+
+def test_index_matches_full_rescan_as_the_log_grows(tmp_path):
+    import random
+
+    from modeling.traffic.corridor import CorridorIndex
+
+    rng = random.Random(7)
+    path = tmp_path / "grow.jsonl"
+    path.write_text("")
+    index = CorridorIndex(path, tz="UTC")
+    for batch in range(4):
+        rows = [
+            {"travel_time_id": rng.choice([ROUTE, OTHER_ROUTE]),
+             "current_time": rng.randint(20, 90),
+             "time_updated": f"2026-06-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00+00:00"}
+            for _ in range(150)
+        ]
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write("not json\n")
+            for row in rows:
+                handle.write(json.dumps(row) + "\n")
+        assert index.refresh() == 150
+        for day in range(1, 8):
+            depart = datetime(2026, 6, day, rng.randint(0, 23), 30)
+            got = predict_eta(ROUTE, depart, index=index)
+            want = _full_scan_eta(ROUTE, depart, path)
+            interval = (got["interval"]["low_minutes"], got["interval"]["high_minutes"])
+            if got["basis"]["method"] == "modeled_history":
+                assert (got["eta_minutes"], interval, got["basis"]["n_samples"]) == want
+            else:
+                assert (got["eta_minutes"], interval) == want[:2]
+                assert got["basis"]["measured_at"] == want[2].isoformat()
+    assert index.refresh() == 0
+
+
+def test_index_rebuilds_when_log_is_rewritten_and_resumes_from_snapshot(tmp_path, history_file):
+    from modeling.traffic.corridor import CorridorIndex
+
+    snapshot = tmp_path / "corridor_index.json"
+    index = CorridorIndex(history_file, tz="UTC", snapshot_path=snapshot)
+    monday = datetime(2026, 6, 15, 8, 45)
+    assert predict_eta(ROUTE, monday, index=index)["basis"]["n_samples"] == 4
+
+    # A second process adopts the snapshot and reads nothing until the log grows.
+    resumed = CorridorIndex(history_file, tz="UTC", snapshot_path=snapshot)
+    assert resumed.refresh() == 0
+    assert predict_eta(ROUTE, monday, index=resumed)["eta_minutes"] == 43.0
+    with open(history_file, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"travel_time_id": ROUTE, "current_time": 50,
+                                 "time_updated": "2026-06-22T08:15:00+00:00"}) + "\n")
+    assert resumed.refresh() == 1
+    assert predict_eta(ROUTE, monday, index=resumed)["basis"]["n_samples"] == 5
+
+    # Rewritten in place with different content: the index starts over.
+    _write_history(history_file, [{"travel_time_id": ROUTE, "current_time": 30,
+                                   "time_updated": "2026-06-15T08:05:00+00:00"}] * 8)
+    result = predict_eta(ROUTE, monday, index=resumed)
+    assert result["eta_minutes"] == 30.0 and result["basis"]["n_samples"] == 8
+
+
+def test_index_stays_incremental_after_an_in_place_rewrite(tmp_path):
+    from modeling.traffic.corridor import CorridorIndex
+
+    def row(minutes, day):
+        return json.dumps({"travel_time_id": ROUTE, "current_time": minutes,
+                           "time_updated": f"2026-06-{day:02d}T08:15:00+00:00"}) + "\n"
+
+    path = tmp_path / "rewrite.jsonl"
+    path.write_text("".join(row(40 + i, 1 + i % 28) for i in range(60)))
+    index = CorridorIndex(path, tz="UTC", snapshot_path=tmp_path / "snap.json")
+    assert index.refresh() == 60
+
+    # Rewritten in place (same inode, different leading bytes), then appended to.
+    with open(path, "r+", encoding="utf-8") as handle:
+        handle.write("".join(row(70 + i, 2 + i % 27) for i in range(60)))
+    assert index.refresh() == 60
+    for minutes in (90, 91, 92):
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(row(minutes, 3))
+        assert index.refresh() == 1
+    assert index.refresh() == 0
+    assert len(index.route(ROUTE).values) == 63
@@ -65,6 +65,17 @@ def permutation_null(
     """
     rng = rng or np.random.default_rng()
     null = np.array([sample_null_stat(rng) for _ in range(n_shuffles)], dtype=float)
+    return null_summary(observed_stat, null)
+
+
+def null_summary(observed_stat: float, null: np.ndarray) -> Dict[str, object]:
+    """The :func:`permutation_null` summary for already-drawn null statistics.
+
+    Used by batched callers that compute every null draw at once (see
+    ``modeling.resampling``).
+    """
+    null = np.asarray(null, dtype=float)
+    n_shuffles = null.size
     null_mean = float(np.mean(null))
     null_std = float(np.std(null))
     z = (observed_stat - null_mean) / null_std if null_std > 0 else 0.0
@@ -97,3 +108,20 @@ def modulation_depth(rate_by_bin: np.ndarray) -> float:
     if rate.size == 0 or rate.mean() == 0:
         return 0.0
     return float(rate.std() / rate.mean())
+
+
+def modulation_depth_rows(rates: np.ndarray) -> np.ndarray:
+    """:func:`modulation_depth` of every row of a ``(k, n_bins)`` rate matrix."""
+    rates = np.asarray(rates, dtype=float)
+    finite = np.isfinite(rates).all(axis=1)
+    out = np.zeros(rates.shape[0])
+    if finite.any():
+        rows = rates[finite]
+        mean = rows.mean(axis=1)
+        nonzero = mean != 0
+        depth = np.zeros(rows.shape[0])
+        depth[nonzero] = rows[nonzero].std(axis=1) / mean[nonzero]
+        out[finite] = depth
+    for r in np.flatnonzero(~finite):
+        out[r] = modulation_depth(rates[r])
+    return out
@@ -0,0 +1,72 @@
+"""Benchmark BAM window features: per-window STFT vs the shared-frame extractor.
+
+Synthesizes ``--seconds`` of 48 kHz hydrophone-like audio (noise plus a
+gated FM whistle) and featurizes the default 3 s / 1.5 s tiling three ways:
+
+* ``per-window``: ``window_feature`` on each slice (one ``scipy.signal.stft``
+  per window, the previous path);
+* ``exact``: ``window_features`` at the same starts (each distinct frame
+  transformed once, in batched blocks);
+* ``snapped``: ``window_features`` at starts rounded to the 512-sample STFT hop,
+  where all windows share one frame grid (``snap_to_frames=True``).
+
+Reports best-of-``--repeat`` wall time and the largest relative deviation from
+the per-window features.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_acoustic_features.py
+    PYTHONPATH=. python scripts/perf/bench_acoustic_features.py --seconds 1800
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from modeling.acoustic.features import HOP, SR, WIN_S, HOP_S, _snap, window_feature, window_features
+
+
+def _best(fn, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t)
+    return out, best
+
+
+def _rel(a, b):
+    return float(np.max(np.abs(a - b) / np.maximum(np.abs(b), 1e-12)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=300.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n = int(args.seconds * SR)
+    t = np.arange(n) / SR
+    x = 0.05 * rng.normal(size=n) + 0.2 * np.sin(2 * np.pi * (3000 + 2000 * np.sin(t / 3)) * t) * (np.sin(t) > 0)
+    win, hop = int(WIN_S * SR), int(HOP_S * SR)
+    starts = np.arange(0, n - win + 1, hop)
+    snapped = _snap(starts, n, win)
+
+    ref, ref_s = _best(lambda: np.asarray([window_feature(x[a:a + win], SR) for a in starts]), args.repeat)
+    exact, exact_s = _best(lambda: window_features(x, SR, starts, win), args.repeat)
+    snap, snap_s = _best(lambda: window_features(x, SR, snapped, win), args.repeat)
+    snap_ref = np.asarray([window_feature(x[a:a + win], SR) for a in snapped])
+
+    print(f"{starts.size} windows over {args.seconds:g} s (frame hop {HOP})")
+    print(f"per-window {ref_s:7.2f}s")
+    print(f"exact      {exact_s:7.2f}s  {ref_s / exact_s:4.1f}x  max rel dev {_rel(exact, ref):.1e}")
+    print(f"snapped    {snap_s:7.2f}s  {ref_s / snap_s:4.1f}x  max rel dev {_rel(snap, snap_ref):.1e} "
+          f"(vs its own slices)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark the design-matrix build against the original row-by-row build.
+
+Generates ``--stations`` stations of Poisson detections over ``--years`` and
+times ``modeling.design.build_design`` (column-wise, array covariates) against
+a per-bin dict build that calls the scalar ``src/aws_backend/covariates``
+functions, then checks the two frames are identical.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_build_design.py
+    PYTHONPATH=. python scripts/perf/bench_build_design.py --stations 10 --years 3 --bin-hours 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from modeling.design import _station_coords, build_design, event_times_hours, season_phase_hours
+from modeling.effort import FALLBACK_CONTINUOUS, exposure_for_bins
+from modeling.timeutil import from_hours, to_hours
+from src.aws_backend import covariates
+
+
+def _row_by_row(acoustic, bin_hours: float) -> pd.DataFrame:
+    rows = []
+    for station, records in acoustic.items():
+        events = event_times_hours(records)
+        _lat, lng = _station_coords(records, None)
+        lo = math.floor(events.min() / bin_hours) * bin_hours
+        hi = math.ceil(events.max() / bin_hours) * bin_hours + bin_hours
+        edges = np.arange(lo, hi + bin_hours, bin_hours)
+        counts, _ = np.histogram(events, bins=edges)
+        centers = edges[:-1] + bin_hours / 2.0
+        exposure_bins = exposure_for_bins(
+            {}, station, centers, bin_hours=bin_hours, fallback=FALLBACK_CONTINUOUS, detection_times=events,
+        )
+        for center, y, exposure in zip(centers, counts, exposure_bins):
+            dt = from_hours(center)
+            rows.append({
+                "station": station,
+                "t": float(center),
+                "bin_start": from_hours(center - bin_hours / 2.0).isoformat(),
+                "y": float(y),
+                "exposure": float(exposure),
+                "log_exposure": float(np.log(float(exposure))),
+                "diel": float(covariates.diel_phase(dt, lng)),
+                "lunar": float(covariates.lunar_phase(dt)["phase"]),
+                "season": float(season_phase_hours(center)),
+                "tide": math.nan,
+            })
+    return pd.DataFrame(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=10)
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument("--bin-hours", type=float, default=1.0)
+    parser.add_argument("--rate", type=float, default=0.2, help="detections per hour per station")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    t0 = to_hours("2023-01-01T00:00:00+00:00")
+    span = args.years * 365.25 * 24.0
+    acoustic = {}
+    for i in range(args.stations):
+        times = np.sort(t0 + rng.uniform(0.0, span, rng.poisson(args.rate * span)))
+        lng = -123.3 + 0.1 * i
+        acoustic[f"st{i:02d}"] = [{"t": from_hours(t).isoformat(), "latitude": 48.5, "longitude": lng} for t in times]
+
+    t = time.perf_counter()
+    vectorized = build_design(acoustic, bin_hours=args.bin_hours)
+    fast = time.perf_counter() - t
+    t = time.perf_counter()
+    reference = _row_by_row(acoustic, args.bin_hours)
+    slow = time.perf_counter() - t
+
+    pd.testing.assert_frame_equal(vectorized, reference, check_exact=True)
+    print(f"rows={len(vectorized)}  row-by-row {slow:.2f}s  vectorized {fast:.2f}s  speedup {slow / fast:.1f}x  (identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark corridor ETA: full history re-read vs the incremental index.
+
+Writes a synthetic WSDOT corridor log (``--days`` of readings for ``--routes``
+routes every 5 minutes), then times one trip plan's worth of
+``predict_eta`` calls (one per route) answered by re-reading the whole log, the
+previous behaviour, and answered by a warm ``CorridorIndex``. It also checks
+that both give identical results. A final row times the incremental refresh
+after one more poll's readings are appended.
+
+Run:
+    python scripts/perf/bench_corridor_eta.py
+    python scripts/perf/bench_corridor_eta.py --days 365 --routes 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from modeling.traffic.corridor import (  # noqa: E402
+    CorridorIndex, _bucket, _interval, _load_samples, _resolve_tz, predict_eta,
+)
+
+
+def _rescan(route_id, depart_dt, path, tz):
+    """The pre-index model body: load every sample, then filter by bucket."""
+    samples = _load_samples(route_id, path)
+    target = _bucket(depart_dt, tz, 60)
+    in_bucket = [v for ts, v in samples if _bucket(ts, tz, 60) == target]
+    if in_bucket:
+        eta = round(statistics.median(in_bucket), 1)
+        return eta, _interval(in_bucket, eta)
+    eta = round(max(samples, key=lambda item: item[0])[1], 1)
+    return eta, _interval([v for _, v in samples], eta)
+
+
+def _row(route_id, ts, minutes):
+    return json.dumps({"travel_time_id": route_id, "name": f"route {route_id}", "current_time": minutes,
+                       "average_time": 40, "time_updated": str(ts), "logged_at": ts.isoformat()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--routes", type=int, default=4)
+    args = parser.parse_args()
+
+    route_ids = list(range(100, 100 + args.routes))
+    start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    tz = _resolve_tz(None)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corridor.jsonl"
+        with open(path, "w", encoding="utf-8") as handle:
+            for step in range(args.days * 288):
+                ts = start + timedelta(minutes=5 * step)
+                for rid in route_ids:
+                    handle.write(_row(rid, ts, 30 + (step * 7 + rid) % 45) + "\n")
+        depart = datetime(2026, 6, 5, 15, 0)
+
+        t = time.perf_counter()
+        ref = [_rescan(rid, depart, path, tz) for rid in route_ids]
+        rescan_s = time.perf_counter() - t
+
+        index = CorridorIndex(path)
+        t = time.perf_counter()
+        index.refresh()
+        build_s = time.perf_counter() - t
+        t = time.perf_counter()
+        got = [predict_eta(rid, depart, index=index) for rid in route_ids]
+        indexed_s = time.perf_counter() - t
+        same = ref == [(g["eta_minutes"], (g["interval"]["low_minutes"], g["interval"]["high_minutes"])) for g in got]
+
+        with open(path, "a", encoding="utf-8") as handle:
+            ts = start + timedelta(minutes=5 * args.days * 288)
+            for rid in route_ids:
+                handle.write(_row(rid, ts, 41) + "\n")
+        t = time.perf_counter()
+        index.refresh()
+        tail_s = time.perf_counter() - t
+
+    print(f"log: {args.days} days x {args.routes} routes ({path.name}, {args.days * 288 * args.routes} rows)")
+    print(f"full re-read per plan   {rescan_s * 1000:9.1f} ms")
+    print(f"index build (once)      {build_s * 1000:9.1f} ms")
+    print(f"indexed per plan        {indexed_s * 1000:9.3f} ms  {rescan_s / indexed_s:6.0f}x  identical={same}")
+    print(f"refresh after one poll  {tail_s * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
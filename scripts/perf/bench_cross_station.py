@@ -0,0 +1,60 @@
+"""Benchmark cross-station consistency scoring, serial vs process pool.
+
+Builds a synthetic ``--stations`` x ``--days`` hourly design with a shared diel
+modulation and times ``_cross_station_consistency`` at each ``--workers``
+count, checking that every run returns the serial result.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_cross_station.py
+    PYTHONPATH=. python scripts/perf/bench_cross_station.py --stations 8 --workers 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from modeling.fit_kernels import _cross_station_consistency
+
+
+def _design(stations: int, days: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    t = np.arange(days * 24, dtype=float) + 0.5
+    frames = []
+    for i in range(stations):
+        diel = ((t / 24.0) + 0.01 * i) % 1.0
+        season = (t / (24.0 * 365.0)) % 1.0
+        rate = np.exp(-1.5 + np.cos(2 * np.pi * diel) + 0.3 * np.sin(2 * np.pi * season))
+        frames.append(pd.DataFrame({
+            "station": f"st{i:02d}", "t": t, "y": rng.poisson(rate).astype(float),
+            "exposure": 1.0, "diel": diel, "season": season,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=6)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = _design(args.stations, args.days, args.seed)
+    covariates = ["diel", "season"]
+    baseline = None
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        result = _cross_station_consistency(df, covariates, workers=workers)
+        elapsed = time.perf_counter() - t0
+        if baseline is None:
+            baseline = result
+        same = "identical" if result == baseline else "DIFFERS"
+        print(f"workers={workers:<3d} {elapsed:7.2f}s  ({same} to workers={args.workers[0]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the incremental (warm-started) GLM refit against a cold refit.
+
+Builds ``--stations`` stations of uniform detections over ``--years``, fits the
+served NB and Poisson GLMs, then appends ``--new-hours`` of detections (the
+nightly ``refresh_recent`` case) and refits that design cold and warm-started
+from the first fit's coefficients, as ``run_fit(incremental=True)`` does. Each
+refit is timed ``--repeats`` times (best and median; on a shared VM the
+median can be noisy, so the IRLS iteration counts of the served solve are
+printed too), and the warm and cold coefficients are checked to agree.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_incremental_fit.py
+    PYTHONPATH=. python scripts/perf/bench_incremental_fit.py --stations 6 --years 3 --new-hours 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from modeling.design import build_design
+from modeling.estimator import fit_glm
+from modeling.timeutil import from_hours, to_hours
+
+_COVARIATES = ("diel", "lunar", "season")
+
+
+def _detections(rng, t_lo: float, t_hi: float, n: int, lng: float):
+    return [{"t": from_hours(t).isoformat(), "latitude": 48.5, "longitude": lng}
+            for t in np.sort(rng.uniform(t_lo, t_hi, n))]
+
+
+def _iterations(model) -> int:
+    return int(model.result.fit_history["iteration"])
+
+
+def _timed(fit, repeats: int):
+    times = []
+    for _ in range(repeats):
+        t = time.perf_counter()
+        result = fit()
+        times.append(time.perf_counter() - t)
+    return min(times), statistics.median(times), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=3)
+    parser.add_argument("--years", type=float, default=3.0)
+    parser.add_argument("--rate", type=float, default=0.75, help="detections per hour per station")
+    parser.add_argument("--new-hours", type=float, default=6.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    t0 = to_hours("2023-01-01T00:00:00+00:00")
+    span = args.years * 365.25 * 24.0
+    history, refreshed = {}, {}
+    for i in range(args.stations):
+        lng = -123.3 + 0.1 * i
+        history[f"st{i:02d}"] = _detections(rng, t0, t0 + span, int(args.rate * span), lng)
+        new = _detections(rng, t0 + span, t0 + span + args.new_hours, max(1, int(args.rate * args.new_hours)), lng)
+        refreshed[f"st{i:02d}"] = history[f"st{i:02d}"] + new
+    before, after = build_design(history), build_design(refreshed)
+    print(f"design: {len(before)} bins, +{len(after) - len(before)} bins after {args.new_hours:g} new hours")
+
+    for family in ("negbin", "poisson"):
+        previous = fit_glm(before, covariates=_COVARIATES, n_harmonics=2, family=family)
+        start = {str(k): float(v) for k, v in previous.result.params.items()}
+        cold_best, cold_med, cold = _timed(
+            lambda: fit_glm(after, covariates=_COVARIATES, n_harmonics=2, family=family), args.repeats)
+        warm_best, warm_med, warm = _timed(
+            lambda: fit_glm(after, covariates=_COVARIATES, n_harmonics=2, family=family, start_params=start),
+            args.repeats)
+        diff = float(np.max(np.abs(cold.result.params.to_numpy() - warm.result.params.to_numpy())))
+        print(f"{family:<8s} cold {cold_best:6.3f}s (median {cold_med:.3f})  "
+              f"warm {warm_best:6.3f}s (median {warm_med:.3f})  "
+              f"speedup {cold_best / warm_best:4.1f}x  "
+              f"IRLS iterations {_iterations(cold)} -> {_iterations(warm)}  max |coef diff| {diff:.1e}")
+
+
+if __name__ == "__main__":
+    main()
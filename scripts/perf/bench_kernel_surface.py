@@ -0,0 +1,77 @@
+"""Benchmark a time x cell intensity surface: per-point ``log_intensity`` vs ``log_intensity_many``.
+
+Builds a forecaster from the local ``fitted_kernels.json`` (or a synthetic
+three-harmonic fit with ``--synthetic``), then evaluates a ``--days`` curve at
+``--step-minutes`` over a ``--cells`` grid both ways and reports the largest
+disagreement.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_kernel_surface.py
+    PYTHONPATH=. python scripts/perf/bench_kernel_surface.py --days 7 --step-minutes 15 --cells 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.aws_backend.kernel_model.serve import FittedKernels, FourierKernel, KernelForecaster
+
+
+def _synthetic_fit() -> FittedKernels:
+    return FittedKernels(
+        intercept=-2.0,
+        kernels={
+            "diel": FourierKernel(cos=[0.5, -0.2, 0.1], sin=[0.3, 0.05, -0.02]),
+            "tide": FourierKernel(cos=[0.4, 0.1], sin=[0.2, -0.1]),
+            "lunar": FourierKernel(cos=[0.1, 0.02], sin=[0.05, 0.01]),
+            "season": FourierKernel(cos=[0.3], sin=[-0.1]),
+        },
+        station_effects={"orcasound_lab": 0.2},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=float, default=1.0)
+    parser.add_argument("--step-minutes", type=float, default=15.0)
+    parser.add_argument("--cells", type=int, default=100, help="grid cells (rounded to a square)")
+    parser.add_argument("--synthetic", action="store_true", help="ignore fitted_kernels.json")
+    args = parser.parse_args()
+
+    forecaster = None if args.synthetic else KernelForecaster.from_path()
+    if forecaster is None:
+        forecaster = KernelForecaster(_synthetic_fit())
+
+    side = max(1, int(round(math.sqrt(args.cells))))
+    lats = [48.3 + 0.4 * i / side for i in range(side) for _ in range(side)]
+    lngs = [-123.4 + 0.6 * j / side for _ in range(side) for j in range(side)]
+    t0 = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    n_times = int(args.days * 24 * 60 / args.step_minutes)
+    times = [t0 + timedelta(minutes=args.step_minutes * i) for i in range(n_times)]
+    tides = [(i * args.step_minutes / 60.0 / 12.42) % 1.0 for i in range(n_times)]
+    points = n_times * len(lats)
+
+    t = time.perf_counter()
+    loop = [
+        [forecaster.log_intensity(when, lat, lng, tide_phase=tide) for lat, lng in zip(lats, lngs)]
+        for when, tide in zip(times, tides)
+    ]
+    loop_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    batched = forecaster.log_intensity_many(times, lats, lngs, tide_phases=tides)
+    batched_s = time.perf_counter() - t
+
+    err = max(abs(a - b) for row_a, row_b in zip(loop, batched) for a, b in zip(row_a, row_b))
+    print(f"{n_times} times x {len(lats)} cells = {points} points, kernels={list(forecaster.fit.kernels)}")
+    print(f"log_intensity loop   {loop_s:8.3f} s  ({loop_s / points * 1e6:6.2f} us/point)")
+    print(f"log_intensity_many   {batched_s:8.3f} s  ({batched_s / points * 1e6:6.2f} us/point)  "
+          f"speedup {loop_s / batched_s:5.1f}x")
+    print(f"max |difference|     {err:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark BAM window labelling: pairwise scan vs sorted-interval overlaps.
+
+Labels the default 3 s / 1.5 s tiling of one clip with the previous
+windows x annotations loop and with ``windows.label_windows``, and checks the
+outputs are identical. With ``--csv`` (the DCLDE-2027 collated
+Annotations.csv) the clip is the Salish soundfile with the most annotations;
+without it a ``--hours`` clip with ``--annotations`` DCLDE-like calls
+(0.3-4 s, clustered into bouts) is synthesized.
+
+Run:
+    python scripts/perf/bench_label_windows.py
+    python scripts/perf/bench_label_windows.py --csv infra/acoustic/data/corpora/dclde-2027/Annotations.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "modeling" / "acoustic"))
+
+from windows import (  # noqa: E402
+    BACKGROUND, SALISH_DCLDE_DATASETS, Annotation, _overlap_s, _scheme_label,
+    label_windows, parse_dclde_annotations, window_starts,
+)
+
+
+def _pairwise(starts, anns, scheme, win_s=3.0, min_overlap_frac=0.5):
+    """The previous per-window loop over every annotation, kept as the reference."""
+    labels = np.full(starts.size, BACKGROUND, dtype=object)
+    overlaps = np.zeros(starts.size)
+    n_concurrent = np.zeros(starts.size, dtype=np.int64)
+    min_overlap_s = min_overlap_frac * win_s
+    for i, ws in enumerate(starts):
+        we = ws + win_s
+        best_ov, best_ann, concurrent = 0.0, None, 0
+        for a in anns:
+            ov = _overlap_s(ws, we, a.t0, a.t1)
+            if ov >= min_overlap_s:
+                concurrent += 1
+            if ov > best_ov:
+                best_ov, best_ann = ov, a
+        overlaps[i] = best_ov / win_s
+        n_concurrent[i] = concurrent
+        if best_ann is not None and best_ov >= min_overlap_s:
+            labels[i] = _scheme_label(scheme, best_ann, concurrent)
+    return labels.astype(str), overlaps, n_concurrent
+
+
+def _synthetic(hours, n, rng):
+    bouts = rng.uniform(0, hours * 3600 - 600, max(1, n // 200))
+    t0 = np.sort(rng.choice(bouts, n) + rng.exponential(120.0, n))
+    dur = rng.uniform(0.3, 4.0, n)
+    anns = [Annotation(t0=float(a), t1=float(a + d), clip_id="synthetic", ecotype=str(rng.choice(["SRKW", "TKW"])))
+            for a, d in zip(t0, dur)]
+    return "synthetic", anns, float(hours * 3600)
+
+
+def _largest_clip(csv_path):
+    anns = parse_dclde_annotations(csv_path, SALISH_DCLDE_DATASETS)
+    clip = collections.Counter(a.clip_id for a in anns).most_common(1)[0][0]
+    anns = [a for a in anns if a.clip_id == clip]
+    return clip, anns, max(a.t1 for a in anns) + 3.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", type=str, default=None)
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--annotations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.csv:
+        clip, anns, duration = _largest_clip(args.csv)
+    else:
+        clip, anns, duration = _synthetic(args.hours, args.annotations, np.random.default_rng(args.seed))
+    starts = window_starts(duration)
+
+    t = time.perf_counter()
+    ref = _pairwise(starts, anns, "ecotype")
+    ref_s = time.perf_counter() - t
+    t = time.perf_counter()
+    wl = label_windows(clip, starts, anns, "ecotype")
+    new_s = time.perf_counter() - t
+    same = (np.array_equal(wl.labels, ref[0]) and np.array_equal(wl.overlap, ref[1])
+            and np.array_equal(wl.n_concurrent, ref[2]))
+
+    print(f"clip {clip}: {starts.size} windows x {len(anns)} annotations")
+    print(f"pairwise        {ref_s:8.3f}s")
+    print(f"sorted-interval {new_s:8.3f}s  {ref_s / new_s:6.0f}x  identical={same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark an S3 time-series backfill against a latency-injecting S3 stand-in.
+
+Writes ``--years`` of hourly records for ``--stations`` stations through
+``S3TimeSeriesStore`` (one ``put_series`` per station, as the ingest jobs do),
+then reads every station back, at each ``--workers`` setting. Every S3 call
+sleeps ``--latency-ms`` to model a round trip, so the timings show how much
+of the wall clock the partition pool hides. A second pass repeats the
+backfill to show the unchanged-partition skip. ``--formats`` compares NDJSON
+with the binary partition format (stored bytes and read time).
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_s3_timeseries_backfill.py
+    PYTHONPATH=. python scripts/perf/bench_s3_timeseries_backfill.py --workers 1 16 --latency-ms 40
+    PYTHONPATH=. python scripts/perf/bench_s3_timeseries_backfill.py --workers 8 --formats ndjson binary
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+import boto3
+
+from src.aws_backend.config import Settings
+from src.aws_backend.timeseries import S3TimeSeriesStore
+
+
+class LatencyS3:
+    """Minimal in-memory S3 with a fixed per-call delay."""
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+        self.objects: Dict[str, Tuple[bytes, str]] = {}
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _tick(self) -> None:
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.latency_s)
+
+    def get_object(self, Bucket, Key):
+        self._tick()
+        if Key not in self.objects:
+            raise self.exceptions.NoSuchKey(Key)
+        body, etag = self.objects[Key]
+        return {"Body": io.BytesIO(body), "ETag": etag}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None, IfMatch=None, IfNoneMatch=None):
+        self._tick()
+        etag = '"%s"' % hashlib.md5(Body).hexdigest()
+        with self.lock:
+            self.objects[Key] = (Body, etag)
+        return {"ETag": etag}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None, Delimiter=None):
+        self._tick()
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        return {"Contents": [{"Key": k, "ETag": self.objects[k][1]} for k in keys]}
+
+
+def hourly_records(years: int, station: int) -> List[dict]:
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    return [
+        {"t": (start + timedelta(hours=h)).isoformat(), "value": float((h * 7 + station) % 13)}
+        for h in range(0, years * 365 * 24, 6)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--stations", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--formats", nargs="+", default=["ndjson"], choices=["ndjson", "binary"])
+    args = parser.parse_args()
+
+    series = {f"station-{i}": hourly_records(args.years, i) for i in range(args.stations)}
+    window = (datetime(2000, 1, 1, tzinfo=timezone.utc), datetime(2100, 1, 1, tzinfo=timezone.utc))
+
+    print(f"{'format':>7} {'workers':>8} {'write_s':>8} {'rewrite_s':>10} {'read_s':>8} {'calls':>7} {'MB':>7}")
+    for fmt, workers in [(fmt, workers) for fmt in args.formats for workers in args.workers]:
+        fake = LatencyS3(args.latency_ms / 1000.0)
+        boto3.client = lambda *a, **k: fake  # the store builds its client via boto3.client
+        store = S3TimeSeriesStore(Settings(timeseries_io_workers=workers, timeseries_partition_format=fmt))
+
+        t0 = time.perf_counter()
+        for station, records in series.items():
+            store.put_series("env_currents", station, records)
+        t1 = time.perf_counter()
+        for station, records in series.items():
+            store.put_series("env_currents", station, records)
+        t2 = time.perf_counter()
+        reader = S3TimeSeriesStore(Settings(timeseries_io_workers=workers))
+        rows = sum(len(reader.get_series("env_currents", station, *window)) for station in series)
+        t3 = time.perf_counter()
+        assert rows == sum(len(records) for records in series.values())
+        stored_mb = sum(len(body) for body, _etag in fake.objects.values()) / 1e6
+        print(f"{fmt:>7} {workers:>8} {t1 - t0:>8.2f} {t2 - t1:>10.2f} {t3 - t2:>8.2f} {fake.calls:>7} {stored_mb:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark sighting dedupe + cross-validation at backfill scale.
+
+Times ``deduplicate_sightings`` followed by ``cross_validate_sightings`` (the
+pair ``state.run_ingestion`` runs on every ingest) on synthetic sightings
+scattered over the San Juan bounds across one year, at 1k / 10k / 100k
+sightings by default.
+
+Pass ``--pairwise-limit N`` to also time a pairwise scan (the pre-index
+algorithm) for sizes up to N; it is quadratic, so keep N around 10k.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_sighting_validation.py
+    PYTHONPATH=. python scripts/perf/bench_sighting_validation.py --sizes 1000 10000 --pairwise-limit 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from src.aws_backend.models import NormalizedSighting, SourceEvidence
+from src.aws_backend.validation import (
+    cross_validate_sightings,
+    deduplicate_sightings,
+    haversine_km,
+    time_score,
+)
+
+SOURCES = ["obis_verified", "inaturalist", "orcahello", "community"]
+
+
+def synthetic_sightings(count: int, seed: int = 0) -> List[NormalizedSighting]:
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    out: List[NormalizedSighting] = []
+    for index in range(count):
+        source = rng.choice(SOURCES)
+        out.append(
+            NormalizedSighting(
+                sighting_id=f"{source}:{index}",
+                source=source,
+                source_id=str(index),
+                timestamp=start + timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+                latitude=rng.uniform(48.0, 49.0),
+                longitude=rng.uniform(-123.6, -122.4),
+                confidence=rng.uniform(0.3, 0.95),
+                source_reliability=rng.uniform(0.3, 0.95),
+                evidence=[SourceEvidence(source=source, source_id=str(index))],
+            )
+        )
+    return out
+
+
+def pairwise_scan(sightings: List[NormalizedSighting], radius_km: float = 10.0, window_hours: float = 48.0) -> int:
+    """Pairwise match count, the cost profile of the pre-index cross-validation."""
+    matches = 0
+    for sighting in sightings:
+        for other in sightings:
+            if other.sighting_id == sighting.sighting_id:
+                continue
+            distance = haversine_km(sighting.latitude, sighting.longitude, other.latitude, other.longitude)
+            if distance <= radius_km and time_score(sighting.timestamp, other.timestamp, window_hours) > 0:
+                matches += 1
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--pairwise-limit", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'n':>8} {'deduped':>8} {'dedupe_s':>9} {'xval_s':>9} {'pairwise_s':>11}")
+    for size in args.sizes:
+        sightings = synthetic_sightings(size, args.seed)
+
+        t0 = time.perf_counter()
+        deduped = deduplicate_sightings(sightings)
+        t1 = time.perf_counter()
+        cross_validate_sightings(deduped)
+        t2 = time.perf_counter()
+
+        pairwise = "-"
+        if size <= args.pairwise_limit:
+            t3 = time.perf_counter()
+            pairwise_scan(deduped)
+            pairwise = f"{time.perf_counter() - t3:.2f}"
+        print(f"{size:>8} {len(deduped):>8} {t1 - t0:>9.2f} {t2 - t1:>9.2f} {pairwise:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark tide-phase lookups: per-time loop, array phases, and the phase table.
+
+Fits both tide models to ``--days`` of synthetic hourly currents and evaluates
+``--queries`` random times with the old per-element path (``phase`` in a
+loop), the vectorized ``phases`` and a ``TidePhaseTable`` lookup, reporting
+the table's largest deviation from the exact model.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_tide_phase.py
+    PYTHONPATH=. python scripts/perf/bench_tide_phase.py --days 1095 --queries 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import tempfile
+import time
+
+import numpy as np
+
+from modeling.tide_phase import HarmonicTidalPhase, TidalPhase, TidePhaseTable
+from modeling.timeutil import from_hours, to_hours
+
+
+def _timed(fn):
+    t = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--queries", type=int, default=500_000)
+    parser.add_argument("--loop-queries", type=int, default=50_000, help="subset timed with the scalar loop")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    t0 = to_hours("2024-01-01T00:00:00+00:00")
+    hours = np.arange(args.days * 24, dtype=float)
+    values = np.sin(2 * math.pi * hours / 12.4206) + 0.3 * np.sin(2 * math.pi * hours / 23.9345)
+    records = [{"t": from_hours(t0 + h).isoformat(), "value": float(v)} for h, v in zip(hours, values)]
+    queries = t0 + np.random.default_rng(args.seed).uniform(0, args.days * 24.0, args.queries)
+    loop_queries = queries[: args.loop_queries]
+
+    for name, tide in (("onset", TidalPhase.from_records(records)), ("harmonic", HarmonicTidalPhase.from_records(records))):
+        _, loop_s = _timed(lambda: [tide.phase(float(t)) for t in loop_queries])
+        exact, array_s = _timed(lambda: tide.phases(queries))
+        with tempfile.TemporaryDirectory() as tmp:
+            table, build_s = _timed(lambda: TidePhaseTable.load_or_build(tide, t0, t0 + args.days * 24.0, tmp))
+            table, load_s = _timed(lambda: TidePhaseTable.load_or_build(tide, t0, t0 + args.days * 24.0, tmp))
+            looked_up, table_s = _timed(lambda: table.phases(queries))
+        diff = np.abs(looked_up - exact)
+        err = float(np.max(np.minimum(diff, 1.0 - diff)))
+        per_loop = loop_s / len(loop_queries) * 1e9
+        print(
+            f"{name:9s} loop {per_loop:7.0f} ns/q  phases {array_s / args.queries * 1e9:6.1f} ns/q  "
+            f"table {table_s / args.queries * 1e9:6.1f} ns/q  (build {build_s:.2f}s, mmap load {load_s * 1e3:.1f}ms, "
+            f"max err {err:.2e} cycles)"
+        )
+
+
+if __name__ == "__main__":
+    main()
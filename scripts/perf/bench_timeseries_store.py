@@ -0,0 +1,57 @@
+"""Benchmark the in-process time-series stores under backfill-style appends.
+
+Appends ``--batches`` monthly batches of minute-resolution records to one
+series, then runs ``--queries`` random one-day range queries, for
+``MemoryTimeSeriesStore`` and ``ColumnarTimeSeriesStore``.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_timeseries_store.py
+    PYTHONPATH=. python scripts/perf/bench_timeseries_store.py --batches 24 --per-batch 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.aws_backend.timeseries import ColumnarTimeSeriesStore, MemoryTimeSeriesStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=12)
+    parser.add_argument("--per-batch", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    batches = []
+    for batch in range(args.batches):
+        month0 = start + timedelta(days=30 * batch)
+        batches.append([
+            {"t": (month0 + timedelta(minutes=i * 4)).isoformat(), "id": f"{batch}-{i}", "value": float(i)}
+            for i in range(args.per_batch)
+        ])
+    rng = random.Random(args.seed)
+    windows = []
+    for _ in range(args.queries):
+        t0 = start + timedelta(hours=rng.randint(0, 24 * 30 * args.batches))
+        windows.append((t0, t0 + timedelta(days=1)))
+
+    print(f"{'store':>26} {'append_s':>9} {'query_s':>9} {'rows':>9}")
+    for cls in (MemoryTimeSeriesStore, ColumnarTimeSeriesStore):
+        store = cls()
+        t0 = time.perf_counter()
+        for records in batches:
+            store.put_series("noaa", "station-1", records)
+        t1 = time.perf_counter()
+        rows = sum(len(store.get_series("noaa", "station-1", a, b)) for a, b in windows)
+        t2 = time.perf_counter()
+        print(f"{cls.__name__:>26} {t1 - t0:>9.2f} {t2 - t1:>9.2f} {rows:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark peak memory of BAM featurization: whole-file float64 read vs WavReader.
+
+Writes ``--minutes`` of synthetic 48 kHz int16 audio to a temporary WAV and
+featurizes the default 3 s / 1.5 s tiling two ways, tracing numpy allocations
+with ``tracemalloc``:
+
+* ``whole-file``: ``read_wav_mono`` (the file as float64) then
+  ``window_features`` over it, the previous ``windows_from_wav``;
+* ``streamed``: ``windows_from_wav``, which memory-maps the file and reads
+  ``READ_BLOCK_S`` float32 spans per group of windows.
+
+Peak memory of the first grows with the file; the second stays flat.
+
+Run:
+    PYTHONPATH=. python scripts/perf/bench_wav_reader.py
+    PYTHONPATH=. python scripts/perf/bench_wav_reader.py --minutes 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import scipy.io.wavfile as wavfile
+
+from modeling.acoustic.features import SR, WIN_S, HOP_S, read_wav_mono, window_features, windows_from_wav
+
+
+def _whole_file(path):
+    sr, x = read_wav_mono(path)
+    win, hop = int(WIN_S * sr), int(HOP_S * sr)
+    return window_features(x, sr, np.arange(0, len(x) - win + 1, hop), win)
+
+
+def _traced(fn):
+    tracemalloc.start()
+    t = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, elapsed, peak / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    n = int(args.minutes * 60 * SR)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "archive.wav")
+        chunk = 60 * SR
+        pcm = np.empty(n, dtype=np.int16)
+        for a in range(0, n, chunk):
+            t = np.arange(a, min(a + chunk, n)) / SR
+            pcm[a:a + t.size] = (3000 * rng.normal(size=t.size)
+                                 + 8000 * np.sin(2 * np.pi * (3000 + 2000 * np.sin(t / 3)) * t)).astype(np.int16)
+        wavfile.write(path, SR, pcm)
+        del pcm
+
+        ref, ref_s, ref_mb = _traced(lambda: _whole_file(path))
+        (got, _), got_s, got_mb = _traced(lambda: windows_from_wav(path))
+
+    dev = float(np.max(np.abs(got - ref) / np.maximum(np.abs(ref), 1e-12)))
+    print(f"{ref.shape[0]} windows over {args.minutes:g} min ({n * 2 / 2 ** 20:.0f} MB int16 on disk)")
+    print(f"whole-file {ref_s:7.2f}s  peak {ref_mb:8.1f} MB")
+    print(f"streamed   {got_s:7.2f}s  peak {got_mb:8.1f} MB  max rel dev {dev:.1e} (float32 samples)")
+
+
+if __name__ == "__main__":
+    main()
@@ -175,12 +175,18 @@ def _connection_clients() -> Any:
     ``corridor.predict_eta`` (wrong arity and field names for the connections
     contract), so the adapter replaces it with the reconciled single-corridor
     callable. The WSF / flight / seaplane adapters keep their default wiring and
-    degrade to empty when their access codes are unset.
+    degrade to empty when their access codes are unset. With
+    ``ORCAST_CONNECTION_CACHE=true`` the WSF and corridor feeds are shared
+    across plans through the process-wide upstream cache.
     """
+    from ..config import settings
     from .trips.connections import ConnectionClients
+    from .trips.upstream_cache import cached_clients
 
     clients = ConnectionClients.default()
     clients.predict_eta = _corridor_eta_adapter()
+    if settings.connection_cache:
+        clients = cached_clients(clients)
     return clients
 
 
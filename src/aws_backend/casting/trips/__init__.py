@@ -6,11 +6,13 @@ W2 source clients, the corridor traffic model, and the flight/seaplane
 adapters, attaching per-leg honesty labels, a composite label, and a freshness
 stamp. The phase-B planner branch (``planner.py``) imports
 :func:`plan_connection` and attaches its output to the ``connections_plan``
-panel props.
+panel props. :func:`cached_clients` puts the feeds behind a shared,
+TTL-bounded, single-flight response cache.
 """
 
 from __future__ import annotations
 
 from .connections import ConnectionClients, plan_connection
+from .upstream_cache import UpstreamCache, cached_clients
 
-__all__ = ["plan_connection", "ConnectionClients"]
+__all__ = ["plan_connection", "ConnectionClients", "UpstreamCache", "cached_clients"]
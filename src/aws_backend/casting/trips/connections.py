@@ -208,6 +208,16 @@ def _clock(dt: Optional[datetime]) -> Optional[str]:
     return dt.strftime("%H:%M") if dt else None
 
 
+def _with_age(fn: Callable[..., Any], *args: Any) -> Any:
+    """Call ``fn`` and pair its result with the age of that result in seconds.
+
+    The age is ``None`` unless ``fn`` reports one (``last_age_s``, set by the
+    shared upstream cache), i.e. the result is taken to be fetched just now.
+    """
+    value = fn(*args)
+    return value, getattr(fn, "last_age_s", None)
+
+
 def _youngest(stamps: Sequence[Any]) -> Optional[str]:
     """Most recent timestamp among ``stamps`` (ISO strings / datetimes)."""
     parsed = [d for d in (_parse_dt(s) for s in stamps) if d is not None]
@@ -764,10 +774,11 @@ def plan_connection(
             fetch_tasks["ferry_schedule"] = (
                 lambda: clients.schedule(int(route_id), trip_date)
             )
-        fetch_tasks["ferry_spaces"] = lambda: clients.sailing_space(dep_term)
+        fetch_tasks["ferry_spaces"] = lambda: _with_age(clients.sailing_space, dep_term)
         fetch_tasks["ferry_vessels"] = lambda: clients.vessel_locations()
 
         fetched = fetch_legs_concurrently(fetch_tasks)
+        spaces, spaces_age_s = fetched.get("ferry_spaces") or (None, None)
 
         drive_leg = _build_drive_leg(
             clients,
@@ -786,12 +797,14 @@ def plan_connection(
             schedule=(
                 fetched["ferry_schedule"] if "ferry_schedule" in fetched else _UNSET
             ),
-            spaces=fetched.get("ferry_spaces"),
+            spaces=spaces,
             vessels=fetched.get("ferry_vessels"),
         )
         # Stamp measured freshness from the live ferry signals actually used.
+        # A sailing-space response served from the upstream cache is as old as
+        # its fetch, not the plan.
         if ferry_leg.get("space") is not None:
-            measured_stamps.append(now)
+            measured_stamps.append(now - timedelta(seconds=spaces_age_s or 0.0))
         if ferry_leg.get("vessel") is not None:
             measured_stamps.append(ferry_leg["vessel"].get("timestamp"))
         ferry_for_plan = {k: v for k, v in ferry_leg.items() if k != "sailing_dt"}
@@ -0,0 +1,178 @@
+"""Shared, TTL-bounded, single-flight cache for the connection planner's feeds.
+
+Every ``plan_connection`` call fans out the same four upstream requests (WSF
+schedule / sailing space / vessel locations and the corridor ETA). When many
+sessions plan the same route and date within a minute, those requests are
+identical. :func:`cached_clients` wraps a :class:`ConnectionClients` bundle so
+those four feeds go through one process-wide :class:`UpstreamCache`:
+
+- a response is reused while it is younger than its feed's TTL
+  (:data:`FEED_TTL_S`, matched to how often the feed actually changes);
+- concurrent identical calls are coalesced: one caller fetches, the others wait
+  for that result instead of issuing their own request (single flight);
+- empty results (the adapters' "unknown" / failure sentinel) and exceptions are
+  shared with waiters but never cached, so a recovered upstream is seen on
+  the next call.
+
+Honesty: a cached value is not a fresh reading. Each wrapped feed reports the
+age of the value it last returned on the calling thread (``last_age_s``); a
+fresh fetch, or one shared while in flight, is age ``0``. ``plan_connection``
+backdates its measured freshness stamp by that age, so ``_youngest`` reports
+when the data was fetched, not when it was served.
+
+Cached values are shared between plans and must be treated as read-only; the
+leg builders only read them.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from .connections import ConnectionClients
+
+# Seconds a response stays fresh, per ConnectionClients field. WSF sailing
+# space and vessel locations update every ~5 s; schedules are published per
+# day; the corridor model only changes when tools/corridor_poll.py appends a
+# reading (every 300 s).
+FEED_TTL_S: Dict[str, float] = {
+    "schedule": 600.0,
+    "sailing_space": 5.0,
+    "vessel_locations": 5.0,
+    "predict_eta": 300.0,
+}
+
+_DEFAULT_MAX_ENTRIES = 256
+
+_Key = Tuple[str, Hashable]
+
+
+@dataclasses.dataclass
+class _Entry:
+    value: Any
+    fetched: float
+
+
+class UpstreamCache:
+    """Per-(feed, arguments) response cache with TTLs and in-flight coalescing."""
+
+    def __init__(
+        self,
+        ttl_s: Optional[Mapping[str, float]] = None,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_s = dict(FEED_TTL_S if ttl_s is None else ttl_s)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._inflight: Dict[_Key, Future] = {}
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+    def fetch(self, feed: str, args: Hashable, loader: Callable[[], Any]) -> Tuple[Any, float]:
+        """Return ``(value, age_s)`` for ``feed(*args)``, calling ``loader`` at most once.
+
+        ``age_s`` is how long ago a cached value was fetched, or ``0.0`` when
+        the value was fetched by this call or shared from an in-flight one.
+        An exception from ``loader`` is raised in every coalesced caller.
+        """
+        key = (feed, args)
+        ttl = self.ttl_s.get(feed, 0.0)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self._clock() - entry.fetched
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry.value, age
+                del self._entries[key]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                started = self._clock()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            return future.result(), 0.0
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            if value and ttl > 0:
+                self._entries[key] = _Entry(value, started)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value, 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachedFeed:
+    """A ``ConnectionClients`` callable routed through an :class:`UpstreamCache`."""
+
+    def __init__(self, cache: UpstreamCache, feed: str, fn: Callable[..., Any]) -> None:
+        self.cache = cache
+        self.feed = feed
+        self.fn = fn
+        self._local = threading.local()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self._local.age = None
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:  # unhashable arguments: not cacheable, call through
+            return self.fn(*args, **kwargs)
+        value, self._local.age = self.cache.fetch(self.feed, key, lambda: self.fn(*args, **kwargs))
+        return value
+
+    @property
+    def last_age_s(self) -> Optional[float]:
+        """Age of the value this feed last returned on the calling thread."""
+        return getattr(self._local, "age", None)
+
+
+_shared: Optional[UpstreamCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> UpstreamCache:
+    """The process-wide cache used by the planner's connection clients."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = UpstreamCache()
+        return _shared
+
+
+def cached_clients(
+    clients: ConnectionClients, cache: Optional[UpstreamCache] = None
+) -> ConnectionClients:
+    """A copy of ``clients`` whose cacheable feeds go through ``cache`` (default: shared)."""
+    cache = cache or shared_cache()
+    wrapped = {
+        feed: _CachedFeed(cache, feed, getattr(clients, feed))
+        for feed in cache.ttl_s
+        if hasattr(clients, feed)
+    }
+    return dataclasses.replace(clients, **wrapped)
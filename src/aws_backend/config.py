@@ -58,6 +58,40 @@ class Settings:
     # Hard per-stream wall-clock cap (seconds): bounds a stuck Bedrock stream on
     # the backend independent of the Vercel maxDuration on the proxy leg.
     stream_max_seconds: int = int(os.getenv("ORCAST_STREAM_MAX_SECONDS", "30"))
+    # Cell size (degrees) of the optional rasterized land/water mask over the
+    # pilot bounds. 0 disables it and every query uses the exact polygon tests.
+    water_mask_resolution_deg: float = float(os.getenv("ORCAST_WATER_MASK_RESOLUTION_DEG", "0"))
+    # In-process time-series layout when storage is not AWS: "memory" keeps
+    # sorted dict records, "columnar" keeps sorted epoch/column arrays with a
+    # bisect index (see timeseries.ColumnarTimeSeriesStore).
+    timeseries_backend: str = os.getenv("ORCAST_TIMESERIES_BACKEND", "memory")
+    # Thread-pool size for concurrent monthly-partition reads/writes in the S3
+    # time-series store. 1 restores strictly sequential round trips.
+    timeseries_io_workers: int = int(os.getenv("ORCAST_TIMESERIES_IO_WORKERS", "8"))
+    # Format new S3 time-series partitions are written in: "ndjson" or
+    # "binary" (compressed columnar .tsb, see timeseries_partition). Reads
+    # accept both, so this can be flipped before migrating old months.
+    timeseries_partition_format: str = os.getenv("ORCAST_TIMESERIES_PARTITION_FORMAT", "ndjson")
+    # Thread-pool size for concurrent source fetches in run_ingestion. 1
+    # restores strictly sequential fetches.
+    ingestion_workers: int = int(os.getenv("ORCAST_INGESTION_WORKERS", "4"))
+    # Per-source fetch deadline (seconds) for concurrent ingestion; a source
+    # that overruns is reported unavailable. 0 disables deadlines.
+    ingestion_deadline_s: float = float(os.getenv("ORCAST_INGESTION_DEADLINE_S", "0"))
+    # Source-adapter HTTP: "direct" calls requests.get per request; "pooled"
+    # routes through sources.transport (keep-alive pools, conditional GETs,
+    # retries with jitter, per-source concurrency limits).
+    http_transport: str = os.getenv("ORCAST_HTTP_TRANSPORT", "direct").lower()
+    http_max_retries: int = int(os.getenv("ORCAST_HTTP_MAX_RETRIES", "2"))
+    http_source_concurrency: int = int(os.getenv("ORCAST_HTTP_SOURCE_CONCURRENCY", "4"))
+    # NOAA history backfill (noaa_backfill): concurrent chunk fetches, the
+    # shared request rate across them, and an optional JSON checkpoint path
+    # that lets an interrupted backfill_all resume. Empty keeps no checkpoint.
+    noaa_backfill_workers: int = int(os.getenv("ORCAST_NOAA_BACKFILL_WORKERS", "4"))
+    noaa_backfill_rate_per_s: float = float(os.getenv("ORCAST_NOAA_BACKFILL_RATE_PER_S", "2"))
+    noaa_backfill_checkpoint: str = os.getenv("ORCAST_NOAA_BACKFILL_CHECKPOINT", "")
+    # Share WSF / corridor responses across connection plans (trips.upstream_cache).
+    connection_cache: bool = os.getenv("ORCAST_CONNECTION_CACHE", "false").lower() == "true"
     cors_origins_raw: str = os.getenv("ORCAST_CORS_ORIGINS", "*")
     repo_root: Path = Path(os.getenv("ORCAST_REPO_ROOT", Path(__file__).resolve().parents[2]))
 
@@ -10,6 +10,21 @@ FeatureCollection of island Polygon features with ``[lng, lat]`` rings). If the
 file is missing the helpers degrade to permissive behavior (everything in bounds
 is treated as water) and log a warning, so ingestion never hard-fails on a
 missing mask.
+
+The rings are prepared once at import: each ring keeps its bounding box and its
+edges bucketed into latitude slabs, ring boxes sit in a packed (STR) R-tree,
+and shoreline vertices sit in a KD-tree on the unit sphere. The prepared tests
+return exactly what the plain ray-cast / vertex scan would; they just skip the
+rings, edges and vertices that cannot matter. ``is_on_land_many`` and
+``nearest_shore_m_many`` are the batch forms for grid builders.
+
+With ``ORCAST_WATER_MASK_RESOLUTION_DEG`` set, a rasterized mask over
+``SAN_JUAN_BOUNDS`` (see ``water_mask``) answers land/water questions with one
+array index for every cell no coastline touches; coastline cells fall back to
+the exact tests. ``nearest_shore_m`` then reads the mask's distance field, which
+is exact at cell centres and otherwise within half a cell diagonal. The mask is
+loaded or built by ``warm_water_mask`` at API startup, off the request path;
+until it is ready the exact tests answer.
 """
 
 from __future__ import annotations
@@ -17,11 +32,13 @@ from __future__ import annotations
 import json
 import logging
 import math
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 from .config import settings
+from .water_mask import LAND, WATER, WaterMask
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +111,268 @@ def _load_land_polygons() -> List[List[Tuple[float, float]]]:
 
 _LAND_RINGS: List[List[Tuple[float, float]]] = _load_land_polygons()
 
+# A crossing x can overshoot its edge's extent only by float rounding, so boxes
+# are padded by this much (degrees) before they are allowed to reject a point.
+_BOX_PAD_DEG = 1e-9
+# Maximum edges per latitude slab we aim for when preparing a ring.
+_EDGES_PER_SLAB = 4
+_MAX_SLABS = 256
+_TREE_NODE_SIZE = 8
+
+
+class _PreparedRing:
+    """A land ring with its bounding box and edges bucketed by latitude.
+
+    An edge can only toggle the ray-cast when ``min(yi, yj) <= lat < max(yi, yj)``,
+    so a query only has to look at the slab holding its latitude.
+    """
+
+    __slots__ = ("min_lng", "min_lat", "max_lng", "max_lat", "_slab_h", "_slabs")
+
+    def __init__(self, ring: List[Tuple[float, float]]) -> None:
+        xs = [pt[0] for pt in ring]
+        ys = [pt[1] for pt in ring]
+        self.min_lng, self.max_lng = min(xs), max(xs)
+        self.min_lat, self.max_lat = min(ys), max(ys)
+        count = len(ring)
+        n_slabs = max(1, min(_MAX_SLABS, count // _EDGES_PER_SLAB))
+        self._slab_h = (self.max_lat - self.min_lat) / n_slabs or 1.0
+        self._slabs: List[List[Tuple[float, float, float, float, float]]] = [[] for _ in range(n_slabs)]
+        j = count - 1
+        for i in range(count):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            if yi != yj:  # horizontal edges never satisfy the crossing test
+                edge = (xi, yi, yj, xj - xi, yj - yi)
+                for slab in range(self._slab(min(yi, yj)), self._slab(max(yi, yj)) + 1):
+                    self._slabs[slab].append(edge)
+            j = i
+
+    def _slab(self, lat: float) -> int:
+        return min(len(self._slabs) - 1, max(0, int((lat - self.min_lat) / self._slab_h)))
+
+    def contains(self, lat: float, lng: float) -> bool:
+        if not (self.min_lat <= lat < self.max_lat):
+            return False
+        if lng < self.min_lng - _BOX_PAD_DEG or lng > self.max_lng + _BOX_PAD_DEG:
+            # Outside the box every crossing lies on one side: an even count.
+            return False
+        inside = False
+        for xi, yi, yj, dx, denom in self._slabs[self._slab(lat)]:
+            if (yi > lat) != (yj > lat) and lng < dx * (lat - yi) / denom + xi:
+                inside = not inside
+        return inside
+
+
+class _BoxTree:
+    """Static sort-tile-recursive packed R-tree over ``(min_x, min_y, max_x, max_y)`` boxes."""
+
+    def __init__(self, boxes: Sequence[Tuple[float, float, float, float]], node_size: int = _TREE_NODE_SIZE) -> None:
+        self._node_size = node_size
+        # Each level is a list of (box, children); leaves hold item indices.
+        level: List[Tuple[Tuple[float, float, float, float], List[int]]] = self._pack(
+            [(box, index) for index, box in enumerate(boxes)]
+        )
+        self._levels = [level]
+        while len(level) > 1:
+            level = self._pack([(box, index) for index, (box, _children) in enumerate(level)])
+            self._levels.append(level)
+
+    def _pack(self, entries):
+        if not entries:
+            return []
+        size = self._node_size
+        n_nodes = math.ceil(len(entries) / size)
+        n_slices = max(1, math.ceil(math.sqrt(n_nodes)))
+        by_x = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+        per_slice = n_slices * size
+        nodes = []
+        for start in range(0, len(by_x), per_slice):
+            column = sorted(by_x[start:start + per_slice], key=lambda e: e[0][1] + e[0][3])
+            for offset in range(0, len(column), size):
+                group = column[offset:offset + size]
+                box = (
+                    min(e[0][0] for e in group),
+                    min(e[0][1] for e in group),
+                    max(e[0][2] for e in group),
+                    max(e[0][3] for e in group),
+                )
+                nodes.append((box, [e[1] for e in group]))
+        return nodes
+
+    def query_point(self, x: float, y: float) -> Iterator[int]:
+        """Yield every item index whose box contains ``(x, y)``."""
+        if not self._levels or not self._levels[0]:
+            return
+        top = len(self._levels) - 1
+        stack = [(top, index) for index in range(len(self._levels[top]))]
+        while stack:
+            depth, index = stack.pop()
+            (min_x, min_y, max_x, max_y), children = self._levels[depth][index]
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            if depth == 0:
+                yield from children
+            else:
+                stack.extend((depth - 1, child) for child in children)
+
+
+def _unit_vector(lat: float, lng: float) -> Tuple[float, float, float]:
+    phi = math.radians(lat)
+    lam = math.radians(lng)
+    return (math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi))
+
+
+class _ShoreKDTree:
+    """KD-tree over shoreline vertices as unit vectors.
+
+    Chord length on the unit sphere is monotonic in great-circle distance, so
+    the chord-nearest vertices are the haversine-nearest ones. The final answer
+    is still taken with ``_distance_km`` over every vertex within a hair of the
+    best chord, so it equals a full vertex scan.
+    """
+
+    def __init__(self, vertices: Sequence[Tuple[float, float]]) -> None:
+        self._latlng = list(vertices)
+        self._points = [_unit_vector(lat, lng) for lat, lng in self._latlng]
+        # Node layout: (point index, split axis, left node, right node).
+        self._nodes: List[Tuple[int, int, int, int]] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def _build(self, indices: List[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        node = len(self._nodes)
+        self._nodes.append((indices[mid], axis, -1, -1))
+        left = self._build(indices[:mid], depth + 1)
+        right = self._build(indices[mid + 1:], depth + 1)
+        self._nodes[node] = (indices[mid], axis, left, right)
+        return node
+
+    def _within(self, target: Tuple[float, float, float], radius_sq: float) -> List[int]:
+        found: List[int] = []
+        tx, ty, tz = target
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                continue
+            index, axis, left, right = self._nodes[node]
+            px, py, pz = self._points[index]
+            if (px - tx) ** 2 + (py - ty) ** 2 + (pz - tz) ** 2 <= radius_sq:
+                found.append(index)
+            diff = target[axis] - self._points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append(near)
+            if diff * diff <= radius_sq:
+                stack.append(far)
+        return found
+
+    def _nearest_sq(self, target: Tuple[float, float, float]) -> float:
+        best = math.inf
+        tx, ty, tz = target
+        # Entries carry the squared distance to their splitting plane and are
+        # pruned when popped, against the best found so far.
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, plane_sq = stack.pop()
+            if node < 0 or plane_sq > best:
+                continue
+            index, axis, left, right = self._nodes[node]
+            px, py, pz = self._points[index]
+            dist_sq = (px - tx) ** 2 + (py - ty) ** 2 + (pz - tz) ** 2
+            if dist_sq < best:
+                best = dist_sq
+            diff = target[axis] - self._points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, diff * diff))
+            stack.append((near, plane_sq))
+        return best
+
+    def nearest_km(self, lat: float, lng: float) -> float:
+        if self._root < 0:
+            return math.inf
+        target = _unit_vector(lat, lng)
+        best_sq = self._nearest_sq(target)
+        slack = best_sq * (1.0 + 1e-6) + 1e-18
+        return min(
+            (_distance_km(lat, lng, *self._latlng[i]) for i in self._within(target, slack)),
+            default=math.inf,
+        )
+
+
+class _PreparedLand:
+    """Import-time prepared form of ``_LAND_RINGS``."""
+
+    def __init__(self, rings: List[List[Tuple[float, float]]]) -> None:
+        self.rings = [_PreparedRing(ring) for ring in rings]
+        self.tree = _BoxTree(
+            [
+                (r.min_lng - _BOX_PAD_DEG, r.min_lat, r.max_lng + _BOX_PAD_DEG, r.max_lat)
+                for r in self.rings
+            ]
+        )
+        self.shore = _ShoreKDTree([(lat, lng) for ring in rings for lng, lat in ring])
+
+    def is_on_land(self, lat: float, lng: float) -> bool:
+        return any(self.rings[index].contains(lat, lng) for index in self.tree.query_point(lng, lat))
+
+
+_PREPARED_LAND = _PreparedLand(_LAND_RINGS)
+
+# Raster mask, built once by ``warm_water_mask``; ``False`` records "disabled
+# or unavailable". Until the build finishes, queries use the exact tests.
+_WATER_MASK: "WaterMask | None | bool" = None
+_WATER_MASK_LOCK = threading.Lock()
+
+
+def _water_mask() -> Optional[WaterMask]:
+    mask = _WATER_MASK
+    return mask if isinstance(mask, WaterMask) else None
+
+
+def _build_water_mask() -> None:
+    global _WATER_MASK
+    with _WATER_MASK_LOCK:
+        if _WATER_MASK is not None:
+            return
+        mask: "WaterMask | bool" = False
+        resolution = settings.water_mask_resolution_deg
+        path = _resolve_geojson_path()
+        if resolution > 0 and _LAND_RINGS and path.exists():
+            try:
+                mask = WaterMask.load_or_build(
+                    path,
+                    (SAN_JUAN_BOUNDS.min_lat, SAN_JUAN_BOUNDS.max_lat, SAN_JUAN_BOUNDS.min_lng, SAN_JUAN_BOUNDS.max_lng),
+                    resolution,
+                    _LAND_RINGS,
+                    _PREPARED_LAND.is_on_land,
+                    _PREPARED_LAND.shore.nearest_km,
+                )
+            except Exception as exc:
+                logger.warning("Failed to build water mask from %s: %s; using exact tests", path, exc)
+        _WATER_MASK = mask
+
+
+def warm_water_mask(background: bool = True) -> Optional[threading.Thread]:
+    """Load or build the raster water mask when it is enabled.
+
+    The API calls this at startup so the build runs on a daemon thread and no
+    request pays for it; queries answered before it finishes use the exact
+    tests. Scripts that want the mask for a batch pass ``background=False``.
+    """
+    if settings.water_mask_resolution_deg <= 0 or _WATER_MASK is not None:
+        return None
+    if not background:
+        _build_water_mask()
+        return None
+    thread = threading.Thread(target=_build_water_mask, name="orcast-water-mask", daemon=True)
+    thread.start()
+    return thread
+
 
 def in_bounds(lat: float, lng: float) -> bool:
     """True when a point is inside the archipelago bounding box."""
@@ -133,10 +412,21 @@ def is_on_land(lat: float, lng: float) -> bool:
         lng = float(lng)
     except (TypeError, ValueError):
         return False
-    for ring in _LAND_RINGS:
-        if _point_in_ring(lat, lng, ring):
+    mask = _water_mask()
+    if mask is not None:
+        cell_class = mask.cell_class(lat, lng)
+        if cell_class == WATER:
+            return False
+        if cell_class == LAND:
             return True
-    return False
+    return _PREPARED_LAND.is_on_land(lat, lng)
+
+
+def is_on_land_many(lats: Sequence[float], lngs: Sequence[float]) -> List[bool]:
+    """Batch form of :func:`is_on_land` for parallel coordinate sequences."""
+    if len(lats) != len(lngs):
+        raise ValueError("lats and lngs must have the same length")
+    return [is_on_land(lat, lng) for lat, lng in zip(lats, lngs)]
 
 
 def is_in_water(lat: float, lng: float) -> bool:
@@ -207,14 +497,23 @@ def nearest_shore_m(lat: float, lng: float) -> Optional[float]:
         return None
     if not in_bounds(lat, lng):
         return None
+    mask = _water_mask()
+    if mask is not None and mask.cell_class(lat, lng) in (WATER, LAND):
+        field = mask.shore_m(lat, lng)
+        if field is not None:
+            return round(field, 1)
     if is_on_land(lat, lng):
         return 0.0
     if not _LAND_RINGS:
         return None
-    best_km = math.inf
-    for ring in _LAND_RINGS:
-        for xi, yi in ring:
-            best_km = min(best_km, _distance_km(lat, lng, yi, xi))
+    best_km = _PREPARED_LAND.shore.nearest_km(lat, lng)
     if not math.isfinite(best_km):
         return None
     return round(best_km * 1000.0, 1)
+
+
+def nearest_shore_m_many(lats: Sequence[float], lngs: Sequence[float]) -> List[Optional[float]]:
+    """Batch form of :func:`nearest_shore_m` for parallel coordinate sequences."""
+    if len(lats) != len(lngs):
+        raise ValueError("lats and lngs must have the same length")
+    return [nearest_shore_m(lat, lng) for lat, lng in zip(lats, lngs)]
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from .config import settings
+from .noaa_backfill import WATER_LEVEL_PRODUCT, BackfillCheckpoint, backfill_noaa
 from .sources.noaa import NoaaAdapter
 from .sources.ndbc import NdbcAdapter
 from .sources.obis import LiveObisAdapter
@@ -150,6 +151,46 @@ def ingest_noaa_history(
     return {"stream": "noaa", "stations": stations, "records": total}
 
 
+def backfill_noaa_history(
+    begin: datetime,
+    end: datetime,
+    noaa: Optional[Any] = None,
+    store: Optional[Any] = None,
+    checkpoint: Optional[BackfillCheckpoint] = None,
+) -> Dict[str, Any]:
+    """Parallel, resumable variant of :func:`ingest_noaa_history` for long ranges.
+
+    Chunks are fetched concurrently under ``settings.noaa_backfill_rate_per_s``
+    and written as they complete; completed chunks are checkpointed (at
+    ``settings.noaa_backfill_checkpoint`` unless ``checkpoint`` is given) and
+    failed ones are reported under ``missing``. Adapters without
+    ``fetch_chunk`` fall back to :func:`ingest_noaa_history`.
+    """
+    ts = _resolve_store(store)
+    noaa = noaa or NoaaAdapter()
+    if not hasattr(noaa, "fetch_chunk"):
+        return ingest_noaa_history(begin, end, noaa=noaa, store=ts)
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint(settings.noaa_backfill_checkpoint or None)
+
+    def write(chunk, records):
+        stream = WATER_LEVEL if chunk.product == WATER_LEVEL_PRODUCT else CURRENTS
+        return ts.put_series(stream, chunk.station, records)
+
+    summary = backfill_noaa(
+        noaa,
+        write,
+        begin,
+        end,
+        water_stations=[noaa.station],
+        current_stations=list(getattr(noaa, "current_stations", [noaa.current_station])),
+        workers=settings.noaa_backfill_workers,
+        rate_per_s=settings.noaa_backfill_rate_per_s,
+        checkpoint=checkpoint,
+    )
+    return {"stream": "noaa", **summary}
+
+
 def ingest_salmon(
     years: List[int],
     salmon: Optional[Any] = None,
@@ -370,7 +411,7 @@ def backfill_all(
     return [
         ingest_acoustic_history(adapter=acoustic, store=store),
         ingest_acoustic_reviewed_outcomes(adapter=acoustic, store=store),
-        ingest_noaa_history(begin, now, noaa=noaa, store=store),
+        backfill_noaa_history(begin, now, noaa=noaa, store=store),
         ingest_salmon(years, salmon=salmon, store=store),
         ingest_station_uptime(hydrophones_adapter=hydrophones, store=store),
         ingest_ndbc_realtime(adapter=ndbc, store=store),
@@ -0,0 +1,145 @@
+"""Concurrent source-adapter fan-out for ``state.run_ingestion``.
+
+Each enabled adapter's blocking ``fetch()`` runs on a small bounded thread
+pool, so an ingestion run takes about as long as its slowest upstream rather
+than the sum of all of them. Everything after the fetch (raw-payload
+persistence, normalization, the status row) happens on the calling thread as
+each source completes, so storage and the run record are only ever touched
+from one thread and a slow source no longer delays the others' processing.
+
+Outcomes are returned in plan order, not completion order, so the merged
+sighting list (and everything derived from it) is identical to the
+sequential path. A plan entry may carry a ``fallback`` adapter that is
+fetched only if the primary comes back unavailable or empty; it is slotted
+directly after the primary, preserving the OBIS live-then-local ordering.
+
+A fetch that misses its deadline is reported as an unavailable source with a
+deadline error and no records. Its thread cannot be interrupted; it finishes
+in the background and its result is discarded. Deadlines count from
+submission, so with fewer workers than sources they include queueing time.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .models import NormalizedSighting, SourceStatus
+from .sources.base import SourceAdapter, SourceFetchResult
+
+RawPayloadWriter = Callable[[str, Any], Optional[str]]
+
+
+@dataclass(frozen=True)
+class SourcePlan:
+    """One source to ingest, with an optional adapter to try if it yields nothing."""
+
+    adapter: SourceAdapter
+    fallback: Optional[SourceAdapter] = None
+
+
+@dataclass
+class SourceOutcome:
+    adapter: SourceAdapter
+    result: SourceFetchResult
+    sightings: List[NormalizedSighting]
+    status: SourceStatus
+
+
+def _timed_fetch(adapter: SourceAdapter) -> Tuple[SourceFetchResult, float]:
+    started = time.perf_counter()
+    result = adapter.fetch()
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def _complete(
+    adapter: SourceAdapter,
+    result: SourceFetchResult,
+    latency_ms: float,
+    write_raw: RawPayloadWriter,
+) -> SourceOutcome:
+    """Persist the raw payload, normalize, and build the status row."""
+    raw_payload_ref = write_raw(adapter.source_name, result.raw) if result.raw is not None else None
+    normalized = adapter.normalize(result)
+    if raw_payload_ref:
+        for sighting in normalized:
+            for evidence in sighting.evidence:
+                evidence.raw_payload_ref = raw_payload_ref
+    status = adapter.status(result, len(normalized))
+    status.latency_ms = round(latency_ms, 1)
+    return SourceOutcome(adapter=adapter, result=result, sightings=normalized, status=status)
+
+
+def _needs_fallback(outcome: SourceOutcome) -> bool:
+    return not outcome.result.available or not outcome.sightings
+
+
+def _missed_deadline(adapter: SourceAdapter, deadline_s: float) -> SourceFetchResult:
+    return SourceFetchResult(
+        source=adapter.source_name,
+        available=False,
+        error=f"fetch exceeded the {deadline_s:g}s ingestion deadline",
+    )
+
+
+def fetch_sources(
+    plans: Sequence[SourcePlan],
+    write_raw: RawPayloadWriter,
+    *,
+    max_workers: int = 4,
+    deadline_s: float = 0.0,
+) -> List[SourceOutcome]:
+    """Fetch every planned source and return the outcomes in plan order.
+
+    ``write_raw(source_name, raw)`` persists a raw payload and returns its
+    reference. ``max_workers <= 1`` runs the plans inline, one after another
+    (no deadlines). ``deadline_s <= 0`` disables deadlines; an adapter's own
+    ``fetch_deadline_s`` overrides ``deadline_s``. An exception raised by a
+    fetch propagates, as it does on the sequential path.
+    """
+    slots: Dict[Tuple[int, int], SourceOutcome] = {}
+    if max_workers <= 1 or len(plans) <= 1:
+        for i, plan in enumerate(plans):
+            slots[(i, 0)] = _complete(plan.adapter, *_timed_fetch(plan.adapter), write_raw)
+            if plan.fallback is not None and _needs_fallback(slots[(i, 0)]):
+                slots[(i, 1)] = _complete(plan.fallback, *_timed_fetch(plan.fallback), write_raw)
+        return [slots[key] for key in sorted(slots)]
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(plans)), thread_name_prefix="ingest")
+    pending: Dict[Future, Tuple[Tuple[int, int], SourceAdapter, Optional[float]]] = {}
+
+    def submit(slot: Tuple[int, int], adapter: SourceAdapter) -> None:
+        limit = adapter.fetch_deadline_s or deadline_s
+        due = time.monotonic() + limit if limit and limit > 0 else None
+        pending[executor.submit(_timed_fetch, adapter)] = (slot, adapter, due)
+
+    abandoned = False
+    try:
+        for i, plan in enumerate(plans):
+            submit((i, 0), plan.adapter)
+        while pending:
+            dues = [due for _, _, due in pending.values() if due is not None]
+            timeout = max(0.0, min(dues) - time.monotonic()) if dues else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in list(pending):
+                slot, adapter, due = pending[future]
+                if future in done:
+                    result, latency_ms = future.result()
+                elif due is not None and now >= due:
+                    abandoned = True
+                    limit = adapter.fetch_deadline_s or deadline_s
+                    result, latency_ms = _missed_deadline(adapter, limit), limit * 1000.0
+                else:
+                    continue
+                del pending[future]
+                slots[slot] = outcome = _complete(adapter, result, latency_ms, write_raw)
+                fallback = plans[slot[0]].fallback if slot[1] == 0 else None
+                if fallback is not None and _needs_fallback(outcome):
+                    submit((slot[0], 1), fallback)
+    finally:
+        # Leave overrunning fetches to finish on their own; never block on them.
+        executor.shutdown(wait=not abandoned, cancel_futures=True)
+    return [slots[key] for key in sorted(slots)]
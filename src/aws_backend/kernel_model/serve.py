@@ -30,7 +30,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 from .. import covariates
 from ..config import settings
@@ -150,6 +150,34 @@ class FourierKernel:
             total += s * math.sin(2.0 * math.pi * h * p)
         return total
 
+    def values(self, phases: Sequence[float]) -> List[float]:
+        """Evaluate the kernel at every phase in one pass over a harmonic basis.
+
+        Each phase costs one ``cos``/``sin`` pair; the higher harmonics come
+        from the angle-addition recurrence, so results agree with
+        :meth:`value` to float rounding rather than bit for bit.
+        """
+        n_harmonics = max(len(self.cos), len(self.sin))
+        if n_harmonics == 0:
+            return [0.0] * len(phases)
+        cos_coef = list(self.cos) + [0.0] * (n_harmonics - len(self.cos))
+        sin_coef = list(self.sin) + [0.0] * (n_harmonics - len(self.sin))
+        terms = list(zip(cos_coef, sin_coef))[1:]
+        c0, s0 = cos_coef[0], sin_coef[0]
+        two_pi = 2.0 * math.pi
+        out: List[float] = []
+        for phase in phases:
+            angle = two_pi * (phase - math.floor(phase))
+            c1 = math.cos(angle)
+            s1 = math.sin(angle)
+            total = c0 * c1 + s0 * s1
+            ch, sh = c1, s1
+            for c, s in terms:
+                ch, sh = ch * c1 - sh * s1, sh * c1 + ch * s1
+                total += c * ch + s * sh
+            out.append(total)
+        return out
+
     @classmethod
     def from_dict(cls, payload: Mapping[str, object]) -> "FourierKernel":
         return cls(
@@ -355,6 +383,70 @@ class KernelForecaster:
         """Expected encounter rate per bin (``exp`` of :meth:`log_intensity`)."""
         return math.exp(self.log_intensity(when, lat, lng, station, tide_phase))
 
+    def log_intensity_many(
+        self,
+        times: Sequence[datetime],
+        lats: Sequence[float],
+        lngs: Sequence[float],
+        stations: Optional[Sequence[Optional[str]]] = None,
+        tide_phases: Optional[Sequence[Optional[float]]] = None,
+    ) -> List[List[float]]:
+        """``log lambda`` over a time x cell surface: ``out[i][j]`` is ``times[i]`` at cell ``j``.
+
+        Cells are ``(lats[j], lngs[j])`` with an optional ``stations[j]``;
+        ``tide_phases[i]`` (or ``None``) goes with ``times[i]``. Equal to
+        :meth:`log_intensity` at every point up to float rounding, but each
+        kernel is evaluated once over all the phases it needs
+        (:meth:`FourierKernel.values`): the lunar, season and tide terms once
+        per time, the diel term once per (time, distinct longitude).
+        """
+        if len(lats) != len(lngs):
+            raise ValueError("lats and lngs must have the same length")
+        if stations is not None and len(stations) != len(lngs):
+            raise ValueError("stations must have one entry per cell")
+        if tide_phases is not None and len(tide_phases) != len(times):
+            raise ValueError("tide_phases must have one entry per time")
+
+        fit = self.fit
+        n_times = len(times)
+        cell_lngs = [float(v) for v in lngs]
+        if stations is None:
+            offsets = [0.0] * len(cell_lngs)
+        else:
+            offsets = [fit.station_effects.get(s, 0.0) if s is not None else 0.0 for s in stations]
+
+        moments = [t if t.tzinfo is not None else t.replace(tzinfo=timezone.utc) for t in times]
+        per_time: Dict[str, List[Optional[float]]] = {
+            "lunar": [float(covariates.lunar_phase(t)["phase"]) for t in moments],
+            "season": [float(_season_phase(t)) for t in moments],
+            "tide": [None if p is None else float(p) for p in (tide_phases or [None] * n_times)],
+        }
+
+        base = [fit.intercept] * n_times
+        for name, kernel in fit.kernels.items():
+            phases = per_time.get(name)
+            if phases is None:
+                continue
+            rows = [i for i, p in enumerate(phases) if p is not None]
+            for i, value in zip(rows, kernel.values([phases[i] for i in rows])):
+                base[i] += value
+
+        distinct_lngs = list(dict.fromkeys(cell_lngs))
+        diel_kernel = fit.kernels.get("diel")
+        diel_by_lng: List[Dict[float, float]] = [{} for _ in moments]
+        if diel_kernel is not None and distinct_lngs:
+            minutes = [covariates._minutes_of_day_utc(t) for t in moments]
+            diel_phases = [(m + 4.0 * lng) % 1440.0 / 1440.0 for m in minutes for lng in distinct_lngs]
+            values = iter(diel_kernel.values(diel_phases))
+            for row in diel_by_lng:
+                for lng in distinct_lngs:
+                    row[lng] = next(values)
+
+        return [
+            [b + row.get(lng, 0.0) + offset for lng, offset in zip(cell_lngs, offsets)]
+            for b, row in zip(base, diel_by_lng)
+        ]
+
 
 def _season_phase(when: datetime) -> float:
     """Day-of-year mapped to ``[0, 1)`` (Jan 1 == 0). Leap years use 366."""
@@ -0,0 +1,389 @@
+"""Precomputed forecast tiles: ``log lambda`` over the grid for the next days.
+
+The fitted coefficients only change when a fit is published/promoted, yet
+every surface request would otherwise re-evaluate the kernels. A tile is the
+clock-only log intensity (station and tide omitted, as in the map surface) on
+the ``spatial_enrichment`` water cells at fixed time steps over a horizon,
+stored as a float32 block keyed by the coefficient digest. Layout, integers
+little-endian::
+
+    zlib(float32 values, row-major times x cells) | header (UTF-8 JSON) | u32 header length | b"OFTL"
+
+Tiles are materialized on promotion and on the hourly schedule
+(``POST /api/forecast-tiles/refresh``), and read by ``GET /api/forecast-tiles``.
+A tile is only ever looked up under the digest of the currently loaded
+coefficients, so a new fit can never be answered from an old tile; refreshing
+also deletes the previous digest's object.
+
+Stdlib only, like :mod:`.serve`. The grid loader imports ``spatial_enrichment``
+lazily because that pulls in the geometry/bathymetry stack.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import struct
+import sys
+import time
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from ..config import settings
+from .serve import FittedKernels, KernelForecaster, load_fitted_kernels
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OFTL"
+FORMAT_VERSION = 1
+EXTENSION = ".oft"
+CONTENT_TYPE = "application/vnd.orcast.forecast-tile"
+
+TILE_S3_PREFIX = "models/tiles/"
+TILE_POINTER_S3_KEY = "models/tiles/current.json"
+# Local tiles (gitignored, beside the other model caches).
+DEFAULT_TILE_DIR = Path(__file__).resolve().parents[3] / "data" / "models" / "cache" / "tiles"
+
+DEFAULT_HORIZON_DAYS = 7.0
+DEFAULT_STEP_MINUTES = 15.0
+# A scheduled refresh re-materializes once less than this much horizon is left.
+REFRESH_MARGIN_HOURS = 24.0
+
+_TRAILER = struct.Struct("<I4s")
+_ZLIB_LEVEL = 6
+
+# The stored tile this process serves (replaced whenever the digest changes),
+# and the last in-memory tile built for a window the stored one does not cover.
+_tile_cache: Dict[str, Any] = {"tile": None, "adhoc": None}
+
+
+class TileFormatError(ValueError):
+    """Bytes that are not a readable forecast tile."""
+
+
+def coefficient_digest(fit: FittedKernels) -> str:
+    """sha256 over the coefficients that determine the intensity (not metadata)."""
+    payload = {
+        "intercept": fit.intercept,
+        "kernels": {name: {"cos": k.cos, "sin": k.sin} for name, k in sorted(fit.kernels.items())},
+        "station_effects": dict(sorted(fit.station_effects.items())),
+        "bin_hours": fit.bin_hours,
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _as_utc(when: datetime) -> datetime:
+    return when if when.tzinfo is not None else when.replace(tzinfo=timezone.utc)
+
+
+def _floor_to_step(when: datetime, step_minutes: float) -> datetime:
+    step = step_minutes * 60.0
+    epoch = math.floor(_as_utc(when).timestamp() / step) * step
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+
+@dataclass(frozen=True)
+class ForecastTile:
+    """``log lambda`` for ``n_times`` steps from ``start`` at every cell."""
+
+    digest: str
+    start: datetime
+    step_minutes: float
+    cells: List[Dict[str, Any]]
+    values: array
+    generated_at: str = ""
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def n_cells(self) -> int:
+        return len(self.cells)
+
+    @property
+    def n_times(self) -> int:
+        return len(self.values) // self.n_cells if self.cells else 0
+
+    @property
+    def end(self) -> datetime:
+        """Exclusive end of the last time step."""
+        return self.start + timedelta(minutes=self.step_minutes * self.n_times)
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.start <= _as_utc(start) and _as_utc(end) <= self.end
+
+    def slot(self, when: datetime) -> Optional[int]:
+        """Index of the time step containing ``when``, or ``None`` outside the tile."""
+        offset = (_as_utc(when) - self.start).total_seconds() / (self.step_minutes * 60.0)
+        i = math.floor(offset)
+        return i if 0 <= i < self.n_times else None
+
+    def time_at(self, i: int) -> datetime:
+        return self.start + timedelta(minutes=self.step_minutes * i)
+
+    def row(self, i: int) -> List[float]:
+        """Log intensity of every cell at time step ``i``."""
+        return self.values[i * self.n_cells:(i + 1) * self.n_cells].tolist()
+
+    def to_bytes(self) -> bytes:
+        raw = self.values
+        if sys.byteorder != "little":
+            raw = array("f", raw)
+            raw.byteswap()
+        body = zlib.compress(raw.tobytes(), _ZLIB_LEVEL)
+        header = {
+            "version": FORMAT_VERSION,
+            "codec": "zlib",
+            "digest": self.digest,
+            "start": self.start.isoformat(),
+            "step_minutes": self.step_minutes,
+            "n_times": self.n_times,
+            "cells": self.cells,
+            "generated_at": self.generated_at,
+            "meta": self.meta,
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        return body + header_bytes + _TRAILER.pack(len(header_bytes), MAGIC)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ForecastTile":
+        if len(data) < _TRAILER.size:
+            raise TileFormatError("tile is truncated")
+        header_len, magic = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+        if magic != MAGIC:
+            raise TileFormatError("not a forecast tile")
+        header_end = len(data) - _TRAILER.size
+        body_end = header_end - header_len
+        try:
+            header = json.loads(data[body_end:header_end].decode("utf-8"))
+            values = array("f")
+            values.frombytes(zlib.decompress(data[:body_end]))
+        except (ValueError, zlib.error) as exc:
+            raise TileFormatError("unreadable forecast tile") from exc
+        if header.get("version") != FORMAT_VERSION or header.get("codec") != "zlib":
+            raise TileFormatError(
+                f"unsupported tile version/codec {header.get('version')}/{header.get('codec')}"
+            )
+        if sys.byteorder != "little":
+            values.byteswap()
+        if len(values) != header["n_times"] * len(header["cells"]):
+            raise TileFormatError("tile body does not match its header")
+        return cls(
+            digest=header["digest"],
+            start=datetime.fromisoformat(header["start"]),
+            step_minutes=float(header["step_minutes"]),
+            cells=list(header["cells"]),
+            values=values,
+            generated_at=header.get("generated_at") or "",
+            meta=dict(header.get("meta") or {}),
+        )
+
+
+def materialize_tile(
+    fit: FittedKernels,
+    cells: Sequence[Mapping[str, Any]],
+    start: Optional[datetime] = None,
+    horizon_days: float = DEFAULT_HORIZON_DAYS,
+    step_minutes: float = DEFAULT_STEP_MINUTES,
+) -> ForecastTile:
+    """Evaluate the clock-only surface for ``horizon_days`` from ``start`` (floored to the step)."""
+    if step_minutes <= 0 or horizon_days <= 0:
+        raise ValueError("step_minutes and horizon_days must be positive")
+    start = _floor_to_step(start or datetime.now(timezone.utc), step_minutes)
+    n_times = max(1, int(math.ceil(horizon_days * 1440.0 / step_minutes)))
+    times = [start + timedelta(minutes=step_minutes * i) for i in range(n_times)]
+    tile_cells = [
+        {"cell_id": c.get("cell_id") or c.get("id"), "lat": float(c["lat"]), "lng": float(c["lng"])}
+        for c in cells
+    ]
+    surface = KernelForecaster(fit).log_intensity_many(
+        times, [c["lat"] for c in tile_cells], [c["lng"] for c in tile_cells]
+    )
+    values = array("f")
+    for row in surface:
+        values.extend(row)
+    return ForecastTile(
+        digest=coefficient_digest(fit),
+        start=start,
+        step_minutes=float(step_minutes),
+        cells=tile_cells,
+        values=values,
+        generated_at=datetime.now(timezone.utc).isoformat(),
+        meta={"version": fit.version, "fitted_at": fit.fitted_at, "horizon_days": horizon_days},
+    )
+
+
+def default_tile_cells() -> List[Dict[str, Any]]:
+    """Water cells from the ``spatial_grid_covariates`` stream, else built on the fly."""
+    from ..spatial_enrichment import build_grid_cells, load_cells_from_store
+    from ..timeseries import build_timeseries_store
+
+    try:
+        cells = load_cells_from_store(build_timeseries_store(settings))
+    except Exception as exc:  # store unavailable: fall back to the computed grid
+        logger.warning("default_tile_cells: spatial grid stream unavailable (%s)", exc)
+        cells = []
+    return list(cells) or build_grid_cells()
+
+
+# -- storage --------------------------------------------------------------------
+def tile_key(digest: str) -> str:
+    return f"{TILE_S3_PREFIX}{digest}{EXTENSION}"
+
+
+def _is_aws() -> bool:
+    return settings.storage_backend.lower() == "aws"
+
+
+def _s3_client():
+    import boto3  # lazy: only needed in aws mode
+
+    return boto3.client("s3", region_name=settings.aws_region)
+
+
+def load_tile(digest: str, directory: Optional[Path] = None) -> Optional[ForecastTile]:
+    """The stored tile for ``digest``, or ``None`` when absent or unreadable.
+
+    Any failure is treated as a miss: tiles are an optimization and the caller
+    can always re-materialize.
+    """
+    try:
+        if _is_aws() and directory is None:
+            obj = _s3_client().get_object(Bucket=settings.models_bucket, Key=tile_key(digest))
+            data = obj["Body"].read()
+        else:
+            path = Path(directory or DEFAULT_TILE_DIR) / f"{digest}{EXTENSION}"
+            if not path.exists():
+                return None
+            data = path.read_bytes()
+        tile = ForecastTile.from_bytes(data)
+    except Exception as exc:
+        logger.info("load_tile: no usable tile for %s (%s)", digest[:12], exc)
+        return None
+    return tile if tile.digest == digest else None
+
+
+def store_tile(tile: ForecastTile, directory: Optional[Path] = None) -> str:
+    """Persist ``tile`` under its digest, repoint ``current`` and drop other digests' tiles."""
+    body = tile.to_bytes()
+    pointer = {
+        "digest": tile.digest,
+        "key": tile_key(tile.digest),
+        "start": tile.start.isoformat(),
+        "end": tile.end.isoformat(),
+        "generated_at": tile.generated_at,
+    }
+    if _is_aws() and directory is None:
+        s3 = _s3_client()
+        bucket = settings.models_bucket
+        previous = None
+        try:
+            previous = json.loads(s3.get_object(Bucket=bucket, Key=TILE_POINTER_S3_KEY)["Body"].read())
+        except Exception:
+            pass
+        s3.put_object(Bucket=bucket, Key=tile_key(tile.digest), Body=body, ContentType=CONTENT_TYPE)
+        s3.put_object(
+            Bucket=bucket, Key=TILE_POINTER_S3_KEY,
+            Body=json.dumps(pointer, indent=2).encode(), ContentType="application/json",
+        )
+        old_key = (previous or {}).get("key")
+        if old_key and old_key != pointer["key"]:
+            try:
+                s3.delete_object(Bucket=bucket, Key=old_key)
+            except Exception as exc:
+                logger.warning("store_tile: could not delete stale tile %s (%s)", old_key, exc)
+        return pointer["key"]
+
+    root = Path(directory or DEFAULT_TILE_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / f"{tile.digest}{EXTENSION}"
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(body)
+    tmp.replace(path)
+    (root / "current.json").write_text(json.dumps(pointer, indent=2))
+    for stale in root.glob(f"*{EXTENSION}"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return str(path)
+
+
+# -- serving --------------------------------------------------------------------
+def current_tile(
+    fit: FittedKernels,
+    start: datetime,
+    end: datetime,
+    cells: Optional[Sequence[Mapping[str, Any]]] = None,
+    directory: Optional[Path] = None,
+) -> ForecastTile:
+    """A tile for ``fit`` that covers ``[start, end]``.
+
+    In-process tile first, then the stored one. A window neither covers (or a
+    digest nothing has been stored for yet) is materialized in memory only and
+    kept as this process's ad-hoc tile: serving never writes or deletes stored
+    tiles, which is left to promotion and :func:`refresh_forecast_tiles`.
+    """
+    digest = coefficient_digest(fit)
+    for slot in ("tile", "adhoc"):
+        tile = _tile_cache.get(slot)
+        if tile is not None and tile.digest == digest and tile.covers(start, end):
+            return tile
+
+    # Another process (or the refresh endpoint) may have stored a newer tile.
+    stored = load_tile(digest, directory)
+    if stored is not None:
+        cached = _tile_cache.get("tile")
+        if cached is None or (cached.digest, cached.generated_at) != (stored.digest, stored.generated_at):
+            _tile_cache["tile"] = stored
+        if stored.covers(start, end):
+            return _tile_cache["tile"]
+
+    horizon_days = max(DEFAULT_HORIZON_DAYS, (_as_utc(end) - _as_utc(start)).total_seconds() / 86400.0)
+    adhoc = materialize_tile(
+        fit, cells if cells is not None else default_tile_cells(), start=start, horizon_days=horizon_days,
+    )
+    _tile_cache["adhoc"] = adhoc
+    return adhoc
+
+
+def refresh_forecast_tiles(
+    fit: Optional[FittedKernels] = None,
+    cells: Optional[Sequence[Mapping[str, Any]]] = None,
+    now: Optional[datetime] = None,
+    force: bool = False,
+    directory: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Re-materialize the tile when the digest changed or the horizon is running out.
+
+    Called on promotion and by the hourly schedule. ``force`` rebuilds anyway.
+    """
+    fit = fit or load_fitted_kernels()
+    if fit is None:
+        return {"status": "not_fitted"}
+    now = _as_utc(now or datetime.now(timezone.utc))
+    digest = coefficient_digest(fit)
+    needed_until = now + timedelta(hours=DEFAULT_HORIZON_DAYS * 24.0 - REFRESH_MARGIN_HOURS)
+
+    existing = None if force else load_tile(digest, directory)
+    if existing is not None and existing.covers(now, needed_until):
+        _tile_cache["tile"] = existing
+        return {"status": "fresh", "digest": digest, "start": existing.start.isoformat(), "end": existing.end.isoformat()}
+
+    started = time.monotonic()
+    tile = materialize_tile(fit, cells if cells is not None else default_tile_cells(), start=now)
+    location = store_tile(tile, directory)
+    _tile_cache["tile"] = tile
+    return {
+        "status": "materialized",
+        "digest": digest,
+        "start": tile.start.isoformat(),
+        "end": tile.end.isoformat(),
+        "n_times": tile.n_times,
+        "n_cells": tile.n_cells,
+        "location": location,
+        "seconds": round(time.monotonic() - started, 3),
+    }
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
+from .geo_region import warm_water_mask
 from .routers import (
     annotations,
     community,
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    warm_water_mask()
     if not storage.list_sightings(limit=1):
         run_ingestion(include_live=False)
     try:
@@ -177,6 +177,8 @@ class SourceStatus(BaseModel):
     record_count: int = 0
     skipped_count: int = 0
     error: Optional[str] = None
+    # Wall time of the source's fetch during ingestion (None outside a run).
+    latency_ms: Optional[float] = None
     checked_at: datetime = Field(default_factory=utc_now)
 
 
@@ -0,0 +1,220 @@
+"""Parallel, resumable NOAA CO-OPS history backfill.
+
+``NoaaAdapter.fetch_water_level_history`` / ``fetch_currents_history`` walk
+their <=31-day chunks one request at a time and silently skip chunks that
+fail, which is fine for a one-week refresh but turns a multi-year, multi-
+station backfill into hours of serial round trips with invisible holes.
+
+:func:`backfill_noaa` plans the same requests as calendar-month chunks per
+(station, product) and fetches them on a small thread pool behind a shared
+:class:`RateLimiter`. Each completed chunk is handed to ``write`` on the
+calling thread (so the store is never written concurrently) and then recorded
+in a :class:`BackfillCheckpoint`. A rerun skips checkpointed chunks, and
+month-aligned chunks keep their keys stable when the run starts on a later
+day. A chunk that fails is not checkpointed; it is listed in the summary's
+``missing`` entries and retried by the next run.
+
+Currents keep the adapter's rule: a station's observed ``currents`` are used
+if any chunk has records, otherwise its ``currents_predictions`` chunks are
+planned once every observed chunk has resolved.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .sources.noaa import NoaaChunkError
+
+WATER_LEVEL_PRODUCT = "water_level"
+CURRENTS_PRODUCT = "currents"
+PREDICTIONS_PRODUCT = "currents_predictions"
+
+
+@dataclass(frozen=True)
+class Chunk:
+    station: str
+    product: str
+    begin: date
+    end: date
+
+    @property
+    def key(self) -> str:
+        return f"{self.station}|{self.product}|{self.begin:%Y%m%d}|{self.end:%Y%m%d}"
+
+    def describe(self) -> Dict[str, str]:
+        return {
+            "station": self.station,
+            "product": self.product,
+            "begin": self.begin.isoformat(),
+            "end": self.end.isoformat(),
+        }
+
+
+def month_chunks(begin: Union[date, datetime], end: Union[date, datetime]) -> List[Tuple[date, date]]:
+    """Inclusive ``[begin, end]`` split at calendar-month boundaries (each <= 31 days)."""
+    start = begin.date() if isinstance(begin, datetime) else begin
+    stop = end.date() if isinstance(end, datetime) else end
+    if stop < start:
+        start, stop = stop, start
+    chunks: List[Tuple[date, date]] = []
+    cursor = start
+    while cursor <= stop:
+        next_month = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_end = min(next_month - timedelta(days=1), stop)
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end + timedelta(days=1)
+    return chunks
+
+
+class BackfillCheckpoint:
+    """Completed chunks and their record counts, optionally persisted as JSON.
+
+    With ``path=None`` the checkpoint lives only for the run. Every
+    :meth:`mark` rewrites the file atomically (temp file + rename), so an
+    interrupted backfill loses at most the chunk in flight.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path else None
+        self._done: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._done = {str(k): int(v) for k, v in json.loads(self.path.read_text()).get("chunks", {}).items()}
+
+    def records(self, chunk: Chunk) -> Optional[int]:
+        """Records the chunk wrote when it completed, or ``None`` if it has not."""
+        with self._lock:
+            return self._done.get(chunk.key)
+
+    def mark(self, chunk: Chunk, records: int) -> None:
+        with self._lock:
+            self._done[chunk.key] = int(records)
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"chunks": self._done}, sort_keys=True))
+            os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._done)
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / rate_per_s`` seconds apart across threads (``<= 0``: unlimited)."""
+
+    def __init__(self, rate_per_s: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.interval = 1.0 / rate_per_s if rate_per_s > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+def backfill_noaa(
+    noaa: Any,
+    write: Callable[[Chunk, List[Dict[str, Any]]], int],
+    begin: Union[date, datetime],
+    end: Union[date, datetime],
+    *,
+    water_stations: Sequence[str],
+    current_stations: Sequence[str],
+    workers: int = 4,
+    rate_per_s: float = 2.0,
+    checkpoint: Optional[BackfillCheckpoint] = None,
+) -> Dict[str, Any]:
+    """Fetch every (station, product, month) chunk in ``[begin, end]`` and ``write`` it.
+
+    ``noaa`` needs ``fetch_chunk(product, station, begin, end)`` (see
+    ``NoaaAdapter``). ``write(chunk, records)`` persists one chunk and returns
+    the number of records written. Returns ``{"stations", "records",
+    "chunks", "resumed", "missing"}``, where ``records`` counts this run's
+    writes and ``missing`` lists the chunks that failed, with their error.
+    """
+    checkpoint = checkpoint if checkpoint is not None else BackfillCheckpoint()
+    limiter = RateLimiter(rate_per_s)
+    months = month_chunks(begin, end)
+
+    stations_with_data: Dict[str, None] = {}
+    missing: List[Dict[str, str]] = []
+    totals = {"records": 0, "chunks": 0, "resumed": 0}
+    # Per current station: observed chunks still unresolved, observed records seen.
+    observed_left = {station: len(months) for station in current_stations}
+    observed_records = {station: 0 for station in current_stations}
+
+    def fetch(chunk: Chunk) -> List[Dict[str, Any]]:
+        limiter.acquire()
+        return noaa.fetch_chunk(chunk.product, chunk.station, chunk.begin, chunk.end)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="noaa-backfill")
+    pending: Dict[Future, Chunk] = {}
+
+    def resolved(chunk: Chunk, records: int) -> None:
+        if records:
+            stations_with_data[chunk.station] = None
+        if chunk.product != CURRENTS_PRODUCT:
+            return
+        observed_left[chunk.station] -= 1
+        observed_records[chunk.station] += records
+        if observed_left[chunk.station] == 0 and observed_records[chunk.station] == 0:
+            plan([Chunk(chunk.station, PREDICTIONS_PRODUCT, b, e) for b, e in months])
+
+    def plan(chunks: List[Chunk]) -> None:
+        for chunk in chunks:
+            totals["chunks"] += 1
+            done = checkpoint.records(chunk)
+            if done is not None:
+                totals["resumed"] += 1
+                resolved(chunk, done)
+            else:
+                pending[executor.submit(fetch, chunk)] = chunk
+
+    try:
+        plan([Chunk(s, WATER_LEVEL_PRODUCT, b, e) for s in water_stations for b, e in months])
+        plan([Chunk(s, CURRENTS_PRODUCT, b, e) for s in current_stations for b, e in months])
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    records = future.result()
+                except NoaaChunkError as exc:
+                    missing.append({**chunk.describe(), "error": str(exc)})
+                    resolved(chunk, 0)
+                    continue
+                written = write(chunk, records) if records else 0
+                totals["records"] += written
+                checkpoint.mark(chunk, written)
+                resolved(chunk, written)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    missing.sort(key=lambda m: (m["station"], m["product"], m["begin"]))
+    ordered = dict.fromkeys([*water_stations, *current_stations])
+    return {
+        "stations": [station for station in ordered if station in stations_with_data],
+        "records": totals["records"],
+        "chunks": totals["chunks"],
+        "resumed": totals["resumed"],
+        "missing": missing,
+    }
@@ -7,7 +7,12 @@ These power three demo surfaces:
                                        gates -> nearby evidence),
 * ``GET  /api/decision-records``    -- the human promotion audit log,
 * ``POST /api/decision-records``    -- record a human promote/hold decision
-                                       (keyed; the consequential human step).
+                                       (keyed; the consequential human step),
+* ``GET  /api/forecast-tiles``      -- the precomputed kernel intensity surface
+                                       (grid cells x time steps, see
+                                       ``kernel_model.tiles``),
+* ``POST /api/forecast-tiles/refresh`` -- re-materialize tiles (keyed; hourly
+                                       schedule and promotion).
 
 The forecast itself is served by the existing ``/forecast/*`` routes; this
 router adds the provenance + gate + human-oversight layer. Coefficients and the
@@ -24,7 +29,7 @@ from __future__ import annotations
 import json
 import math
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -40,6 +45,7 @@ from ..kernel_model.serve import (
     load_pending_approval,
     load_promotion,
 )
+from ..kernel_model.tiles import DEFAULT_HORIZON_DAYS, current_tile, refresh_forecast_tiles
 from ..spatial_enrichment import load_cells_from_store, lookup_cell
 from ..timeseries import build_timeseries_store
 
@@ -376,6 +382,53 @@ def get_provenance(
     }
 
 
+@router.get("/api/forecast-tiles")
+def get_forecast_tiles(
+    start: Optional[str] = Query(default=None, description="ISO8601 start; defaults to now"),
+    hours: float = Query(default=24.0, gt=0, le=DEFAULT_HORIZON_DAYS * 24.0),
+    cell_id: Optional[str] = Query(default=None, description="Restrict to one grid cell"),
+) -> Dict[str, Any]:
+    """Clock-only ``log lambda`` on the grid cells, read from the precomputed tile.
+
+    Station and tide terms are omitted (as on the map surface). The tile is
+    keyed by the coefficient digest, so a new fit is never served stale values.
+    """
+    fit = load_fitted_kernels()
+    if fit is None:
+        raise HTTPException(status_code=404, detail="No fitted kernels available yet")
+
+    moment = _parse_when(start)
+    end = moment + timedelta(hours=hours)
+    tile = current_tile(fit, moment, end, cells=_spatial_cells() or None)
+    columns = list(range(tile.n_cells))
+    if cell_id is not None:
+        columns = [j for j, cell in enumerate(tile.cells) if cell.get("cell_id") == cell_id]
+        if not columns:
+            raise HTTPException(status_code=404, detail="Unknown grid cell")
+
+    first = tile.slot(moment)
+    last = tile.slot(end - timedelta(microseconds=1))
+    steps = range(first, last + 1)
+    rows = [tile.row(i) for i in steps]
+    return {
+        "status": "success",
+        "digest": tile.digest,
+        "generated_at": tile.generated_at,
+        "step_minutes": tile.step_minutes,
+        "times": [tile.time_at(i).isoformat() for i in steps],
+        "cells": [tile.cells[j] for j in columns],
+        "log_intensity": [[round(row[j], 5) for j in columns] for row in rows],
+        "note": "Temporal kernels only (station and tide terms omitted); rows are times, columns are cells.",
+    }
+
+
+@router.post("/api/forecast-tiles/refresh", dependencies=[Depends(require_api_key)])
+def refresh_forecast_tiles_endpoint(force: bool = False) -> Dict[str, Any]:
+    """Re-materialize the forecast tile if the coefficients changed or the horizon runs low."""
+    result = refresh_forecast_tiles(cells=_spatial_cells() or None, force=force)
+    return {"status": "success", "tiles": result}
+
+
 @router.get("/api/decision-records", dependencies=[Depends(require_api_key)])
 def list_decision_records() -> Dict[str, Any]:
     """The human promotion audit log (most recent first, keyed: it is an audit log)."""
@@ -15,6 +15,7 @@ sign-off; run is the manual/refresh trigger.
 from __future__ import annotations
 
 import json
+import logging
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -25,10 +26,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from ..auth import ReviewerIdentity, require_api_key, require_trusted_reviewer
 from ..config import settings
 from ..kernel_model.serve import DEFAULT_PROMOTION_PATH, PROMOTION_S3_KEY
+from ..kernel_model.tiles import refresh_forecast_tiles
 from ..promotion.supervisor import draft_decision
 from .kernel import _load_fit_report
 from ..state import storage
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -123,7 +127,21 @@ def _write_promotion(marker: Dict[str, Any]) -> None:
             Bucket=settings.models_bucket, Key=PROMOTION_S3_KEY,
             Body=body.encode(), ContentType="application/json",
         )
-        return
-    path = Path(DEFAULT_PROMOTION_PATH)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(body)
+    else:
+        path = Path(DEFAULT_PROMOTION_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+    _refresh_tiles_after_promotion()
+
+
+def _refresh_tiles_after_promotion() -> None:
+    """Re-materialize forecast tiles for the promoted coefficients (best-effort).
+
+    A failure here must never undo or block the promotion itself; the hourly
+    refresh and the read path both re-check the coefficient digest anyway.
+    """
+    try:
+        result = refresh_forecast_tiles()
+        logger.info("forecast tiles after promotion: %s", result.get("status"))
+    except Exception as exc:
+        logger.warning("forecast tile refresh after promotion failed: %s", exc)
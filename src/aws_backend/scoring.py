@@ -4,11 +4,11 @@ import math
 import hashlib
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .geo_region import in_bounds, snap_to_water
 from .models import EnvironmentalSnapshot, Hotspot, NormalizedSighting, ValidationStatus
-from .validation import haversine_km
+from .validation import EARTH_RADIUS_KM, haversine_km
 
 MODEL_VERSION = "aws-deterministic-hotspot-v1"
 
@@ -92,6 +92,94 @@ def generate_hotspots(sightings: Iterable[NormalizedSighting], cell_size_degrees
     return sorted(hotspots, key=lambda h: (h.probability, h.confidence, h.detection_count), reverse=True)
 
 
+class _HotspotField:
+    """Hotspot centres and weighting terms hoisted out of the per-point loop.
+
+    Every distance is computed once per (point, hotspot) with the same float
+    operations as ``haversine_km``, and then reused for both the nearest-hotspot
+    pick and the exponential weights, so results match the scalar path exactly.
+    """
+
+    def __init__(self, hotspots: Sequence[Hotspot]) -> None:
+        self.hotspots = list(hotspots)
+        self.lats = [h.center_latitude for h in self.hotspots]
+        self.lngs = [h.center_longitude for h in self.hotspots]
+        self.cos_lats = [math.cos(math.radians(lat)) for lat in self.lats]
+        self.scales = [max(1.5, h.radius_km + 2.0) for h in self.hotspots]
+        self.probabilities = [h.probability for h in self.hotspots]
+        self.confidences = [h.confidence for h in self.hotspots]
+
+    def score(self, lat: float, lng: float, cos_lat: float) -> Tuple[float, float, int, float]:
+        """Return (probability, confidence, nearest index, nearest distance km)."""
+        weighted_probability = 0.0
+        weighted_confidence = 0.0
+        total_weight = 0.0
+        nearest = -1
+        nearest_distance = math.inf
+        for index, (h_lat, h_lng, h_cos) in enumerate(zip(self.lats, self.lngs, self.cos_lats)):
+            a = (
+                math.sin(math.radians(h_lat - lat) / 2) ** 2
+                + cos_lat * h_cos * math.sin(math.radians(h_lng - lng) / 2) ** 2
+            )
+            distance = 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+            if nearest < 0 or distance < nearest_distance:
+                nearest, nearest_distance = index, distance
+            weight = math.exp(-distance / self.scales[index])
+            weighted_probability += self.probabilities[index] * weight
+            weighted_confidence += self.confidences[index] * weight
+            total_weight += weight
+        probability = weighted_probability / total_weight if total_weight else 0.12
+        confidence = weighted_confidence / total_weight if total_weight else 0.35
+        return probability, confidence, nearest, nearest_distance
+
+
+def score_locations(
+    lats: Sequence[float],
+    lngs: Sequence[float],
+    hotspots: Sequence[Hotspot],
+    environment: EnvironmentalSnapshot | None = None,
+) -> Dict[str, List[Any]]:
+    """Score many points against one hotspot set in a single pass.
+
+    Returns parallel lists keyed ``probability``, ``confidence``,
+    ``nearest_index`` (index into ``hotspots``, ``None`` when there are none)
+    and ``nearest_distance_km``. Values are unrounded and equal to what
+    ``probability_at_location`` computes before rounding.
+    """
+    if len(lats) != len(lngs):
+        raise ValueError("lats and lngs must have the same length")
+    out: Dict[str, List[Any]] = {"probability": [], "confidence": [], "nearest_index": [], "nearest_distance_km": []}
+    env_shift = (_environmental_snapshot_score(environment) - 0.5) * 0.08 if environment else None
+    if not hotspots:
+        for _ in lats:
+            out["probability"].append(0.12)
+            out["confidence"].append(0.35)
+            out["nearest_index"].append(None)
+            out["nearest_distance_km"].append(None)
+        return out
+
+    field = _HotspotField(hotspots)
+    cos_cache: Dict[float, float] = {}
+    for lat, lng in zip(lats, lngs):
+        cos_lat = cos_cache.get(lat)
+        if cos_lat is None:
+            cos_lat = cos_cache[lat] = math.cos(math.radians(lat))
+        probability, confidence, nearest, distance = field.score(lat, lng, cos_lat)
+        if env_shift is not None:
+            probability = min(0.98, probability + env_shift)
+        out["probability"].append(probability)
+        out["confidence"].append(confidence)
+        out["nearest_index"].append(nearest)
+        out["nearest_distance_km"].append(distance)
+    return out
+
+
+def _primary_behavior(hotspot: Hotspot) -> Tuple[str, Dict[str, float]]:
+    behavior_probs = _behavior_probabilities(hotspot.behavior_distribution)
+    primary = max(behavior_probs, key=behavior_probs.get) if behavior_probs else "unknown"
+    return primary, behavior_probs
+
+
 def probability_at_location(lat: float, lng: float, hotspots: List[Hotspot], environment: EnvironmentalSnapshot | None = None) -> Dict[str, Any]:
     if not hotspots:
         return {
@@ -103,31 +191,16 @@ def probability_at_location(lat: float, lng: float, hotspots: List[Hotspot], env
             "model_version": MODEL_VERSION,
         }
 
-    weighted_probability = 0.0
-    weighted_confidence = 0.0
-    total_weight = 0.0
-    nearest = min(hotspots, key=lambda h: haversine_km(lat, lng, h.center_latitude, h.center_longitude))
-    for hotspot in hotspots:
-        distance = haversine_km(lat, lng, hotspot.center_latitude, hotspot.center_longitude)
-        weight = math.exp(-distance / max(1.5, hotspot.radius_km + 2.0))
-        weighted_probability += hotspot.probability * weight
-        weighted_confidence += hotspot.confidence * weight
-        total_weight += weight
-
-    probability = weighted_probability / total_weight if total_weight else 0.12
-    confidence = weighted_confidence / total_weight if total_weight else 0.35
-    if environment:
-        probability = min(0.98, probability + (_environmental_snapshot_score(environment) - 0.5) * 0.08)
-
-    behavior_probs = _behavior_probabilities(nearest.behavior_distribution)
-    primary = max(behavior_probs, key=behavior_probs.get) if behavior_probs else "unknown"
+    scored = score_locations([lat], [lng], hotspots, environment)
+    nearest = hotspots[scored["nearest_index"][0]]
+    primary, behavior_probs = _primary_behavior(nearest)
     return {
-        "probability": round(probability, 3),
-        "confidence": round(confidence, 3),
+        "probability": round(scored["probability"][0], 3),
+        "confidence": round(scored["confidence"][0], 3),
         "nearest_hotspot": {
             "hotspot_id": nearest.hotspot_id,
             "name": nearest.name,
-            "distance_km": round(haversine_km(lat, lng, nearest.center_latitude, nearest.center_longitude), 2),
+            "distance_km": round(scored["nearest_distance_km"][0], 2),
         },
         "behavior_prediction": {"primary": primary, "probabilities": behavior_probs},
         "environmental_factors": _environment_to_dict(environment) if environment else {},
@@ -147,26 +220,42 @@ def spatial_forecast_grid(
     horizon_factor = min(1.0, max(0.05, forecast_hours / 168.0))
     lat_span = radius_km / 111.0
     lng_span = radius_km / (111.0 * math.cos(math.radians(center_lat)))
-    points: List[Dict[str, Any]] = []
+    # Walk the axes with the same accumulated steps as before so grid
+    # coordinates are unchanged, then score the whole grid in one pass.
+    lat_axis: List[float] = []
     lat = center_lat - lat_span
     while lat <= center_lat + lat_span + 1e-9:
-        lng = center_lng - lng_span
-        while lng <= center_lng + lng_span + 1e-9:
-            pred = probability_at_location(lat, lng, hotspots, environment)
-            points.append(
-                {
-                    "lat": round(lat, 6),
-                    "lng": round(lng, 6),
-                    "probability": round(pred["probability"] * horizon_factor, 3),
-                    "confidence": pred["confidence"],
-                    "predicted_behavior": pred["behavior_prediction"]["primary"],
-                    "model_version": MODEL_VERSION,
-                    "forecast_hours": forecast_hours,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-            lng += step_degrees
+        lat_axis.append(lat)
         lat += step_degrees
+    lng_axis: List[float] = []
+    lng = center_lng - lng_span
+    while lng <= center_lng + lng_span + 1e-9:
+        lng_axis.append(lng)
+        lng += step_degrees
+    lats = [lat for lat in lat_axis for _ in lng_axis]
+    lngs = [lng for _ in lat_axis for lng in lng_axis]
+
+    scored = score_locations(lats, lngs, hotspots, environment)
+    behaviors: Dict[Optional[int], str] = {None: "unknown"}
+    timestamp = datetime.now(timezone.utc).isoformat()
+    points: List[Dict[str, Any]] = []
+    for lat, lng, probability, confidence, nearest in zip(
+        lats, lngs, scored["probability"], scored["confidence"], scored["nearest_index"]
+    ):
+        if nearest not in behaviors:
+            behaviors[nearest] = _primary_behavior(hotspots[nearest])[0]
+        points.append(
+            {
+                "lat": round(lat, 6),
+                "lng": round(lng, 6),
+                "probability": round(round(probability, 3) * horizon_factor, 3),
+                "confidence": round(confidence, 3),
+                "predicted_behavior": behaviors[nearest],
+                "model_version": MODEL_VERSION,
+                "forecast_hours": forecast_hours,
+                "timestamp": timestamp,
+            }
+        )
     return sorted(points, key=lambda p: p["probability"], reverse=True)
 
 
@@ -12,6 +12,7 @@ from typing import Dict, List
 import requests
 
 from ..geo_region import SAN_JUAN_BOUNDS
+from .transport import http_get
 
 # PMEL ERDDAP tabledap endpoint for AIS annual summaries (dataset IDs vary by year).
 _ERDDAP_TABLE = "https://coastwatch.pfeg.noaa.gov/erddap/tabledap/AIS2023_WestCoast.csv"
@@ -37,7 +38,7 @@ class AisTrafficAdapter:
             "limit": self.max_rows,
         }
         try:
-            response = requests.get(_ERDDAP_TABLE, params=params, timeout=self.timeout)
+            response = http_get(_ERDDAP_TABLE, params=params, timeout=self.timeout, source=self.source_name)
         except requests.RequestException:
             return []
         if response.status_code != 200 or "latitude" not in response.text.splitlines()[0].lower():
@@ -22,6 +22,8 @@ class SourceAdapter(ABC):
     source_name: str
     enabled: bool = True
     reliability: float = 0.5
+    # Per-source override of ORCAST_INGESTION_DEADLINE_S (seconds; None = use it).
+    fetch_deadline_s: Optional[float] = None
 
     @abstractmethod
     def fetch(self) -> SourceFetchResult:
@@ -7,6 +7,8 @@ from typing import Dict, List
 
 import requests
 
+from .transport import http_get
+
 # WSDOT Ferries routes GeoJSON (public open data).
 _WSDOT_ROUTES_URL = "https://www.wsdot.wa.gov/ferries/vesselwatch/VesselWatchWebService.asmx/GetAllRoutes"
 
@@ -20,7 +22,7 @@ class FerryEffortAdapter:
 
     def fetch_wa_routes(self) -> List[Dict[str, object]]:
         try:
-            response = requests.get(_WSDOT_ROUTES_URL, timeout=self.timeout)
+            response = http_get(_WSDOT_ROUTES_URL, timeout=self.timeout, source=self.source_name)
         except requests.RequestException:
             return []
         if response.status_code != 200:
@@ -33,6 +33,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from .transport import http_get
+
 logger = logging.getLogger(__name__)
 
 _TIMEOUT = 20.0
@@ -109,7 +111,7 @@ def _get_json(
     only for log context; request URLs/exceptions are redacted before logging.
     """
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=_TIMEOUT)
+        resp = http_get(url, params=params, headers=headers, timeout=_TIMEOUT, source=provider)
     except requests.RequestException as exc:
         logger.warning("%s request failed: %s", provider, _redact(str(exc)))
         return None
@@ -8,6 +8,7 @@ from typing import Dict, List
 import requests
 
 from ..geo_region import SAN_JUAN_BOUNDS
+from .transport import http_get
 
 # BC ShoreZone/CRIMS public ArcGIS layer (habitat polygons).
 _SHOREZONE_URL = (
@@ -38,7 +39,7 @@ class HabitatAdapter:
             "f": "json",
         }
         try:
-            response = requests.get(_SHOREZONE_URL, params=params, timeout=self.timeout)
+            response = http_get(_SHOREZONE_URL, params=params, timeout=self.timeout, source=self.source_name)
         except requests.RequestException:
             return []
         if response.status_code != 200:
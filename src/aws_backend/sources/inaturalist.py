@@ -8,6 +8,7 @@ import requests
 from ..geo_region import filter_and_snap
 from ..models import NormalizedSighting, SourceEvidence
 from .base import SourceAdapter, SourceFetchResult
+from .transport import http_get
 
 
 class INaturalistAdapter(SourceAdapter):
@@ -29,7 +30,7 @@ class INaturalistAdapter(SourceAdapter):
             "d1": start,
         }
         try:
-            response = requests.get("https://api.inaturalist.org/v1/observations", params=params, timeout=15)
+            response = http_get("https://api.inaturalist.org/v1/observations", params=params, timeout=15, source=self.source_name)
             content_type = response.headers.get("content-type", "")
             if response.status_code != 200:
                 return SourceFetchResult(
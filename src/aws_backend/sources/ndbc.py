@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-import requests
+from .transport import http_get
 
 
 _REALTIME_URL = "https://www.ndbc.noaa.gov/data/realtime2/{station}.txt"
@@ -20,7 +20,7 @@ class NdbcAdapter:
         self.timeout = timeout
 
     def fetch_stdmet_realtime(self, station_id: str) -> List[Dict[str, object]]:
-        response = requests.get(_REALTIME_URL.format(station=station_id), timeout=self.timeout)
+        response = http_get(_REALTIME_URL.format(station=station_id), timeout=self.timeout, source=self.source_name)
         if response.status_code != 200:
             return []
         return _parse_stdmet(response.text, station_id=station_id, source_url=response.url)
@@ -7,6 +7,7 @@ import requests
 
 from ..models import EnvironmentalSnapshot
 from .base import SourceAdapter, SourceFetchResult
+from .transport import http_get
 
 # CO-OPS datagetter caps a single request at 31 days for 6-minute interval
 # products, so longer ranges must be split into chunks at or below this size.
@@ -25,6 +26,10 @@ DEFAULT_CURRENT_STATIONS = ("PUG1701", "PUG1702", "PUG1703")
 _DATAGETTER_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
 
 
+class NoaaChunkError(RuntimeError):
+    """One datagetter chunk could not be fetched (HTTP error, non-JSON, network)."""
+
+
 class NoaaAdapter(SourceAdapter):
     source_name = "noaa_coops"
     reliability = 0.9
@@ -52,7 +57,7 @@ class NoaaAdapter(SourceAdapter):
                 "application": "ORCAST",
             }
             try:
-                response = requests.get("https://api.tidesandcurrents.noaa.gov/api/prod/datagetter", params=params, timeout=10)
+                response = http_get("https://api.tidesandcurrents.noaa.gov/api/prod/datagetter", params=params, timeout=10, source=self.source_name)
                 content_type = response.headers.get("content-type", "")
                 if response.status_code == 200 and "json" in content_type.lower():
                     raw[product] = response.json()
@@ -155,27 +160,10 @@ class NoaaAdapter(SourceAdapter):
         """
         series: List[Dict[str, object]] = []
         for chunk_begin, chunk_end in _chunk_ranges(begin, end, _MAX_RANGE_DAYS):
-            params = {
-                "station": station,
-                "product": "currents_predictions",
-                "begin_date": chunk_begin.strftime("%Y%m%d"),
-                "end_date": chunk_end.strftime("%Y%m%d"),
-                "interval": "60",
-                "format": "json",
-                "units": "english",
-                "time_zone": "gmt",
-                "application": "ORCAST",
-            }
             try:
-                response = requests.get(_DATAGETTER_URL, params=params, timeout=30)
-                content_type = response.headers.get("content-type", "")
-                if response.status_code != 200 or "json" not in content_type.lower():
-                    continue
-                payload = response.json()
-            except (requests.RequestException, ValueError):
+                series.extend(self.fetch_chunk("currents_predictions", station, chunk_begin, chunk_end))
+            except NoaaChunkError:
                 continue
-
-            series.extend(_normalize_current_predictions(payload, station=station))
         return series
 
     def _fetch_history(
@@ -187,29 +175,49 @@ class NoaaAdapter(SourceAdapter):
     ) -> List[Dict[str, object]]:
         series: List[Dict[str, object]] = []
         for chunk_begin, chunk_end in _chunk_ranges(begin, end, _MAX_RANGE_DAYS):
-            params = {
-                "station": station,
-                "product": product,
-                "begin_date": chunk_begin.strftime("%Y%m%d"),
-                "end_date": chunk_end.strftime("%Y%m%d"),
-                "datum": "MLLW",
-                "format": "json",
-                "units": "english",
-                "time_zone": "gmt",
-                "application": "ORCAST",
-            }
             try:
-                response = requests.get(_DATAGETTER_URL, params=params, timeout=30)
-                content_type = response.headers.get("content-type", "")
-                if response.status_code != 200 or "json" not in content_type.lower():
-                    continue
-                payload = response.json()
-            except (requests.RequestException, ValueError):
+                series.extend(self.fetch_chunk(product, station, chunk_begin, chunk_end))
+            except NoaaChunkError:
                 continue
-
-            series.extend(_normalize_series(payload, product=product, station=station))
         return series
 
+    def fetch_chunk(
+        self,
+        product: str,
+        station: str,
+        begin: Union[date, datetime],
+        end: Union[date, datetime],
+    ) -> List[Dict[str, object]]:
+        """Fetch and normalize one datagetter request (at most 31 days).
+
+        ``product`` is an observation product (``water_level``, ``currents``,
+        ...) or ``currents_predictions``. Unlike the ``fetch_*_history``
+        methods, which skip failed chunks, a failed request raises
+        :class:`NoaaChunkError` so a backfill can report the hole.
+        """
+        params = {
+            "station": station,
+            "product": product,
+            "begin_date": _as_date(begin).strftime("%Y%m%d"),
+            "end_date": _as_date(end).strftime("%Y%m%d"),
+        }
+        if product == "currents_predictions":
+            params["interval"] = "60"
+        else:
+            params["datum"] = "MLLW"
+        params.update({"format": "json", "units": "english", "time_zone": "gmt", "application": "ORCAST"})
+        try:
+            response = http_get(_DATAGETTER_URL, params=params, timeout=30, source=self.source_name)
+            content_type = response.headers.get("content-type", "")
+            if response.status_code != 200 or "json" not in content_type.lower():
+                raise NoaaChunkError(f"HTTP {response.status_code} ({content_type or 'no content-type'})")
+            payload = response.json()
+        except (requests.RequestException, ValueError) as exc:
+            raise NoaaChunkError(f"{type(exc).__name__}: {exc}") from exc
+        if product == "currents_predictions":
+            return _normalize_current_predictions(payload, station=station)
+        return _normalize_series(payload, product=product, station=station)
+
 
 def _chunk_ranges(
     begin: Union[date, datetime],
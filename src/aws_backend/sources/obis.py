@@ -8,6 +8,7 @@ import requests
 from ..geo_region import SAN_JUAN_BOUNDS, filter_and_snap
 from ..models import NormalizedSighting, SourceEvidence
 from .base import SourceAdapter, SourceFetchResult
+from .transport import http_get
 
 OBIS_OCCURRENCE_URL = "https://api.obis.org/v3/occurrence"
 
@@ -54,7 +55,7 @@ class LiveObisAdapter(SourceAdapter):
         if end_date:
             params["enddate"] = end_date
         try:
-            response = requests.get(OBIS_OCCURRENCE_URL, params=params, timeout=self.timeout)
+            response = http_get(OBIS_OCCURRENCE_URL, params=params, timeout=self.timeout, source=self.source_name)
             content_type = response.headers.get("content-type", "")
             if response.status_code != 200:
                 return SourceFetchResult(
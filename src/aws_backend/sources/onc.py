@@ -23,6 +23,7 @@ from urllib.parse import quote
 import requests
 
 from ..config import settings
+from .transport import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +107,7 @@ def _redact(text: str) -> str:
 
 def list_hydrophone_locations() -> List[Dict[str, Any]]:
     """Discover Salish Sea hydrophone locations and their location codes."""
-    resp = requests.get(
+    resp = http_get(
         f"{ONC_BASE}/locations",
         params={"deviceCategoryCode": "HYDROPHONE", "token": _token()},
         timeout=_TIMEOUT,
@@ -158,7 +159,7 @@ def recent_spectrogram_filename(location_code: str, *, days: int = 2) -> Optiona
     """
     date_to = datetime.now(timezone.utc)
     date_from = date_to - timedelta(days=days)
-    resp = requests.get(
+    resp = http_get(
         f"{ONC_BASE}/archivefile/location",
         params={
             "locationCode": location_code,
@@ -201,7 +202,7 @@ def download_archivefile(filename: str) -> Tuple[bytes, str]:
     SSRF / parameter-injection vector (AX-2).
     """
     validate_archive_filename(filename)
-    resp = requests.get(
+    resp = http_get(
         f"{ONC_BASE}/archivefile/download",
         params={"filename": filename, "token": _token()},
         timeout=_TIMEOUT,
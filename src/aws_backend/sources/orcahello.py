@@ -8,6 +8,7 @@ import requests
 from ..geo_region import in_bounds
 from ..models import NormalizedSighting, SourceEvidence
 from .base import SourceAdapter, SourceFetchResult
+from .transport import http_get
 
 
 # OrcaHello / "AI For Orcas" detections REST API (v1.2). The detections API is a
@@ -60,7 +61,7 @@ class OrcaHelloAdapter(SourceAdapter):
             "RecordsPerPage": 50,
         }
         try:
-            response = requests.get(f"{self.base_url}{self._endpoint}", params=params, timeout=12)
+            response = http_get(f"{self.base_url}{self._endpoint}", params=params, timeout=12, source=self.source_name)
             content_type = response.headers.get("content-type", "")
             if response.status_code != 200:
                 return SourceFetchResult(
@@ -19,6 +19,7 @@ from typing import List, Optional
 import requests
 
 from ..geo_region import in_bounds
+from .transport import http_get
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +142,7 @@ class OrcaHelloHistoryAdapter:
         }
         url = endpoint or self._endpoint
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_get(url, params=params, timeout=self.timeout, source=self.source_name)
         except requests.RequestException as exc:
             logger.warning("OrcaHello history request failed on page %s: %s", page, exc)
             return None
@@ -8,6 +8,7 @@ from typing import Dict, List
 import requests
 
 from ..geo_region import SAN_JUAN_BOUNDS
+from .transport import http_get
 
 _NOAA_MPA_URL = (
     "https://services2.arcgis.com/C8EMgrsFhRFLWSkJ/arcgis/rest/services/"
@@ -38,7 +39,7 @@ class ProtectedAreasAdapter:
             "f": "json",
         }
         try:
-            response = requests.get(_NOAA_MPA_URL, params=params, timeout=self.timeout)
+            response = http_get(_NOAA_MPA_URL, params=params, timeout=self.timeout, source=self.source_name)
         except requests.RequestException:
             return []
         if response.status_code != 200:
@@ -8,10 +8,9 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import requests
-
 from ..models import NormalizedSighting
 from .base import SourceAdapter, SourceFetchResult
+from .transport import http_get
 
 # Daily Chinook run-timing INDEX adapter (the k_salmon prey covariate in
 # docs/methodology/FORECAST_KERNELS.md). It produces a normalized 0-1 daily
@@ -191,7 +190,7 @@ class SalmonRunAdapter(SourceAdapter):
         """
         params = {**_DART_PARAMS, "year": str(year)}
         for _attempt in range(4):
-            response = requests.get(self.dart_url, params=params, timeout=_HTTP_TIMEOUT)
+            response = http_get(self.dart_url, params=params, timeout=_HTTP_TIMEOUT, source=self.source_name)
             if getattr(response, "status_code", None) != 200:
                 return {}
             ctype = (response.headers.get("content-type") or "").lower()
@@ -90,6 +90,7 @@ from .salmon import (
     _normalize_within_season,
     _parse_daily_payload,
 )
+from .transport import http_get
 
 _HTTP_TIMEOUT = 30
 _DNS_RETRIES = 5
@@ -165,8 +166,9 @@ def _get_with_dns_retry(url: str, params: Optional[dict] = None) -> requests.Res
     last: Optional[Exception] = None
     for attempt in range(_DNS_RETRIES):
         try:
-            return requests.get(
-                url, params=params, timeout=_HTTP_TIMEOUT, headers=_HEADERS, allow_redirects=True
+            return http_get(
+                url, params=params, timeout=_HTTP_TIMEOUT, headers=_HEADERS, allow_redirects=True,
+                source="salmon_validation",
             )
         except (requests.exceptions.ConnectionError, socket.gaierror) as exc:  # pragma: no cover
             last = exc
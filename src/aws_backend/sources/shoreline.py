@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-import requests
+from .transport import http_get
 
 
 _CUSP_QUERY_URL = (
@@ -41,7 +41,7 @@ class ShorelineAdapter:
                 "inSR": "4326",
                 "spatialRel": "esriSpatialRelIntersects",
             })
-        response = requests.get(_CUSP_QUERY_URL, params=params, timeout=self.timeout)
+        response = http_get(_CUSP_QUERY_URL, params=params, timeout=self.timeout, source=self.source_name)
         if response.status_code != 200:
             return []
         payload = response.json()
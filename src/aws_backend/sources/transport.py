@@ -0,0 +1,204 @@
+"""Shared HTTP transport for the source adapters.
+
+Adapters call :func:`http_get` instead of ``requests.get``. By default
+(``ORCAST_HTTP_TRANSPORT=direct``) that *is* ``requests.get`` with the same
+arguments, so behaviour, and every test that patches ``requests.get``, is
+unchanged. With ``ORCAST_HTTP_TRANSPORT=pooled`` calls go through one
+process-wide :class:`HttpTransport`:
+
+* one ``requests.Session`` whose adapter keeps a keep-alive connection pool
+  per host, so repeated polls skip the TCP/TLS handshake;
+* conditional GETs: the ``ETag`` / ``Last-Modified`` validators of 200
+  responses are remembered per (URL, params), sent back as ``If-None-Match`` /
+  ``If-Modified-Since``, and a ``304`` returns the remembered response, so an
+  unchanged NDBC / WSF payload is not downloaded again;
+* a bounded retry budget for connection errors, timeouts and
+  429 / 502 / 503 / 504, with capped exponential backoff and full jitter
+  (``Retry-After`` is honoured up to the cap);
+* a per-source concurrency limit (a semaphore per ``source`` name) so a
+  fan-out cannot open more than N simultaneous requests to one upstream.
+
+:func:`set_transport` swaps in any transport (tests point one at a local
+stub server); it takes effect regardless of the env setting.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_DEFAULT_SOURCE = "default"
+
+
+@dataclass(frozen=True)
+class _Validated:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    response: requests.Response
+
+
+def _cache_key(url: str, params: Any) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    if not params:
+        return url, ()
+    items = params.items() if isinstance(params, Mapping) else params
+    return url, tuple(sorted((str(k), str(v)) for k, v in items))
+
+
+def pooled_session(pool_size: int = 10, hosts: int = 16) -> requests.Session:
+    """A session with a ``pool_size``-connection keep-alive pool for each of up to ``hosts`` hosts."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=hosts, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HttpTransport:
+    """Pooled, validator-caching, retrying GETs with per-source concurrency limits."""
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        *,
+        pool_size: int = 10,
+        max_retries: int = 2,
+        backoff_s: float = 0.5,
+        max_backoff_s: float = 8.0,
+        source_limit: int = 4,
+        cache_entries: int = 256,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.session = session or pooled_session(pool_size)
+        self.max_retries = max(0, max_retries)
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.source_limit = max(1, source_limit)
+        self.cache_entries = cache_entries
+        self._sleep = sleep
+        self._jitter = jitter
+        self._validated: "OrderedDict[Tuple[str, Tuple[Tuple[str, str], ...]], _Validated]" = OrderedDict()
+        self._limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.stats: Counter = Counter()
+
+    def get(
+        self,
+        url: str,
+        *,
+        source: str = _DEFAULT_SOURCE,
+        params: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """GET ``url``; a ``304`` against remembered validators returns the remembered response."""
+        key = _cache_key(url, params)
+        with self._lock:
+            cached = self._validated.get(key)
+            if cached is not None:
+                self._validated.move_to_end(key)
+        send = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                send.setdefault("If-None-Match", cached.etag)
+            if cached.last_modified:
+                send.setdefault("If-Modified-Since", cached.last_modified)
+
+        with self._limit(source):
+            response = self._send(url, params, send, kwargs)
+        self.stats["requests"] += 1
+        if response.status_code == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            return cached.response
+        if response.status_code == 200:
+            self._remember(key, response)
+        return response
+
+    def _limit(self, source: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._limits.get(source)
+            if limit is None:
+                limit = self._limits[source] = threading.BoundedSemaphore(self.source_limit)
+            return limit
+
+    def _remember(self, key, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            if not (etag or last_modified) or self.cache_entries <= 0:
+                self._validated.pop(key, None)
+                return
+            self._validated[key] = _Validated(etag, last_modified, response)
+            self._validated.move_to_end(key)
+            while len(self._validated) > self.cache_entries:
+                self._validated.popitem(last=False)
+
+    def _send(self, url: str, params: Any, headers: Dict[str, str], kwargs: Dict[str, Any]) -> requests.Response:
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            try:
+                response = self.session.get(url, params=params, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if last:
+                    raise
+                logger.debug("transport: retrying %s after %s", url, type(exc).__name__)
+                self._sleep(self._delay(attempt, None))
+                self.stats["retries"] += 1
+                continue
+            if response.status_code not in RETRY_STATUSES or last:
+                return response
+            self._sleep(self._delay(attempt, response))
+            self.stats["retries"] += 1
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        cap = min(self.max_backoff_s, self.backoff_s * (2 ** attempt))
+        if response is not None:
+            try:
+                return min(self.max_backoff_s, max(0.0, float(response.headers.get("Retry-After", ""))))
+            except ValueError:
+                pass
+        return self._jitter() * cap
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """The process-wide transport, built from settings on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport(
+                max_retries=settings.http_max_retries,
+                source_limit=settings.http_source_concurrency,
+            )
+        return _transport
+
+
+def set_transport(transport: Optional[HttpTransport]) -> None:
+    """Route :func:`http_get` through ``transport``; ``None`` restores the env default."""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def http_get(url: str, *, source: str = _DEFAULT_SOURCE, **kwargs: Any) -> requests.Response:
+    """``requests.get(url, **kwargs)``, or the shared transport when pooling is on or injected."""
+    if _transport is None and settings.http_transport != "pooled":
+        return requests.get(url, **kwargs)
+    return get_transport().get(url, source=source, **kwargs)
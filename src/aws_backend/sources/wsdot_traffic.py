@@ -38,6 +38,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from .transport import http_get
+
 logger = logging.getLogger(__name__)
 
 WSDOT_BASE = "https://www.wsdot.wa.gov"
@@ -163,7 +165,7 @@ def _get_json(path: str, extra_params: Optional[Dict[str, Any]] = None) -> Optio
     if extra_params:
         params.update(extra_params)
     try:
-        resp = requests.get(f"{WSDOT_BASE}{path}", params=params, timeout=_TIMEOUT)
+        resp = http_get(f"{WSDOT_BASE}{path}", params=params, timeout=_TIMEOUT, source="wsdot_traffic")
     except requests.RequestException as exc:
         logger.warning("WSDOT request failed for %s: %s", path, _redact(str(exc), code))
         return None
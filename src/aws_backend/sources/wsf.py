@@ -28,6 +28,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from .transport import http_get
+
 logger = logging.getLogger(__name__)
 
 WSF_BASE = "https://www.wsdot.wa.gov/ferries/api"
@@ -123,7 +125,7 @@ def _get(path: str) -> Any:
         return None
     url = f"{WSF_BASE}/{path.lstrip('/')}"
     try:
-        resp = requests.get(url, params={"apiaccesscode": code}, timeout=_TIMEOUT)
+        resp = http_get(url, params={"apiaccesscode": code}, timeout=_TIMEOUT, source="wsf")
     except requests.RequestException as exc:
         logger.warning("WSF request failed: %s", _redact(str(exc)))
         return None
@@ -10,7 +10,14 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from .geo_region import SAN_JUAN_BOUNDS, in_bounds, is_in_water, nearest_shore_m
+from .geo_region import (
+    SAN_JUAN_BOUNDS,
+    in_bounds,
+    is_in_water,
+    is_on_land_many,
+    nearest_shore_m,
+    nearest_shore_m_many,
+)
 from .sources.bathymetry import BathymetryAdapter
 
 SPATIAL_GRID_STREAM = "spatial_grid_covariates"
@@ -34,27 +41,35 @@ def build_grid_cells(
     now = datetime.now(timezone.utc).isoformat()
     cells: List[Dict[str, Any]] = []
 
+    points = []
     lat = SAN_JUAN_BOUNDS.min_lat
     while lat <= SAN_JUAN_BOUNDS.max_lat + 1e-9:
         lng = SAN_JUAN_BOUNDS.min_lng
         while lng <= SAN_JUAN_BOUNDS.max_lng + 1e-9:
-            if is_in_water(lat, lng):
-                cells.append(
-                    {
-                        "t": now,
-                        "id": cell_id_for(lat, lng),
-                        "cell_id": cell_id_for(lat, lng),
-                        "lat": round(lat, 6),
-                        "lng": round(lng, 6),
-                        "depth_m": bathy.depth_at(lat, lng),
-                        "nearest_shore_m": nearest_shore_m(lat, lng),
-                        "inside_land": False,
-                        "source": "orcast_spatial_enrichment",
-                        "bathymetry_source": bathy.summary().get("source"),
-                    }
-                )
+            if in_bounds(lat, lng):
+                points.append((lat, lng))
             lng += step_degrees
         lat += step_degrees
+
+    # Land and shoreline tests run as batches over the whole grid.
+    on_land = is_on_land_many([p[0] for p in points], [p[1] for p in points])
+    water = [point for point, land in zip(points, on_land) if not land]
+    shore_m = nearest_shore_m_many([p[0] for p in water], [p[1] for p in water])
+    for (lat, lng), shore in zip(water, shore_m):
+        cells.append(
+            {
+                "t": now,
+                "id": cell_id_for(lat, lng),
+                "cell_id": cell_id_for(lat, lng),
+                "lat": round(lat, 6),
+                "lng": round(lng, 6),
+                "depth_m": bathy.depth_at(lat, lng),
+                "nearest_shore_m": shore,
+                "inside_land": False,
+                "source": "orcast_spatial_enrichment",
+                "bathymetry_source": bathy.summary().get("source"),
+            }
+        )
     return cells
 
 
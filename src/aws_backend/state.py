@@ -4,6 +4,7 @@ import uuid
 from typing import Any, List, Optional
 
 from .config import settings
+from .ingestion import SourcePlan, fetch_sources
 from .models import IngestionRun, SourceStatus
 from .scoring import generate_hotspots
 from .sources.community import CommunitySubmissionAdapter
@@ -39,40 +40,32 @@ def run_ingestion(include_live: bool = True) -> IngestionRun:
     global latest_ingestion_run
     run = IngestionRun(run_id=f"ingest_{uuid.uuid4().hex[:12]}")
 
-    all_sightings = []
-    statuses: List[SourceStatus] = []
-
-    def _process(adapter) -> List:
-        result = adapter.fetch()
-        raw_payload_ref = None
-        if result.raw is not None:
-            raw_payload_ref = storage.put_raw_payload(adapter.source_name, result.raw, run.run_id)
-        normalized = adapter.normalize(result)
-        if raw_payload_ref:
-            for sighting in normalized:
-                for evidence in sighting.evidence:
-                    evidence.raw_payload_ref = raw_payload_ref
-        statuses.append(adapter.status(result, len(normalized)))
-        all_sightings.extend(normalized)
-        if result.error:
-            run.errors.append(f"{adapter.source_name}: {result.error}")
-        return result, normalized
-
     # OBIS backbone: prefer the live API, fall back to the local seed so we
     # never end up without a verified-occurrence backbone.
     if include_live and settings.enable_live_obis:
-        result, normalized = _process(LiveObisAdapter())
-        if not result.available or not normalized:
-            _process(LocalObisAdapter())
+        plans = [SourcePlan(LiveObisAdapter(), fallback=LocalObisAdapter())]
     else:
-        _process(LocalObisAdapter())
-
+        plans = [SourcePlan(LocalObisAdapter())]
     if include_live and settings.enable_live_inaturalist:
-        _process(INaturalistAdapter())
+        plans.append(SourcePlan(INaturalistAdapter()))
     if include_live and settings.enable_orcahello:
-        _process(OrcaHelloAdapter())
+        plans.append(SourcePlan(OrcaHelloAdapter()))
     if settings.enable_community:
-        _process(CommunitySubmissionAdapter())
+        plans.append(SourcePlan(CommunitySubmissionAdapter()))
+
+    outcomes = fetch_sources(
+        plans,
+        lambda source, raw: storage.put_raw_payload(source, raw, run.run_id),
+        max_workers=settings.ingestion_workers,
+        deadline_s=settings.ingestion_deadline_s,
+    )
+    all_sightings = []
+    statuses: List[SourceStatus] = []
+    for outcome in outcomes:
+        statuses.append(outcome.status)
+        all_sightings.extend(outcome.sightings)
+        if outcome.result.error:
+            run.errors.append(f"{outcome.adapter.source_name}: {outcome.result.error}")
 
     deduped = deduplicate_sightings(all_sightings)
     validated = cross_validate_sightings(deduped)
@@ -0,0 +1,208 @@
+"""Compressed, column-blocked binary format for time-series partitions.
+
+An alternative to the NDJSON monthly partitions of ``S3TimeSeriesStore``
+(``timeseries/{stream}/{station}/{yyyy}/{mm}.tsb``). Layout, integers
+little-endian::
+
+    column blocks ... | footer (UTF-8 JSON) | u32 footer length | b"OTSB"
+
+Every column is its own compressed block, so a reader decompresses only the
+columns it asks for. Two blocks are typed: ``__epoch__`` (float64 POSIX
+seconds of each ``t``) and ``__layout__`` (uint32 index into the footer's list
+of key orders, so records round-trip with their exact keys and key order).
+Every record field, ``t`` included, is a JSON-encoded value column. The footer
+carries the format version, row count, codec and the epoch min/max, letting
+readers skip a partition or bisect to a row range without touching the value
+columns.
+
+Stdlib only: the codec is zlib (the footer names it, so a faster codec can be
+added without a format bump).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"OTSB"
+FORMAT_VERSION = 1
+EXTENSION = ".tsb"
+CONTENT_TYPE = "application/vnd.orcast.timeseries"
+
+_EPOCH_COLUMN = "__epoch__"
+_LAYOUT_COLUMN = "__layout__"
+_TRAILER = struct.Struct("<I4s")
+_ZLIB_LEVEL = 6
+
+
+class PartitionFormatError(ValueError):
+    """Bytes that are not a readable binary partition."""
+
+
+def _parse_t(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    text = value.replace("Z", "+00:00") if isinstance(value, str) else value
+    return datetime.fromisoformat(text)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def encode_partition(records: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize records (each with a ``t``) into one binary partition."""
+    records = list(records)
+    epochs = array("d")
+    layout_ids = array("I")
+    layouts: Dict[Tuple[str, ...], int] = {}
+    fields: Dict[str, None] = {}
+    naive = False
+    for record in records:
+        t = _parse_t(record["t"])
+        if t.tzinfo is None:
+            naive = True
+            t = t.replace(tzinfo=timezone.utc)
+        epochs.append(t.timestamp())
+        keys = tuple(record)
+        layout_ids.append(layouts.setdefault(keys, len(layouts)))
+        for key in keys:
+            fields.setdefault(key, None)
+
+    blocks: List[Tuple[str, bytes]] = [
+        (_EPOCH_COLUMN, _little_endian(epochs)),
+        (_LAYOUT_COLUMN, _little_endian(layout_ids)),
+    ]
+    for field in fields:
+        column = [record.get(field) for record in records]
+        blocks.append((field, json.dumps(column, separators=(",", ":")).encode("utf-8")))
+
+    body = bytearray()
+    columns = []
+    for name, raw in blocks:
+        compressed = zlib.compress(raw, _ZLIB_LEVEL)
+        columns.append({"name": name, "offset": len(body), "length": len(compressed)})
+        body += compressed
+    footer = {
+        "version": FORMAT_VERSION,
+        "codec": "zlib",
+        "rows": len(records),
+        "t_min": min(epochs) if epochs else None,
+        "t_max": max(epochs) if epochs else None,
+        "sorted": all(epochs[i] <= epochs[i + 1] for i in range(len(epochs) - 1)),
+        "naive": naive,
+        "layouts": [list(keys) for keys in layouts],
+        "columns": columns,
+    }
+    footer_bytes = json.dumps(footer, separators=(",", ":")).encode("utf-8")
+    return bytes(body) + footer_bytes + _TRAILER.pack(len(footer_bytes), MAGIC)
+
+
+class PartitionReader:
+    """Random access to one binary partition's footer, row ranges and columns."""
+
+    def __init__(self, data: bytes) -> None:
+        if len(data) < _TRAILER.size:
+            raise PartitionFormatError("partition is truncated")
+        footer_len, magic = _TRAILER.unpack_from(data, len(data) - _TRAILER.size)
+        if magic != MAGIC:
+            raise PartitionFormatError("not a binary time-series partition")
+        footer_end = len(data) - _TRAILER.size
+        try:
+            footer = json.loads(data[footer_end - footer_len:footer_end].decode("utf-8"))
+        except ValueError as exc:
+            raise PartitionFormatError("unreadable partition footer") from exc
+        if footer.get("version") != FORMAT_VERSION or footer.get("codec") != "zlib":
+            raise PartitionFormatError(
+                f"unsupported partition version/codec {footer.get('version')}/{footer.get('codec')}"
+            )
+        self._data = data
+        self.footer = footer
+        self.rows: int = footer["rows"]
+        self.t_min: Optional[float] = footer["t_min"]
+        self.t_max: Optional[float] = footer["t_max"]
+        self.naive: bool = footer["naive"]
+        self.sorted: bool = footer["sorted"]
+        self._blocks = {column["name"]: column for column in footer["columns"]}
+        self._decoded: Dict[str, Any] = {}
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def fields(self) -> List[str]:
+        return [name for name in self._blocks if name not in (_EPOCH_COLUMN, _LAYOUT_COLUMN)]
+
+    def _raw(self, name: str) -> bytes:
+        block = self._blocks[name]
+        start = block["offset"]
+        return zlib.decompress(self._data[start:start + block["length"]])
+
+    def _column(self, name: str) -> Any:
+        if name not in self._decoded:
+            if name == _EPOCH_COLUMN:
+                self._decoded[name] = _from_little_endian("d", self._raw(name))
+            elif name == _LAYOUT_COLUMN:
+                self._decoded[name] = _from_little_endian("I", self._raw(name))
+            else:
+                self._decoded[name] = json.loads(self._raw(name))
+        return self._decoded[name]
+
+    def epochs(self) -> array:
+        return self._column(_EPOCH_COLUMN)
+
+    def row_range(self, start_epoch: float, end_epoch: float) -> Tuple[int, int]:
+        """Rows whose epoch lies in ``[start_epoch, end_epoch]`` (sorted partitions only)."""
+        if not self.sorted:
+            raise PartitionFormatError("row ranges need a time-sorted partition")
+        if self.rows == 0 or self.t_max < start_epoch or self.t_min > end_epoch:
+            return 0, 0
+        epochs = self.epochs()
+        return bisect_left(epochs, start_epoch), bisect_right(epochs, end_epoch)
+
+    def records(self, lo: int = 0, hi: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Rows ``[lo, hi)`` as dicts, optionally projected onto ``fields``.
+
+        The full, unprojected decode is memoized; callers must not mutate it.
+        """
+        full = lo == 0 and (hi is None or hi >= self.rows) and fields is None
+        if full and self._records is not None:
+            return self._records
+        hi = self.rows if hi is None else min(hi, self.rows)
+        if lo >= hi:
+            return []
+        wanted = None if fields is None else set(fields)
+        layouts = [
+            [key for key in keys if wanted is None or key in wanted]
+            for keys in self.footer["layouts"]
+        ]
+        needed = {key for keys in layouts for key in keys}
+        columns = {name: self._column(name) for name in needed}
+        layout_ids = self._column(_LAYOUT_COLUMN)
+        out = [
+            {key: columns[key][row] for key in layouts[layout_ids[row]]}
+            for row in range(lo, hi)
+        ]
+        if full:
+            self._records = out
+        return out
+
+
+def decode_partition(data: bytes) -> List[Dict[str, Any]]:
+    """All records of a binary partition, in stored order."""
+    return PartitionReader(data).records()
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import bisect
 import hashlib
 import math
-from datetime import datetime
-from typing import Iterable, List
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .models import CrossValidationResult, NormalizedSighting, SourceEvidence, ValidationStatus
 
 
+EARTH_RADIUS_KM = 6371.0088
+
+# Great-circle distance is never shorter than the meridional arc, so a latitude
+# band of radius / KM_PER_DEGREE_LAT degrees bounds every possible match.
+_KM_PER_DEGREE_LAT = EARTH_RADIUS_KM * math.pi / 180.0
+# Cells never shrink below this, so a zero radius still gets a finite grid.
+_MIN_CELL_KM = 0.01
+# Inflates the search reach so float rounding at a cell edge cannot drop a match;
+# every candidate is still confirmed with the exact scalar haversine_km.
+_REACH_SLACK = 1e-6
+# Time comparisons closer than this to the window edge are re-checked exactly.
+_TIME_FRINGE_S = 1.0
+
+
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    radius_km = 6371.0088
+    radius_km = EARTH_RADIUS_KM
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
     dphi = math.radians(lat2 - lat1)
@@ -41,6 +57,150 @@ def stable_canonical_id(sighting: NormalizedSighting, spatial_precision: int = 2
     return "canon_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
 
 
+def _epoch_seconds(value: datetime) -> float:
+    """Epoch seconds for bucketing; naive timestamps are read as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class _SpaceTimeGrid:
+    """Bucket points into lat/lng cells sized to a search radius.
+
+    With ``window_hours`` set, cells are also split into time buckets sized to
+    the window, so a query only visits the handful of neighbouring space-time
+    cells that can hold a match. The grid only *proposes* candidates; callers
+    confirm each one with ``haversine_km`` / ``time_score`` so results are
+    identical to a full pairwise scan. Points that cannot be placed on the
+    sphere (non-finite or |lat| > 90) are kept aside and proposed to every query.
+    """
+
+    def __init__(self, radius_km: float, window_hours: Optional[float] = None) -> None:
+        self._reach_km = radius_km * (1.0 + _REACH_SLACK) + _REACH_SLACK
+        self._reach_deg = math.degrees(self._reach_km / EARTH_RADIUS_KM)
+        self._half_angle_sin = math.sin(min(self._reach_km / (2.0 * EARTH_RADIUS_KM), math.pi / 2.0))
+        cell_deg = (radius_km if radius_km > _MIN_CELL_KM else _MIN_CELL_KM) / _KM_PER_DEGREE_LAT
+        self._lat_cell = cell_deg
+        # Longitude columns divide 360 exactly so the antimeridian wraps cleanly.
+        self._lng_cols = max(1, math.ceil(360.0 / cell_deg))
+        self._lng_cell = 360.0 / self._lng_cols
+
+        window_s = (window_hours or 0.0) * 3600.0
+        self._bucket_s = window_s if math.isfinite(window_s) and window_s > 0 else None
+        self._cells: Dict[Tuple[int, int], Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+        self._unplaced: List[int] = []
+
+    @staticmethod
+    def _placeable(lat: float, lng: float) -> bool:
+        return math.isfinite(lat) and math.isfinite(lng) and -90.0 <= lat <= 90.0
+
+    def _bucket(self, epoch_s: Optional[float]) -> int:
+        if self._bucket_s is None or epoch_s is None:
+            return 0
+        return math.floor(epoch_s / self._bucket_s)
+
+    def add(self, index: int, lat: float, lng: float, epoch_s: Optional[float] = None) -> None:
+        if not self._placeable(lat, lng):
+            self._unplaced.append(index)
+            return
+        row = math.floor(lat / self._lat_cell)
+        col = math.floor((lng + 180.0) / self._lng_cell) % self._lng_cols
+        self._cells[(self._bucket(epoch_s), row)][col].append(index)
+
+    def _lng_span_deg(self, lat: float) -> float:
+        # haversine a >= cos(lat1) cos(lat2) sin^2(dlng / 2), with lat2 at most
+        # reach_deg further from the equator than lat1.
+        far_lat = min(90.0, abs(lat) + self._reach_deg)
+        denom = math.cos(math.radians(lat)) * math.cos(math.radians(far_lat))
+        if denom <= 0.0:
+            return 360.0
+        ratio = self._half_angle_sin / math.sqrt(denom)
+        if ratio >= 1.0:
+            return 360.0
+        return math.degrees(2.0 * math.asin(ratio))
+
+    def candidates(self, lat: float, lng: float, epoch_s: Optional[float] = None) -> Iterator[int]:
+        yield from self._unplaced
+        if not self._placeable(lat, lng):
+            for cols in self._cells.values():
+                for members in cols.values():
+                    yield from members
+            return
+
+        if self._bucket_s is None or epoch_s is None:
+            buckets = range(0, 1)
+        else:
+            buckets = range(
+                self._bucket(epoch_s - self._bucket_s - _TIME_FRINGE_S),
+                self._bucket(epoch_s + self._bucket_s + _TIME_FRINGE_S) + 1,
+            )
+        rows = range(
+            math.floor(max(-90.0, lat - self._reach_deg) / self._lat_cell),
+            math.floor(min(90.0, lat + self._reach_deg) / self._lat_cell) + 1,
+        )
+        span = self._lng_span_deg(lat)
+        first = math.floor((lng - span + 180.0) / self._lng_cell)
+        last = math.floor((lng + span + 180.0) / self._lng_cell)
+        whole_row = last - first + 1 >= self._lng_cols
+        wanted = None if whole_row else {col % self._lng_cols for col in range(first, last + 1)}
+
+        for bucket in buckets:
+            for row in rows:
+                cols = self._cells.get((bucket, row))
+                if not cols:
+                    continue
+                if wanted is None:
+                    for members in cols.values():
+                        yield from members
+                else:
+                    for col in wanted:
+                        members = cols.get(col)
+                        if members:
+                            yield from members
+
+
+def _temporal_match_count(
+    epochs: List[float],
+    order: List[int],
+    index: int,
+    sightings: List[NormalizedSighting],
+    temporal_window_hours: float,
+) -> int:
+    """How many sightings (self included) fall inside the temporal window.
+
+    ``epochs`` is sorted and ``order`` maps its positions back to indices in
+    ``sightings``. Everything comfortably inside the window is counted by
+    bisection; the thin fringe around the window edge is confirmed with
+    ``time_score`` so the count matches the pairwise loop exactly.
+    """
+    if not temporal_window_hours > 0:
+        return 0
+    center = _epoch_seconds(sightings[index].timestamp)
+    window_s = temporal_window_hours * 3600.0
+    inner = window_s - _TIME_FRINGE_S
+    count = 0
+    if inner > 0:
+        count = bisect.bisect_left(epochs, center + inner) - bisect.bisect_right(epochs, center - inner)
+        fringes = (
+            (bisect.bisect_left(epochs, center - window_s - _TIME_FRINGE_S), bisect.bisect_right(epochs, center - inner)),
+            (bisect.bisect_left(epochs, center + inner), bisect.bisect_right(epochs, center + window_s + _TIME_FRINGE_S)),
+        )
+    else:
+        fringes = (
+            (
+                bisect.bisect_left(epochs, center - window_s - _TIME_FRINGE_S),
+                bisect.bisect_right(epochs, center + window_s + _TIME_FRINGE_S),
+            ),
+        )
+    timestamp = sightings[index].timestamp
+    for lo, hi in fringes:
+        for position in range(lo, hi):
+            other = sightings[order[position]]
+            if time_score(timestamp, other.timestamp, temporal_window_hours) > 0:
+                count += 1
+    return count
+
+
 def deduplicate_sightings(
     sightings: Iterable[NormalizedSighting],
     spatial_radius_km: float = 5.0,
@@ -48,6 +208,10 @@ def deduplicate_sightings(
 ) -> List[NormalizedSighting]:
     deduped: List[NormalizedSighting] = []
     by_source = {}
+    # Identity of a match never depends on the mutable fields a merge touches,
+    # so each canonical sighting is indexed once, at its own position/time.
+    searchable = spatial_radius_km >= 0 and temporal_window_hours > 0
+    grid = _SpaceTimeGrid(spatial_radius_km, temporal_window_hours)
 
     for sighting in sightings:
         if not valid_coordinates(sighting.latitude, sighting.longitude):
@@ -64,17 +228,21 @@ def deduplicate_sightings(
         by_source[source_key] = sighting
 
         matched = None
-        for existing in deduped:
-            distance = haversine_km(
-                sighting.latitude,
-                sighting.longitude,
-                existing.latitude,
-                existing.longitude,
-            )
-            temporal_score = time_score(sighting.timestamp, existing.timestamp, temporal_window_hours)
-            if distance <= spatial_radius_km and temporal_score > 0:
-                matched = existing
-                break
+        epoch_s = _epoch_seconds(sighting.timestamp)
+        if searchable:
+            # First match in insertion order, exactly like a linear scan.
+            for position in sorted(grid.candidates(sighting.latitude, sighting.longitude, epoch_s)):
+                existing = deduped[position]
+                distance = haversine_km(
+                    sighting.latitude,
+                    sighting.longitude,
+                    existing.latitude,
+                    existing.longitude,
+                )
+                temporal_score = time_score(sighting.timestamp, existing.timestamp, temporal_window_hours)
+                if distance <= spatial_radius_km and temporal_score > 0:
+                    matched = existing
+                    break
 
         if matched:
             matched.evidence.extend(sighting.evidence)
@@ -92,6 +260,7 @@ def deduplicate_sightings(
                 )
         else:
             sighting.canonical_id = stable_canonical_id(sighting)
+            grid.add(len(deduped), sighting.latitude, sighting.longitude, epoch_s)
             deduped.append(sighting)
 
     return deduped
@@ -102,24 +271,67 @@ def cross_validate_sightings(
     spatial_radius_km: float = 10.0,
     temporal_window_hours: float = 48.0,
 ) -> List[NormalizedSighting]:
-    for sighting in sightings:
+    count = len(sightings)
+    ids = [s.sighting_id for s in sightings]
+    lats = [s.latitude for s in sightings]
+    lngs = [s.longitude for s in sightings]
+    cos_lats = [math.cos(math.radians(lat)) for lat in lats]
+    epochs = [_epoch_seconds(s.timestamp) for s in sightings]
+    window_s = temporal_window_hours * 3600.0
+
+    # Each unordered pair is visited once through a radius-sized grid and
+    # credited to both sides; haversine and time_score are symmetric, so the
+    # tallies equal the pairwise loop over every (sighting, other).
+    spatial_counts = [0] * count
+    matched: List[List[int]] = [[] for _ in range(count)]
+    if spatial_radius_km >= 0:
+        grid = _SpaceTimeGrid(spatial_radius_km)
+        for index in range(count):
+            grid.add(index, lats[index], lngs[index])
+        for index in range(count):
+            lat1, lng1, cos1, epoch1 = lats[index], lngs[index], cos_lats[index], epochs[index]
+            for other in sorted(j for j in grid.candidates(lat1, lng1) if j > index):
+                if ids[other] == ids[index]:
+                    continue
+                # Same float operations as haversine_km, with the cosines hoisted.
+                a = (
+                    math.sin(math.radians(lats[other] - lat1) / 2) ** 2
+                    + cos1 * cos_lats[other] * math.sin(math.radians(lngs[other] - lng1) / 2) ** 2
+                )
+                distance = 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+                if not distance <= spatial_radius_km:
+                    continue
+                spatial_counts[index] += 1
+                spatial_counts[other] += 1
+                if not temporal_window_hours > 0:
+                    continue
+                gap = abs(epochs[other] - epoch1)
+                if gap > window_s + _TIME_FRINGE_S:
+                    continue
+                if gap >= window_s - _TIME_FRINGE_S and not (
+                    time_score(sightings[index].timestamp, sightings[other].timestamp, temporal_window_hours) > 0
+                ):
+                    continue
+                matched[index].append(other)
+                matched[other].append(index)
+
+    order = sorted(range(count), key=epochs.__getitem__)
+    sorted_epochs = [epochs[i] for i in order]
+    by_id: Dict[str, List[int]] = defaultdict(list)
+    for index, sighting_id in enumerate(ids):
+        by_id[sighting_id].append(index)
+
+    for index, sighting in enumerate(sightings):
+        spatial_matches = spatial_counts[index]
+        matched_ids = [ids[other] for other in matched[index]]
         independent_sources = {sighting.source}
-        spatial_matches = 0
-        temporal_matches = 0
-        matched_ids: List[str] = []
-
-        for other in sightings:
-            if other.sighting_id == sighting.sighting_id:
-                continue
-            distance = haversine_km(sighting.latitude, sighting.longitude, other.latitude, other.longitude)
-            temporal = time_score(sighting.timestamp, other.timestamp, temporal_window_hours)
-            if distance <= spatial_radius_km:
-                spatial_matches += 1
-            if temporal > 0:
-                temporal_matches += 1
-            if distance <= spatial_radius_km and temporal > 0:
-                independent_sources.add(other.source)
-                matched_ids.append(other.sighting_id)
+        independent_sources.update(sightings[other].source for other in matched[index])
+
+        # Sightings sharing this id (self included) are never compared.
+        temporal_matches = _temporal_match_count(sorted_epochs, order, index, sightings, temporal_window_hours)
+        for twin in by_id[sighting.sighting_id]:
+            if time_score(sighting.timestamp, sightings[twin].timestamp, temporal_window_hours) > 0:
+                temporal_matches -= 1
 
         evidence_score = min(1.0, (len(sighting.evidence) * 0.2) + sighting.confidence * 0.5 + sighting.source_reliability * 0.3)
         source_score = min(1.0, len(independent_sources) / 3.0)
@@ -0,0 +1,231 @@
+"""Rasterized land/water mask for the San Juan pilot region.
+
+An optional acceleration layer on top of the exact polygon tests in
+``geo_region``. The pilot bounding box is cut into square cells of a
+configurable resolution and each cell is classified once:
+
+* ``WATER`` / ``LAND``: no land-ring edge touches the (padded) cell, so every
+  point in it has the same answer as the cell centre under the exact ray-cast;
+* ``COAST``: at least one edge touches the cell, so callers must fall back to
+  the exact test.
+
+Alongside the classes the mask carries a distance-to-shore field: the
+nearest-shoreline-vertex distance (metres, float32) from each cell centre.
+
+Both arrays live in one binary file next to the GeoJSON
+(``san_juan_land.mask.bin``) with a JSON header (``san_juan_land.mask.json``)
+recording the source GeoJSON digest, resolution and bounds. ``load_or_build``
+memory-maps the file when the header matches and rebuilds it when the GeoJSON,
+resolution or bounds change. If the directory is read-only the freshly built
+mask is kept in memory and a warning is logged, mirroring the permissive
+degrade of the land-mask loader.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MASK_FORMAT_VERSION = 1
+
+WATER = 0
+LAND = 1
+COAST = 2
+
+# Cells are padded by this fraction of their size before testing edge contact,
+# so float rounding in the cell lookup can never land a point outside the
+# rectangle that was certified pure.
+_CELL_PAD_FRACTION = 1e-6
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def mask_paths(geojson_path: Path) -> Tuple[Path, Path]:
+    """Header and data paths for the mask stored next to ``geojson_path``."""
+    stem = geojson_path.name[: -len(".geojson")] if geojson_path.name.endswith(".geojson") else geojson_path.stem
+    return (
+        geojson_path.with_name(f"{stem}.mask.json"),
+        geojson_path.with_name(f"{stem}.mask.bin"),
+    )
+
+
+class WaterMask:
+    """Cell classes plus a distance-to-shore field over a lat/lng box."""
+
+    def __init__(
+        self,
+        bounds: Tuple[float, float, float, float],
+        resolution_deg: float,
+        classes: memoryview,
+        shore_m: memoryview,
+    ) -> None:
+        self.min_lat, self.max_lat, self.min_lng, self.max_lng = bounds
+        self.resolution_deg = resolution_deg
+        self.rows, self.cols = self.shape(bounds, resolution_deg)
+        self._classes = classes
+        self._shore_m = shore_m
+
+    @staticmethod
+    def shape(bounds: Tuple[float, float, float, float], resolution_deg: float) -> Tuple[int, int]:
+        min_lat, max_lat, min_lng, max_lng = bounds
+        rows = max(1, math.ceil((max_lat - min_lat) / resolution_deg))
+        cols = max(1, math.ceil((max_lng - min_lng) / resolution_deg))
+        return rows, cols
+
+    def cell(self, lat: float, lng: float) -> Optional[int]:
+        """Flat cell index for an in-box point, else ``None``."""
+        if not (self.min_lat <= lat <= self.max_lat and self.min_lng <= lng <= self.max_lng):
+            return None
+        row = min(self.rows - 1, int((lat - self.min_lat) / self.resolution_deg))
+        col = min(self.cols - 1, int((lng - self.min_lng) / self.resolution_deg))
+        return row * self.cols + col
+
+    def cell_class(self, lat: float, lng: float) -> Optional[int]:
+        index = self.cell(lat, lng)
+        return None if index is None else self._classes[index]
+
+    def shore_m(self, lat: float, lng: float) -> Optional[float]:
+        """Distance-to-shore field value for the cell holding the point."""
+        index = self.cell(lat, lng)
+        if index is None:
+            return None
+        value = self._shore_m[index]
+        return None if math.isnan(value) else value
+
+    @classmethod
+    def build(
+        cls,
+        bounds: Tuple[float, float, float, float],
+        resolution_deg: float,
+        rings: List[List[Tuple[float, float]]],
+        is_on_land: Callable[[float, float], bool],
+        nearest_shore_km: Callable[[float, float], float],
+    ) -> "WaterMask":
+        """Classify every cell and fill the distance field.
+
+        ``rings`` are ``(lng, lat)`` land rings; ``is_on_land`` and
+        ``nearest_shore_km`` are the exact tests used for pure-cell centres.
+        """
+        min_lat, _max_lat, min_lng, _max_lng = bounds
+        rows, cols = cls.shape(bounds, resolution_deg)
+        classes = bytearray(rows * cols)
+        pad = resolution_deg * _CELL_PAD_FRACTION
+
+        # Any cell an edge's padded bounding box reaches is COAST. This is
+        # conservative (a long diagonal edge marks a few extra cells) and that
+        # only costs an exact fallback, never a wrong answer.
+        for ring in rings:
+            count = len(ring)
+            for i in range(count):
+                x0, y0 = ring[i - 1]
+                x1, y1 = ring[i]
+                r0 = math.floor((min(y0, y1) - pad - min_lat) / resolution_deg)
+                r1 = math.floor((max(y0, y1) + pad - min_lat) / resolution_deg)
+                c0 = math.floor((min(x0, x1) - pad - min_lng) / resolution_deg)
+                c1 = math.floor((max(x0, x1) + pad - min_lng) / resolution_deg)
+                for row in range(max(0, r0), min(rows - 1, r1) + 1):
+                    base = row * cols
+                    for col in range(max(0, c0), min(cols - 1, c1) + 1):
+                        classes[base + col] = COAST
+
+        # COAST cells always fall back to the exact tests, so only pure cells
+        # get a class from their centre and a field value.
+        shore = array("f", [math.nan]) * (rows * cols)
+        for row in range(rows):
+            lat = min_lat + (row + 0.5) * resolution_deg
+            for col in range(cols):
+                index = row * cols + col
+                if classes[index] == COAST:
+                    continue
+                lng = min_lng + (col + 0.5) * resolution_deg
+                if is_on_land(lat, lng):
+                    classes[index] = LAND
+                    shore[index] = 0.0
+                    continue
+                distance_km = nearest_shore_km(lat, lng)
+                if math.isfinite(distance_km):
+                    shore[index] = distance_km * 1000.0
+        return cls(bounds, resolution_deg, memoryview(classes), memoryview(shore))
+
+    @classmethod
+    def load_or_build(
+        cls,
+        geojson_path: Path,
+        bounds: Tuple[float, float, float, float],
+        resolution_deg: float,
+        rings: List[List[Tuple[float, float]]],
+        is_on_land: Callable[[float, float], bool],
+        nearest_shore_km: Callable[[float, float], float],
+    ) -> "WaterMask":
+        """Memory-map the stored mask, rebuilding it when it is stale."""
+        header_path, data_path = mask_paths(geojson_path)
+        expected = {
+            "version": MASK_FORMAT_VERSION,
+            "source_sha256": _digest(geojson_path),
+            "resolution_deg": resolution_deg,
+            "bounds": list(bounds),
+            "byteorder": sys.byteorder,
+        }
+        mask = cls._load(header_path, data_path, expected)
+        if mask is not None:
+            return mask
+
+        logger.info("Building water mask at %.5f deg for %s", resolution_deg, geojson_path)
+        mask = cls.build(bounds, resolution_deg, rings, is_on_land, nearest_shore_km)
+        try:
+            mask._save(header_path, data_path, expected)
+        except OSError as exc:
+            logger.warning("Could not store water mask next to %s (%s); keeping it in memory only", geojson_path, exc)
+        return mask
+
+    @classmethod
+    def _load(cls, header_path: Path, data_path: Path, expected: dict) -> Optional["WaterMask"]:
+        try:
+            header = json.loads(header_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if any(header.get(key) != value for key, value in expected.items()):
+            return None
+        rows, cols = cls.shape(tuple(expected["bounds"]), expected["resolution_deg"])
+        cells = rows * cols
+        try:
+            with data_path.open("rb") as file:
+                if os.fstat(file.fileno()).st_size != cells * 5:
+                    return None
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        view = memoryview(mapped)
+        return cls(
+            tuple(expected["bounds"]),
+            expected["resolution_deg"],
+            view[:cells],
+            view[cells:].cast("f"),
+        )
+
+    def _save(self, header_path: Path, data_path: Path, header: dict) -> None:
+        # Write data first and swap both files in atomically, so a reader never
+        # sees a header that describes a half-written array.
+        tmp_data = data_path.with_name(data_path.name + ".tmp")
+        tmp_header = header_path.with_name(header_path.name + ".tmp")
+        with tmp_data.open("wb") as file:
+            file.write(self._classes)
+            file.write(self._shore_m.cast("B"))
+        tmp_header.write_text(
+            json.dumps({**header, "rows": self.rows, "cols": self.cols}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_header, header_path)
@@ -13,7 +13,7 @@ Anacortes leg is never labeled measured.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -370,3 +370,22 @@ def test_default_clients_degrade_gracefully_when_siblings_absent():
     plan = plan_connection({"mode": "ferry", "ferry": {}}, clients=clients, now=NOW)
     assert plan["feasibility"]["verdict"] == "unknown"
     assert plan["mode"] == "ferry"
+
+
+def test_cached_sailing_space_backdates_the_freshness_stamp():
+    from src.aws_backend.casting.trips.upstream_cache import UpstreamCache, cached_clients
+
+    clock = [500.0]
+    cache = UpstreamCache(clock=lambda: clock[0])
+    clients = cached_clients(_clients(), cache)
+
+    first = plan_connection(_ferry_intent(), clients=clients, now=NOW)
+    clock[0] += 4.0
+    second = plan_connection(_ferry_intent(), clients=clients, now=NOW)
+
+    assert first["freshness"] == NOW.isoformat()
+    # Every feed was served from the cache, and the space counts are reported
+    # as 4 s old rather than as a fresh reading.
+    assert cache.stats["hits"] == 4 and cache.stats["misses"] == 4
+    assert second["freshness"] == (NOW - timedelta(seconds=4)).isoformat()
+    assert second["legs"] == first["legs"] and second["feasibility"] == first["feasibility"]
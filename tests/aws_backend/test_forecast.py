@@ -1,6 +1,8 @@
 from fastapi.testclient import TestClient
 
 from src.aws_backend.main import app, run_ingestion
+from src.aws_backend.scoring import probability_at_location, score_locations, spatial_forecast_grid
+from src.aws_backend.state import ensure_hotspots
 
 
 def test_spatial_forecast_hours_changes_output():
@@ -33,3 +35,29 @@ def test_deprecated_routes_return_410():
         detail = response.json()["detail"]
         assert detail["deprecated"] is True
         assert detail["replacement"]
+
+
+def test_spatial_grid_matches_pointwise_scoring():
+    run_ingestion(include_live=False)
+    hotspots = ensure_hotspots()
+    grid = spatial_forecast_grid(48.5158, -123.1526, 8, hotspots, step_degrees=0.02, forecast_hours=168)
+
+    assert len({p["timestamp"] for p in grid}) == 1
+    for point in grid[:: max(1, len(grid) // 25)]:
+        pred = probability_at_location(point["lat"], point["lng"], hotspots)
+        assert abs(point["probability"] - pred["probability"]) <= 0.001
+        assert abs(point["confidence"] - pred["confidence"]) <= 0.001
+
+
+def test_score_locations_batch_equals_scalar():
+    run_ingestion(include_live=False)
+    hotspots = ensure_hotspots()
+    lats = [48.45, 48.52, 48.61]
+    lngs = [-123.20, -123.05, -122.95]
+
+    scored = score_locations(lats, lngs, hotspots)
+
+    for i, (lat, lng) in enumerate(zip(lats, lngs)):
+        pred = probability_at_location(lat, lng, hotspots)
+        assert round(scored["probability"][i], 3) == pred["probability"]
+        assert hotspots[scored["nearest_index"][i]].hotspot_id == pred["nearest_hotspot"]["hotspot_id"]
@@ -0,0 +1,118 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.aws_backend.kernel_model import tiles
+from src.aws_backend.kernel_model.serve import FittedKernels, FourierKernel, KernelForecaster
+from src.aws_backend.kernel_model.tiles import (
+    ForecastTile,
+    TileFormatError,
+    coefficient_digest,
+    current_tile,
+    load_tile,
+    materialize_tile,
+    refresh_forecast_tiles,
+)
+
+_CELLS = [
+    {"cell_id": "48.500:-123.000", "lat": 48.5, "lng": -123.0},
+    {"cell_id": "48.550:-123.100", "lat": 48.55, "lng": -123.1},
+    {"cell_id": "48.600:-122.950", "lat": 48.6, "lng": -122.95},
+]
+_START = datetime(2026, 3, 1, 6, 7, tzinfo=timezone.utc)
+
+
+def _fit(intercept=-2.0):
+    return FittedKernels(
+        intercept=intercept,
+        kernels={
+            "diel": FourierKernel(cos=[0.5, -0.2], sin=[0.3]),
+            "lunar": FourierKernel(cos=[0.1]),
+            "season": FourierKernel(sin=[0.2]),
+            "tide": FourierKernel(cos=[0.4]),
+        },
+        version="t",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_tile_cache():
+    tiles._tile_cache.update(tile=None, adhoc=None)
+    yield
+    tiles._tile_cache.update(tile=None, adhoc=None)
+
+
+def test_digest_tracks_coefficients_not_metadata():
+    fit = _fit()
+    same = FittedKernels(**{**fit.__dict__, "version": "other", "fitted_at": "2026-01-01"})
+    assert coefficient_digest(fit) == coefficient_digest(same)
+    assert coefficient_digest(fit) != coefficient_digest(_fit(intercept=-1.9))
+
+
+def test_tile_matches_forecaster_and_roundtrips():
+    fit = _fit()
+    tile = materialize_tile(fit, _CELLS, start=_START, horizon_days=1.0, step_minutes=30.0)
+    assert tile.start == datetime(2026, 3, 1, 6, 0, tzinfo=timezone.utc)
+    assert tile.n_times == 48 and tile.n_cells == 3
+    assert tile.values.typecode == "f"
+
+    forecaster = KernelForecaster(fit)
+    for i in (0, 17, 47):
+        for j, cell in enumerate(_CELLS):
+            expected = forecaster.log_intensity(tile.time_at(i), cell["lat"], cell["lng"])
+            assert math.isclose(tile.row(i)[j], expected, abs_tol=1e-6)
+
+    back = ForecastTile.from_bytes(tile.to_bytes())
+    assert back.digest == tile.digest and back.start == tile.start and back.cells == tile.cells
+    assert list(back.values) == list(tile.values)
+    assert back.slot(_START + timedelta(minutes=50)) == 1
+    assert back.slot(tile.end) is None
+    with pytest.raises(TileFormatError):
+        ForecastTile.from_bytes(b"not a tile at all")
+
+
+def test_refresh_is_fresh_until_digest_changes(tmp_path):
+    fit = _fit()
+    first = refresh_forecast_tiles(fit, _CELLS, now=_START, directory=tmp_path)
+    assert first["status"] == "materialized"
+    assert refresh_forecast_tiles(fit, _CELLS, now=_START + timedelta(hours=2), directory=tmp_path)["status"] == "fresh"
+    # Horizon running out -> rebuilt under the same digest.
+    later = _START + timedelta(days=6, hours=12)
+    assert refresh_forecast_tiles(fit, _CELLS, now=later, directory=tmp_path)["status"] == "materialized"
+
+    promoted = _fit(intercept=-1.5)
+    second = refresh_forecast_tiles(promoted, _CELLS, now=later, directory=tmp_path)
+    assert second["status"] == "materialized" and second["digest"] != first["digest"]
+    # The previous digest's tile is gone; only the promoted one is stored.
+    assert load_tile(first["digest"], tmp_path) is None
+    assert [p.stem for p in tmp_path.glob("*.oft")] == [second["digest"]]
+
+
+def test_current_tile_never_serves_a_stale_digest(tmp_path):
+    old = _fit()
+    end = _START + timedelta(hours=6)
+    tile = current_tile(old, _START, end, cells=_CELLS, directory=tmp_path)
+    assert tile.digest == coefficient_digest(old)
+    assert current_tile(old, _START, end, cells=_CELLS, directory=tmp_path) is tile
+
+    new = _fit(intercept=-1.0)
+    fresh = current_tile(new, _START, end, cells=_CELLS, directory=tmp_path)
+    assert fresh.digest == coefficient_digest(new)
+    assert math.isclose(fresh.row(0)[0] - tile.row(0)[0], 1.0, abs_tol=1e-5)
+
+
+def test_current_tile_serves_other_windows_without_touching_stored_tiles(tmp_path):
+    fit = _fit()
+    stored = refresh_forecast_tiles(fit, _CELLS, now=_START, directory=tmp_path)
+    files = {p.name: p.read_bytes() for p in tmp_path.iterdir()}
+
+    inside = current_tile(fit, _START, _START + timedelta(hours=6), cells=_CELLS, directory=tmp_path)
+    assert inside.start.isoformat() == stored["start"]
+    # Alternating out-of-window requests are built in memory and never stored.
+    past = _START - timedelta(days=30)
+    for _ in range(2):
+        outside = current_tile(fit, past, past + timedelta(hours=6), cells=_CELLS, directory=tmp_path)
+        assert outside.covers(past, past + timedelta(hours=6))
+        assert current_tile(fit, _START, _START + timedelta(hours=6), cells=_CELLS, directory=tmp_path) is inside
+    assert {p.name: p.read_bytes() for p in tmp_path.iterdir()} == files
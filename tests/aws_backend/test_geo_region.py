@@ -1,5 +1,13 @@
+import dataclasses
+import json
+import mmap
+import random
+
+import pytest
+
 from src.aws_backend import geo_region as geo
 from src.aws_backend.geo_region import SAN_JUAN_BOUNDS
+from src.aws_backend.water_mask import COAST, LAND, WaterMask, mask_paths
 
 
 def test_mask_loaded():
@@ -65,3 +73,113 @@ def test_bounds_constant_shape():
     assert SAN_JUAN_BOUNDS.max_lat == 48.70
     assert SAN_JUAN_BOUNDS.min_lng == -123.25
     assert SAN_JUAN_BOUNDS.max_lng == -122.75
+
+
+def test_prepared_land_matches_plain_ray_cast():
+    rng = random.Random(11)
+    lats = [rng.uniform(48.38, 48.72) for _ in range(1500)]
+    lngs = [rng.uniform(-123.27, -122.73) for _ in range(1500)]
+    # Ring vertices sit exactly on edges, the hardest case for the slab index.
+    for ring in geo._LAND_RINGS[:5]:
+        for lng, lat in ring[:25]:
+            lats.append(lat)
+            lngs.append(lng)
+
+    expected = [any(geo._point_in_ring(lat, lng, ring) for ring in geo._LAND_RINGS) for lat, lng in zip(lats, lngs)]
+    assert geo.is_on_land_many(lats, lngs) == expected
+
+
+def test_nearest_shore_matches_vertex_scan():
+    rng = random.Random(5)
+    lats = [rng.uniform(48.40, 48.70) for _ in range(150)]
+    lngs = [rng.uniform(-123.25, -122.75) for _ in range(150)]
+
+    for lat, lng, got in zip(lats, lngs, geo.nearest_shore_m_many(lats, lngs)):
+        if geo.is_on_land(lat, lng):
+            assert got == 0.0
+            continue
+        best_km = min(geo._distance_km(lat, lng, y, x) for ring in geo._LAND_RINGS for x, y in ring)
+        assert got == round(best_km * 1000.0, 1)
+
+
+def test_batch_helpers_reject_mismatched_lengths():
+    with pytest.raises(ValueError):
+        geo.is_on_land_many([48.5], [])
+    with pytest.raises(ValueError):
+        geo.nearest_shore_m_many([48.5, 48.6], [-123.0])
+
+
+def _mask_at(geojson_path, resolution=0.004):
+    return WaterMask.load_or_build(
+        geojson_path,
+        (SAN_JUAN_BOUNDS.min_lat, SAN_JUAN_BOUNDS.max_lat, SAN_JUAN_BOUNDS.min_lng, SAN_JUAN_BOUNDS.max_lng),
+        resolution,
+        geo._LAND_RINGS,
+        geo._PREPARED_LAND.is_on_land,
+        geo._PREPARED_LAND.shore.nearest_km,
+    )
+
+
+@pytest.fixture(scope="module")
+def mask_geojson(tmp_path_factory):
+    geojson = tmp_path_factory.mktemp("mask") / "san_juan_land.geojson"
+    geojson.write_bytes(geo._resolve_geojson_path().read_bytes())
+    _mask_at(geojson)
+    return geojson
+
+
+def test_water_mask_pure_cells_agree_with_exact_test(mask_geojson):
+    mask = _mask_at(mask_geojson)
+
+    rng = random.Random(2)
+    pure = 0
+    for _ in range(3000):
+        lat = rng.uniform(SAN_JUAN_BOUNDS.min_lat, SAN_JUAN_BOUNDS.max_lat)
+        lng = rng.uniform(SAN_JUAN_BOUNDS.min_lng, SAN_JUAN_BOUNDS.max_lng)
+        cell_class = mask.cell_class(lat, lng)
+        if cell_class == COAST:
+            continue
+        pure += 1
+        assert (cell_class == LAND) == geo._PREPARED_LAND.is_on_land(lat, lng)
+    assert pure > 1500
+
+
+def test_water_mask_drives_land_and_shore_queries(mask_geojson, monkeypatch):
+    monkeypatch.setattr(geo, "_WATER_MASK", _mask_at(mask_geojson))
+
+    assert geo.is_on_land(48.53, -123.08) is True
+    assert geo.is_in_water(48.55, -123.20) is True
+    lat, lng = geo.snap_to_water(48.516, -123.15)
+    assert geo.is_in_water(lat, lng) is True
+    # The field is exact at cell centres and within half a cell diagonal elsewhere.
+    exact = geo._PREPARED_LAND.shore.nearest_km(48.55, -123.20) * 1000.0
+    assert abs(geo.nearest_shore_m(48.55, -123.20) - exact) < 300.0
+
+
+def test_water_mask_is_memory_mapped_and_rebuilt_on_change(mask_geojson):
+    header_path, data_path = mask_paths(mask_geojson)
+    first = json.loads(header_path.read_text())
+
+    reloaded = _mask_at(mask_geojson)
+    assert isinstance(reloaded._classes.obj, mmap.mmap)
+
+    mask_geojson.write_text(mask_geojson.read_text() + "\n")
+    _mask_at(mask_geojson)
+    assert json.loads(header_path.read_text())["source_sha256"] != first["source_sha256"]
+    assert data_path.stat().st_size == first["rows"] * first["cols"] * 5
+
+
+def test_water_mask_is_built_off_the_request_path(mask_geojson, monkeypatch):
+    monkeypatch.setattr(geo, "settings", dataclasses.replace(geo.settings, water_mask_resolution_deg=0.004))
+    monkeypatch.setattr(geo, "_resolve_geojson_path", lambda: mask_geojson)
+    monkeypatch.setattr(geo, "_WATER_MASK", None)
+
+    with geo._WATER_MASK_LOCK:  # hold the build while "requests" arrive
+        thread = geo.warm_water_mask()
+        assert thread is not None and thread.daemon
+        assert geo.is_on_land(48.53, -123.08) is True
+        assert geo._water_mask() is None
+    thread.join(timeout=30)
+
+    assert isinstance(geo._water_mask(), WaterMask)
+    assert geo.warm_water_mask() is None
@@ -0,0 +1,91 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.aws_backend.ingestion import SourcePlan, fetch_sources
+from src.aws_backend.main import run_ingestion
+from src.aws_backend.sources.base import SourceAdapter, SourceFetchResult
+
+
+class _FakeAdapter(SourceAdapter):
+    def __init__(self, name, delay=0.0, records=1, available=True, deadline=None):
+        self.source_name = name
+        self.delay = delay
+        self.records = records
+        self.available = available
+        self.fetch_deadline_s = deadline
+        self.fetched = threading.Event()
+
+    def fetch(self):
+        time.sleep(self.delay)
+        self.fetched.set()
+        return SourceFetchResult(source=self.source_name, available=self.available,
+                                 raw={"n": self.records} if self.available else None)
+
+    def normalize(self, result):
+        if not result.available:
+            return []
+        return [SimpleNamespace(source=self.source_name, evidence=[SimpleNamespace(raw_payload_ref=None)])
+                for _ in range(self.records)]
+
+
+def _writer(log):
+    def write(source, raw):
+        log.append((source, threading.current_thread().name))
+        return f"raw/{source}"
+    return write
+
+
+def test_fetches_overlap_and_outcomes_keep_plan_order():
+    plans = [SourcePlan(_FakeAdapter(name, delay=0.3)) for name in ("obis", "inat", "orcahello")]
+    writes = []
+    started = time.perf_counter()
+    outcomes = fetch_sources(plans, _writer(writes), max_workers=4)
+    assert time.perf_counter() - started < 0.6
+    assert [o.adapter.source_name for o in outcomes] == ["obis", "inat", "orcahello"]
+    assert all(o.status.latency_ms >= 300 for o in outcomes)
+    # Raw payloads are persisted on the calling thread and stamped on the evidence.
+    assert {thread for _, thread in writes} == {threading.current_thread().name}
+    assert outcomes[1].sightings[0].evidence[0].raw_payload_ref == "raw/inat"
+
+
+def test_fallback_follows_its_primary_in_both_modes():
+    def plans():
+        return [
+            SourcePlan(_FakeAdapter("obis_live", available=False), fallback=_FakeAdapter("obis_local")),
+            SourcePlan(_FakeAdapter("inat", delay=0.1)),
+            SourcePlan(_FakeAdapter("community", records=0), fallback=_FakeAdapter("unused")),
+        ]
+
+    for workers in (1, 4):
+        outcomes = fetch_sources(plans(), _writer([]), max_workers=workers)
+        names = [o.adapter.source_name for o in outcomes]
+        assert names == ["obis_live", "obis_local", "inat", "community", "unused"], workers
+
+    kept = plans()
+    kept[0] = SourcePlan(_FakeAdapter("obis_live"), fallback=_FakeAdapter("obis_local"))
+    assert [o.adapter.source_name for o in fetch_sources(kept, _writer([]), max_workers=4)][:2] == [
+        "obis_live", "inat"]
+
+
+def test_source_past_its_deadline_is_reported_unavailable():
+    slow = _FakeAdapter("orcahello", delay=1.0)
+    writes = []
+    started = time.perf_counter()
+    outcomes = fetch_sources(
+        [SourcePlan(_FakeAdapter("obis")), SourcePlan(slow), SourcePlan(_FakeAdapter("inat", deadline=5.0))],
+        _writer(writes), max_workers=4, deadline_s=0.2,
+    )
+    assert time.perf_counter() - started < 0.8
+    late = outcomes[1]
+    assert not late.status.available and late.sightings == [] and "deadline" in late.status.error
+    assert late.status.latency_ms == 200.0
+    assert [o.status.available for o in outcomes] == [True, False, True]
+    # The overrunning fetch finishes in the background; its payload is dropped.
+    assert slow.fetched.wait(2.0)
+    assert "orcahello" not in [source for source, _ in writes]
+
+
+def test_run_ingestion_records_per_source_latency():
+    run = run_ingestion(include_live=False)
+    assert run.statuses and all(status.latency_ms is not None for status in run.statuses)
@@ -111,6 +111,50 @@ def test_forecaster_tide_phase_is_optional_and_applied():
     assert math.isclose(shifted, -1.0 + 0.4, abs_tol=1e-9)
 
 
+def test_fourier_kernel_values_match_value():
+    kernel = FourierKernel(cos=[0.7, -0.3, 0.1], sin=[0.4])
+    phases = [i / 37.0 - 1.5 for i in range(120)]
+    for got, phase in zip(kernel.values(phases), phases):
+        assert math.isclose(got, kernel.value(phase), abs_tol=1e-12)
+    assert FourierKernel().values([0.1, 0.2]) == [0.0, 0.0]
+
+
+def test_log_intensity_many_matches_pointwise_surface():
+    from datetime import timedelta
+
+    fit = FittedKernels(
+        intercept=-2.0,
+        kernels={
+            "diel": FourierKernel(cos=[0.5, -0.2], sin=[0.3]),
+            "lunar": FourierKernel(cos=[0.1], sin=[0.2, 0.05]),
+            "season": FourierKernel(cos=[0.3]),
+            "tide": FourierKernel(cos=[0.4, 0.1], sin=[0.2, 0.1]),
+            "unknown": FourierKernel(cos=[9.0]),
+        },
+        station_effects={"haro_strait": 0.3},
+    )
+    forecaster = KernelForecaster(fit)
+    start = datetime(2026, 2, 27, 20, 0, tzinfo=timezone.utc)
+    times = [start + timedelta(minutes=15 * i) for i in range(40)]
+    times[3] = times[3].replace(tzinfo=None)  # naive == UTC, as in log_intensity
+    tides = [None if i % 4 == 0 else (0.07 * i) % 1.0 for i in range(40)]
+    lats = [48.4, 48.5, 48.6, 48.5]
+    lngs = [-123.1, -123.0, -123.1, -122.9]
+    stations = ["haro_strait", None, "ghost", None]
+
+    surface = forecaster.log_intensity_many(times, lats, lngs, stations, tides)
+    assert len(surface) == len(times) and all(len(row) == len(lats) for row in surface)
+    for i, when in enumerate(times):
+        for j in range(len(lats)):
+            expected = forecaster.log_intensity(when, lats[j], lngs[j], station=stations[j], tide_phase=tides[i])
+            assert math.isclose(surface[i][j], expected, abs_tol=1e-12)
+
+    with pytest.raises(ValueError):
+        forecaster.log_intensity_many(times, lats, lngs[:2])
+    with pytest.raises(ValueError):
+        forecaster.log_intensity_many(times, lats, lngs, tide_phases=tides[:3])
+
+
 # -- read_s3_json: 404 (cacheable) vs transient (never cached) ---------------
 def test_read_s3_json_genuine_miss_returns_none_and_caches(monkeypatch):
     import boto3
@@ -0,0 +1,175 @@
+import threading
+import time
+from datetime import date, datetime, timezone
+
+from src.aws_backend.ingest_timeseries import CURRENTS, WATER_LEVEL, backfill_noaa_history
+from src.aws_backend.noaa_backfill import (
+    BackfillCheckpoint,
+    RateLimiter,
+    backfill_noaa,
+    month_chunks,
+)
+from src.aws_backend.sources.noaa import NoaaChunkError
+from src.aws_backend.timeseries import MemoryTimeSeriesStore
+
+_WIDE_START = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_WIDE_END = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeChunkNoaa:
+    """Answers ``fetch_chunk`` with one record per chunk, after ``delay_s``."""
+
+    station = "9449880"
+    current_station = "PUG1702"
+    current_stations = ["PUG1701", "PUG1702"]
+
+    def __init__(self, delay_s=0.0, fail=(), empty=()):
+        self.delay_s = delay_s
+        self.fail = set(fail)
+        self.empty = set(empty)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_chunk(self, product, station, begin, end):
+        with self._lock:
+            self.calls.append((product, station, begin))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay_s)
+            if (product, station, begin) in self.fail:
+                raise NoaaChunkError("HTTP 503 (text/html)")
+            if (product, station) in self.empty:
+                return []
+            return [{"t": f"{begin.isoformat()}T00:00:00+00:00", "value": 1.0, "product": product, "station": station}]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _write_to(store):
+    def write(chunk, records):
+        stream = WATER_LEVEL if chunk.product == "water_level" else CURRENTS
+        return store.put_series(stream, chunk.station, records)
+
+    return write
+
+
+def test_month_chunks_align_to_calendar_months():
+    assert month_chunks(date(2024, 1, 15), date(2024, 3, 2)) == [
+        (date(2024, 1, 15), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 3, 1), date(2024, 3, 2)),
+    ]
+    assert month_chunks(datetime(2024, 5, 3, 12), datetime(2024, 5, 3, 18)) == [(date(2024, 5, 3), date(2024, 5, 3))]
+
+
+def test_backfill_fetches_chunks_concurrently_and_writes_everything():
+    noaa = FakeChunkNoaa(delay_s=0.05)
+    store = MemoryTimeSeriesStore()
+
+    summary = backfill_noaa(
+        noaa,
+        _write_to(store),
+        date(2024, 1, 1),
+        date(2024, 6, 30),
+        water_stations=[noaa.station],
+        current_stations=noaa.current_stations,
+        workers=4,
+        rate_per_s=0,
+    )
+
+    # 6 months x (1 water-level + 2 current stations), no predictions needed.
+    assert summary == {"stations": ["9449880", "PUG1701", "PUG1702"], "records": 18, "chunks": 18, "resumed": 0, "missing": []}
+    assert noaa.peak > 1
+    assert len(store.get_series(WATER_LEVEL, "9449880", _WIDE_START, _WIDE_END)) == 6
+    assert len(store.get_series(CURRENTS, "PUG1702", _WIDE_START, _WIDE_END)) == 6
+
+
+def test_stations_without_observed_currents_fall_back_to_predictions():
+    noaa = FakeChunkNoaa(empty={("currents", "PUG1702")})
+    store = MemoryTimeSeriesStore()
+
+    summary = backfill_noaa(
+        noaa,
+        _write_to(store),
+        date(2024, 1, 1),
+        date(2024, 2, 29),
+        water_stations=[noaa.station],
+        current_stations=noaa.current_stations,
+        rate_per_s=0,
+    )
+
+    products = {(product, station) for product, station, _ in noaa.calls}
+    assert ("currents_predictions", "PUG1702") in products
+    assert ("currents_predictions", "PUG1701") not in products
+    assert summary["chunks"] == 8
+    rows = store.get_series(CURRENTS, "PUG1702", _WIDE_START, _WIDE_END)
+    assert [r["product"] for r in rows] == ["currents_predictions"] * 2
+
+
+def test_failed_chunks_are_reported_and_retried_from_the_checkpoint(tmp_path):
+    path = tmp_path / "noaa_backfill.json"
+    failing = ("water_level", "9449880", date(2024, 2, 1))
+    noaa = FakeChunkNoaa(fail={failing})
+    store = MemoryTimeSeriesStore()
+    kwargs = dict(water_stations=[noaa.station], current_stations=["PUG1701"], rate_per_s=0)
+
+    first = backfill_noaa(noaa, _write_to(store), date(2024, 1, 1), date(2024, 3, 31), checkpoint=BackfillCheckpoint(path), **kwargs)
+    assert first["records"] == 5
+    assert first["missing"] == [
+        {"station": "9449880", "product": "water_level", "begin": "2024-02-01", "end": "2024-02-29", "error": "HTTP 503 (text/html)"}
+    ]
+
+    # A fresh run against the same file fetches only the chunk that failed.
+    retry = FakeChunkNoaa()
+    second = backfill_noaa(retry, _write_to(store), date(2024, 1, 1), date(2024, 3, 31), checkpoint=BackfillCheckpoint(path), **kwargs)
+    assert retry.calls == [failing]
+    assert second == {"stations": ["9449880", "PUG1701"], "records": 1, "chunks": 6, "resumed": 5, "missing": []}
+    assert len(store.get_series(WATER_LEVEL, "9449880", _WIDE_START, _WIDE_END)) == 3
+
+
+def test_resumed_empty_observed_chunks_still_plan_predictions():
+    noaa = FakeChunkNoaa(empty={("currents", "PUG1701")})
+    checkpoint = BackfillCheckpoint()
+    kwargs = dict(water_stations=[], current_stations=["PUG1701"], rate_per_s=0, checkpoint=checkpoint)
+    backfill_noaa(noaa, _write_to(MemoryTimeSeriesStore()), date(2024, 1, 1), date(2024, 1, 31), **kwargs)
+
+    rerun = FakeChunkNoaa()
+    summary = backfill_noaa(rerun, _write_to(MemoryTimeSeriesStore()), date(2024, 1, 1), date(2024, 1, 31), **kwargs)
+    assert rerun.calls == []
+    assert summary["resumed"] == 2 and summary["stations"] == ["PUG1701"]
+
+
+def test_rate_limiter_spaces_calls():
+    now = [0.0]
+    slept = []
+    limiter = RateLimiter(4.0, clock=lambda: now[0], sleep=slept.append)
+    for _ in range(3):
+        limiter.acquire()
+    assert slept == [0.25, 0.5]
+
+
+def test_backfill_noaa_history_writes_through_the_store_and_falls_back_for_plain_adapters():
+    store = MemoryTimeSeriesStore()
+    begin = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+    summary = backfill_noaa_history(begin, end, noaa=FakeChunkNoaa(), store=store, checkpoint=BackfillCheckpoint())
+    assert summary["stream"] == "noaa" and summary["records"] == 3 and summary["missing"] == []
+    assert store.get_series(CURRENTS, "PUG1701", _WIDE_START, _WIDE_END)
+
+    class HistoryOnly:
+        station = "9449880"
+        current_station = "PUG1702"
+
+        def fetch_water_level_history(self, begin, end, station=None):
+            return [{"t": "2024-01-02T00:00:00+00:00", "value": 2.0}]
+
+        def fetch_currents_history(self, begin, end, station):
+            return []
+
+    legacy = backfill_noaa_history(begin, end, noaa=HistoryOnly(), store=MemoryTimeSeriesStore())
+    assert legacy == {"stream": "noaa", "stations": ["9449880"], "records": 1}
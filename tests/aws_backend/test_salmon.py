@@ -39,7 +39,7 @@ def empty_albion_cache(monkeypatch, tmp_path):
     """Point the Albion FOS cache at an empty dir so _fetch_fraser returns {}.
 
     The real adapter reads the stock-aligned Fraser signal from cached FOS CSVs
-    (data/salmon/albion_fos/fosYYYY.csv), not from requests.get. To exercise the
+    (data/salmon/albion_fos/fosYYYY.csv), not from http_get. To exercise the
     DART/climatology fallback paths a test must make that cache empty.
     """
     monkeypatch.setattr(salmon_mod, "_ALBION_FOS_CACHE_DIR", tmp_path)
@@ -50,8 +50,8 @@ def test_climatology_fallback_when_live_sources_fail(empty_albion_cache, monkeyp
     def boom(*_args, **_kwargs):
         raise RuntimeError("network down")
 
-    # Albion cache empty (fixture) + DART (requests.get) down -> climatology.
-    monkeypatch.setattr("src.aws_backend.sources.salmon.requests.get", boom)
+    # Albion cache empty (fixture) + DART (http_get) down -> climatology.
+    monkeypatch.setattr("src.aws_backend.sources.salmon.http_get", boom)
 
     series = SalmonRunAdapter().fetch_run_index(2024)
 
@@ -75,7 +75,7 @@ def test_climatology_fallback_on_non_200(empty_albion_cache, monkeypatch):
             raise ValueError("no json")
 
     monkeypatch.setattr(
-        "src.aws_backend.sources.salmon.requests.get",
+        "src.aws_backend.sources.salmon.http_get",
         lambda *a, **k: _ServerError(),
     )
 
@@ -104,7 +104,7 @@ def test_cached_albion_is_used_and_normalized(empty_albion_cache, monkeypatch):
     def boom(*_args, **_kwargs):
         raise RuntimeError("network must not be hit on the Albion path")
 
-    monkeypatch.setattr("src.aws_backend.sources.salmon.requests.get", boom)
+    monkeypatch.setattr("src.aws_backend.sources.salmon.http_get", boom)
 
     series = SalmonRunAdapter().fetch_run_index(2024)
 
@@ -128,7 +128,7 @@ def test_columbia_fallback_when_fraser_empty(empty_albion_cache, monkeypatch):
     dart_csv = "Date,Chin\n2024-07-05,1000\n2024-07-25,5000\n2024-08-20,500\n"
 
     monkeypatch.setattr(
-        "src.aws_backend.sources.salmon.requests.get",
+        "src.aws_backend.sources.salmon.http_get",
         lambda *a, **k: _CsvResponse(dart_csv),
     )
 
@@ -148,7 +148,7 @@ def test_run_index_always_within_unit_interval(monkeypatch):
     # With the real cache present, cached years return the Fraser signal even
     # when the network is down; uncached years fall through to climatology.
     monkeypatch.setattr(
-        "src.aws_backend.sources.salmon.requests.get",
+        "src.aws_backend.sources.salmon.http_get",
         lambda *a, **k: (_ for _ in ()).throw(ConnectionError("offline")),
     )
 
@@ -1,7 +1,20 @@
-from datetime import datetime
+import hashlib
+import io
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
 
 from src.aws_backend.timeseries import (
+    ColumnarTimeSeriesStore,
     MemoryTimeSeriesStore,
+    S3TimeSeriesStore,
     build_timeseries_store,
 )
 from src.aws_backend.config import Settings
@@ -85,3 +98,286 @@ def test_station_name_sanitization():
 def test_factory_selects_memory_backend():
     store = build_timeseries_store(Settings(storage_backend="memory"))
     assert isinstance(store, MemoryTimeSeriesStore)
+
+
+def test_factory_selects_columnar_backend():
+    store = build_timeseries_store(Settings(storage_backend="memory", timeseries_backend="columnar"))
+    assert isinstance(store, ColumnarTimeSeriesStore)
+
+
+def test_columnar_matches_memory_store_across_appends():
+    rng = random.Random(3)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    memory, columnar = MemoryTimeSeriesStore(), ColumnarTimeSeriesStore()
+    for batch in range(12):
+        records = []
+        for _ in range(rng.randint(1, 40)):
+            # Coarse times and a small id space force ties and key collisions.
+            t = base + timedelta(hours=rng.randint(0, 200))
+            records.append({"t": t.isoformat(), "id": str(rng.randint(0, 30)), "value": batch})
+        for store in (memory, columnar):
+            store.put_series("noaa", "station-1", records)
+
+        for _ in range(5):
+            start = base + timedelta(hours=rng.randint(-10, 210))
+            end = start + timedelta(hours=rng.randint(0, 100))
+            assert columnar.get_series("noaa", "station-1", start, end) == memory.get_series(
+                "noaa", "station-1", start, end
+            )
+    assert columnar.list_stations("noaa") == memory.list_stations("noaa")
+
+
+def test_columnar_get_columns_views():
+    store = ColumnarTimeSeriesStore()
+    store.put_series("noaa", "station-1", _records() + [{"t": "2026-01-04T00:00:00+00:00", "id": "d", "value": "n/a"}])
+    start = datetime.fromisoformat("2026-01-01T00:00:00+00:00")
+    end = datetime.fromisoformat("2026-01-04T00:00:00+00:00")
+
+    columns = store.get_columns("noaa", "station-1", start, end, ["value"])
+    t0 = start.timestamp()
+    assert list(columns["t"]) == [t0 + day * 86400.0 for day in range(4)]
+    assert list(columns["value"])[:3] == [1.0, 2.0, 3.0]
+    assert math.isnan(columns["value"][3])
+
+    # Earlier views are snapshots: a later write neither changes nor invalidates them.
+    store.put_series("noaa", "station-1", [{"t": "2025-12-31T00:00:00+00:00", "id": "z", "value": 0}])
+    assert list(columns["value"])[:3] == [1.0, 2.0, 3.0]
+    assert len(store.get_columns("noaa", "station-1", start - timedelta(days=1), end)["t"]) == 5
+
+    empty = store.get_columns("noaa", "missing", start, end, ["value"])
+    assert len(empty["t"]) == 0 and len(empty["value"]) == 0
+
+
+def test_columnar_rejects_bad_batch_atomically():
+    store = ColumnarTimeSeriesStore()
+    store.put_series("noaa", "station-1", _records())
+    try:
+        store.put_series("noaa", "station-1", [{"t": "2026-02-01T00:00:00+00:00", "id": "x"}, {"t": "bad", "id": "y"}])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+    result = store.get_series(
+        "noaa",
+        "station-1",
+        datetime.fromisoformat("2026-01-01T00:00:00+00:00"),
+        datetime.fromisoformat("2026-03-01T00:00:00+00:00"),
+    )
+    assert [r["id"] for r in result] == ["b", "a", "c"]
+
+
+def test_columnar_merges_pending_appends_one_caller_at_a_time(monkeypatch):
+    from src.aws_backend import timeseries
+
+    active, peak = [0], [0]
+    merge = timeseries._ColumnarSeries.compact
+
+    def slow_compact(series):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        try:
+            merge(series)
+        finally:
+            active[0] -= 1
+
+    monkeypatch.setattr(timeseries._ColumnarSeries, "compact", slow_compact)
+    store = ColumnarTimeSeriesStore()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    start, end = base - timedelta(days=1), base + timedelta(days=30)
+    results = []
+
+    def write(worker):
+        for i in range(5):
+            t = base + timedelta(hours=worker * 10 + i)
+            store.put_series("noaa", "station-1", [{"t": t.isoformat(), "id": f"{worker}-{i}", "value": i}])
+
+    def read():
+        for _ in range(5):
+            results.append(store.get_series("noaa", "station-1", start, end))
+            store.get_columns("noaa", "station-1", start, end, ["value"])
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(3)]
+    threads += [threading.Thread(target=read) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 1
+    assert all([r["t"] for r in rows] == sorted(r["t"] for r in rows) for rows in results)
+    assert len(store.get_series("noaa", "station-1", start, end)) == 15
+
+
+class _FakeS3:
+    """Thread-safe S3 stand-in: ETags, conditional puts, paginated listing."""
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self, page_size=2):
+        self.objects = {}
+        self.modified = {}
+        self.clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.page_size = page_size
+        self.calls = {"get_object": 0, "put_object": 0, "list_objects_v2": 0}
+        self.lock = threading.Lock()
+
+    def get_object(self, Bucket, Key):
+        with self.lock:
+            self.calls["get_object"] += 1
+            if Key not in self.objects:
+                raise self.exceptions.NoSuchKey(Key)
+            body, etag = self.objects[Key]
+        return {"Body": io.BytesIO(body), "ETag": etag}
+
+    def put_object(self, Bucket, Key, Body, ContentType=None, IfMatch=None, IfNoneMatch=None):
+        with self.lock:
+            self.calls["put_object"] += 1
+            current = self.objects.get(Key)
+            if (IfNoneMatch == "*" and current is not None) or (IfMatch and (current is None or current[1] != IfMatch)):
+                raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject")
+            etag = '"%s"' % hashlib.md5(Body).hexdigest()
+            self.objects[Key] = (Body, etag)
+            self.clock += timedelta(seconds=1)
+            self.modified[Key] = self.clock
+        return {"ETag": etag}
+
+    def delete_object(self, Bucket, Key, IfMatch=None):
+        with self.lock:
+            current = self.objects.get(Key)
+            if IfMatch and (current is None or current[1] != IfMatch):
+                raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "DeleteObject")
+            self.objects.pop(Key, None)
+        return {}
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None, Delimiter=None):
+        with self.lock:
+            self.calls["list_objects_v2"] += 1
+            keys = sorted(k for k in self.objects if k.startswith(Prefix))
+            start = int(ContinuationToken or 0)
+            page = keys[start:start + self.page_size]
+            response = {
+                "Contents": [{"Key": k, "ETag": self.objects[k][1], "LastModified": self.modified[k]} for k in page]
+            }
+        if start + self.page_size < len(keys):
+            response.update(IsTruncated=True, NextContinuationToken=str(start + self.page_size))
+        return response
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    fake = _FakeS3()
+    monkeypatch.setattr(boto3, "client", lambda *a, **k: fake)
+    return fake
+
+
+def _monthly_records(months=5):
+    base = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    return [
+        {"t": (base + timedelta(days=15 * i)).isoformat(), "id": str(i), "value": i}
+        for i in range(2 * months)
+    ]
+
+
+_ALL = (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2030, 1, 1, tzinfo=timezone.utc))
+
+
+def test_s3_store_matches_memory_store(fake_s3):
+    s3_store = S3TimeSeriesStore(Settings(timeseries_io_workers=4))
+    memory = MemoryTimeSeriesStore()
+    records = _monthly_records()
+    for store in (s3_store, memory):
+        store.put_series("noaa", "station-1", records[::2])
+        store.put_series("noaa", "station-1", records[1::2] + [{**records[0], "value": 99}])
+
+    assert S3TimeSeriesStore(Settings()).get_series("noaa", "station-1", *_ALL) == memory.get_series(
+        "noaa", "station-1", *_ALL
+    )
+    window = (datetime(2025, 11, 10, tzinfo=timezone.utc), datetime(2026, 1, 20, tzinfo=timezone.utc))
+    assert s3_store.get_series("noaa", "station-1", *window) == memory.get_series("noaa", "station-1", *window)
+
+
+def test_s3_store_skips_unchanged_partitions(fake_s3):
+    store = S3TimeSeriesStore(Settings())
+    store.put_series("noaa", "station-1", _monthly_records())
+    puts = fake_s3.calls["put_object"]
+    store.put_series("noaa", "station-1", _monthly_records())
+    assert fake_s3.calls["put_object"] == puts
+
+    gets = fake_s3.calls["get_object"]
+    first = store.get_series("noaa", "station-1", *_ALL)
+    assert store.get_series("noaa", "station-1", *_ALL) == first
+    assert fake_s3.calls["get_object"] == gets
+    # Results are copies: mutating them does not leak into the cache.
+    first[0]["value"] = "mutated"
+    assert store.get_series("noaa", "station-1", *_ALL)[0]["value"] == 0
+
+
+def test_s3_conditional_put_merges_concurrent_writers(fake_s3):
+    first, second = S3TimeSeriesStore(Settings()), S3TimeSeriesStore(Settings())
+    t = "2026-01-05T00:00:00+00:00"
+    first.put_series("noaa", "station-1", [{"t": t, "id": "a"}])
+    second.put_series("noaa", "station-1", [{"t": t, "id": "b"}])
+    # ``first`` holds a stale ETag for the partition; its put must not clobber "b".
+    first.put_series("noaa", "station-1", [{"t": t, "id": "c"}])
+
+    ids = sorted(r["id"] for r in second.get_series("noaa", "station-1", *_ALL))
+    assert ids == ["a", "b", "c"]
+
+
+def test_s3_binary_partitions_match_memory_store(fake_s3):
+    store = S3TimeSeriesStore(Settings(timeseries_partition_format="binary"))
+    memory = MemoryTimeSeriesStore()
+    for target in (store, memory):
+        target.put_series("noaa", "station-1", _monthly_records())
+    assert all(key.endswith(".tsb") for key in fake_s3.objects)
+
+    fresh = S3TimeSeriesStore(Settings())
+    window = (datetime(2025, 11, 10, tzinfo=timezone.utc), datetime(2026, 1, 20, tzinfo=timezone.utc))
+    for span in (_ALL, window):
+        assert fresh.get_series("noaa", "station-1", *span) == memory.get_series("noaa", "station-1", *span)
+
+
+def test_s3_migration_converts_ndjson_and_keeps_newer_binary_rows(fake_s3):
+    legacy = S3TimeSeriesStore(Settings(timeseries_partition_format="ndjson"))
+    binary = S3TimeSeriesStore(Settings(timeseries_partition_format="binary"))
+    records = _monthly_records()
+    legacy.put_series("noaa", "station-1", records)
+    # A month that exists only as NDJSON keeps taking writes there.
+    binary.put_series("noaa", "station-1", [{**records[0], "value": "new"}])
+    expected = [{**records[0], "value": "new"}] + records[1:]
+    assert binary.get_series("noaa", "station-1", *_ALL) == expected
+
+    counts = binary.migrate_partitions("noaa")
+    assert counts == {"migrated": 5, "skipped": 0, "conflicts": 0}
+    assert all(key.endswith(".tsb") for key in fake_s3.objects)
+    assert S3TimeSeriesStore(Settings()).get_series("noaa", "station-1", *_ALL) == expected
+    assert binary.migrate_partitions("noaa") == {"migrated": 0, "skipped": 0, "conflicts": 0}
+
+
+def test_s3_writes_follow_the_months_existing_format(fake_s3):
+    legacy = S3TimeSeriesStore(Settings(timeseries_partition_format="ndjson"))
+    binary = S3TimeSeriesStore(Settings(timeseries_partition_format="binary"))
+    records = _monthly_records(months=2)
+    binary.put_series("noaa", "station-1", records)
+    # An NDJSON-configured writer updates the migrated month in place.
+    legacy.put_series("noaa", "station-1", [{**records[0], "value": "updated"}])
+    assert all(key.endswith(".tsb") for key in fake_s3.objects)
+    assert binary.get_series("noaa", "station-1", *_ALL)[0]["value"] == "updated"
+
+
+def test_s3_mid_migration_month_prefers_the_newer_object(fake_s3):
+    binary = S3TimeSeriesStore(Settings(timeseries_partition_format="binary"))
+    records = _monthly_records(months=1)
+    binary.put_series("noaa", "station-1", records)
+    # An older writer that only knows NDJSON adds a second object for the month.
+    key = next(iter(fake_s3.objects))[: -len(".tsb")] + ".ndjson"
+    updated = {**records[0], "value": "updated"}
+    fake_s3.put_object(Bucket="b", Key=key, Body=(json.dumps(updated) + "\n").encode())
+    assert S3TimeSeriesStore(Settings()).get_series("noaa", "station-1", *_ALL) == [updated] + records[1:]
+
+    # Rewriting the binary partition makes it the newer object again.
+    binary.put_series("noaa", "station-1", [{**records[0], "value": "newest"}])
+    assert S3TimeSeriesStore(Settings()).get_series("noaa", "station-1", *_ALL)[0]["value"] == "newest"
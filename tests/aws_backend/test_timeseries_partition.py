@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.aws_backend.timeseries_partition import (
+    PartitionFormatError,
+    PartitionReader,
+    decode_partition,
+    encode_partition,
+)
+
+
+def _records():
+    return [
+        {"t": "2026-01-01T00:00:00+00:00", "id": "a", "value": 1.5, "tags": ["x"]},
+        {"id": "b", "t": "2026-01-01T06:00:00Z", "value": None},
+        {"t": "2026-01-02T00:00:00+00:00", "id": "c", "confirmed": True, "meta": {"k": 1}},
+    ]
+
+
+def test_round_trip_preserves_values_keys_and_key_order():
+    records = _records()
+    decoded = decode_partition(encode_partition(records))
+    assert decoded == records
+    assert [list(r) for r in decoded] == [list(r) for r in records]
+
+
+def test_footer_stats_and_row_range():
+    reader = PartitionReader(encode_partition(_records()))
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+    assert (reader.rows, reader.t_min, reader.t_max) == (3, t0, t0 + 86400.0)
+    assert reader.sorted and not reader.naive
+
+    lo, hi = reader.row_range(t0 + 3600.0, t0 + 86400.0)
+    assert [r["id"] for r in reader.records(lo, hi)] == ["b", "c"]
+    assert reader.row_range(t0 + 2 * 86400.0, t0 + 3 * 86400.0) == (0, 0)
+
+
+def test_projection_decodes_only_requested_fields():
+    reader = PartitionReader(encode_partition(_records()))
+    assert reader.records(fields=["t", "value"]) == [
+        {"t": "2026-01-01T00:00:00+00:00", "value": 1.5},
+        {"t": "2026-01-01T06:00:00Z", "value": None},
+        {"t": "2026-01-02T00:00:00+00:00"},
+    ]
+    assert "meta" not in reader._decoded
+
+
+def test_naive_timestamps_are_flagged():
+    reader = PartitionReader(encode_partition([{"t": "2026-01-01", "value": 1}]))
+    assert reader.naive
+    assert reader.records() == [{"t": "2026-01-01", "value": 1}]
+
+
+def test_empty_partition_round_trips():
+    reader = PartitionReader(encode_partition([]))
+    assert reader.rows == 0 and reader.records() == []
+
+
+def test_rejects_foreign_bytes():
+    with pytest.raises(PartitionFormatError):
+        PartitionReader(b'{"t": "2026-01-01T00:00:00+00:00"}\n')
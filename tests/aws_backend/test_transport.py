@@ -0,0 +1,120 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.aws_backend.sources import transport
+from src.aws_backend.sources.ndbc import NdbcAdapter
+from src.aws_backend.sources.transport import HttpTransport, http_get, set_transport
+
+
+class _Stub(BaseHTTPRequestHandler):
+    """ETag-validated payload, a flaky path, and a slow path that tracks concurrency."""
+
+    hits = {}
+    fail_left = 0
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body=b"", headers=()):
+        self.send_response(code)
+        for k, v in headers:
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+        if self.path.startswith("/stdmet"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                return self._send(304, headers=[("ETag", '"v1"')])
+            return self._send(200, b"#YY MM\n#yr mo\n2026 06\n", [("ETag", '"v1"'), ("Content-Type", "text/plain")])
+        if self.path.startswith("/flaky"):
+            with cls.lock:
+                failing = cls.fail_left > 0
+                cls.fail_left -= 1
+            if failing:
+                return self._send(503, headers=[("Retry-After", "0")])
+            return self._send(200, b"ok")
+        if self.path.startswith("/slow"):
+            with cls.lock:
+                cls.active += 1
+                cls.peak = max(cls.peak, cls.active)
+            time.sleep(0.1)
+            with cls.lock:
+                cls.active -= 1
+            return self._send(200, b"slow")
+        self._send(404)
+
+
+@pytest.fixture
+def stub():
+    _Stub.hits, _Stub.fail_left, _Stub.active, _Stub.peak = {}, 0, 0, 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    set_transport(None)
+
+
+def test_conditional_get_returns_remembered_payload_on_304(stub):
+    t = HttpTransport()
+    first = t.get(f"{stub}/stdmet", params={"station": "46088"})
+    again = t.get(f"{stub}/stdmet", params={"station": "46088"})
+    assert first.status_code == again.status_code == 200 and again.text == first.text
+    assert _Stub.hits["/stdmet?station=46088"] == 2 and t.stats["not_modified"] == 1
+    # Different params are a different resource: no validators sent.
+    t.get(f"{stub}/stdmet", params={"station": "46087"})
+    assert t.stats["not_modified"] == 1
+
+
+def test_retries_are_bounded_and_jittered(stub):
+    sleeps = []
+    t = HttpTransport(max_retries=2, sleep=sleeps.append, jitter=lambda: 0.5)
+    _Stub.fail_left = 2
+    assert t.get(f"{stub}/flaky").status_code == 200 and t.stats["retries"] == 2
+    assert sleeps == [0.0, 0.0]  # Retry-After: 0 from the server
+
+    _Stub.fail_left = 5
+    assert t.get(f"{stub}/flaky").status_code == 503
+    assert _Stub.hits["/flaky"] == 3 + 3
+
+    refused = HttpTransport(max_retries=1, sleep=sleeps.append, jitter=lambda: 0.5, backoff_s=0.2)
+    with pytest.raises(requests.ConnectionError):
+        refused.get("http://127.0.0.1:9/", timeout=0.5)
+    assert sleeps[-1] == pytest.approx(0.1)
+
+
+def test_per_source_concurrency_limit(stub):
+    t = HttpTransport(source_limit=2)
+    threads = [threading.Thread(target=t.get, args=(f"{stub}/slow",), kwargs={"source": "ndbc"}) for _ in range(6)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert _Stub.peak == 2
+
+
+def test_http_get_is_plain_requests_get_unless_a_transport_is_injected(stub, monkeypatch):
+    calls = []
+    monkeypatch.setattr(transport.requests, "get", lambda url, **kw: calls.append((url, kw)) or "direct")
+    assert http_get("https://example.test/x", timeout=3, source="wsf") == "direct"
+    assert calls == [("https://example.test/x", {"timeout": 3})]
+
+    injected = HttpTransport()
+    set_transport(injected)
+    monkeypatch.setattr("src.aws_backend.sources.ndbc._REALTIME_URL", stub + "/stdmet/{station}")
+    adapter = NdbcAdapter(station_ids=["46088"])
+    assert adapter.fetch_all_realtime() == adapter.fetch_all_realtime()
+    assert injected.stats["not_modified"] == 1 and calls == [("https://example.test/x", {"timeout": 3})]
@@ -0,0 +1,125 @@
+"""Tests for the connection planner's shared upstream cache (trips/upstream_cache.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from src.aws_backend.casting.trips.connections import ConnectionClients
+from src.aws_backend.casting.trips.upstream_cache import UpstreamCache, cached_clients
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _counting(result):
+    calls = []
+
+    def fn(*args):
+        calls.append(args)
+        return result() if callable(result) else result
+
+    return fn, calls
+
+
+def test_responses_are_reused_within_the_feed_ttl_and_report_their_age():
+    clock = FakeClock()
+    cache = UpstreamCache({"sailing_space": 5.0}, clock=clock)
+    fn, calls = _counting([{"terminal_id": 1}])
+
+    assert cache.fetch("sailing_space", (1,), lambda: fn(1)) == ([{"terminal_id": 1}], 0.0)
+    clock.t += 3.0
+    assert cache.fetch("sailing_space", (1,), lambda: fn(1)) == ([{"terminal_id": 1}], 3.0)
+    # A different terminal is a different request.
+    cache.fetch("sailing_space", (2,), lambda: fn(2))
+    clock.t += 2.0
+    assert cache.fetch("sailing_space", (1,), lambda: fn(1))[1] == 0.0
+    assert calls == [(1,), (2,), (1,)]
+    assert cache.stats == {"misses": 3, "hits": 1}
+
+
+def test_concurrent_identical_calls_share_one_upstream_fetch():
+    cache = UpstreamCache()
+    gate = threading.Event()
+    calls = []
+
+    def slow_schedule(route_id, trip_date):
+        calls.append((route_id, trip_date))
+        gate.wait(5)
+        return {"schedule_id": route_id}
+
+    clients = cached_clients(
+        ConnectionClients(
+            schedule=slow_schedule,
+            sailing_space=lambda *a: [],
+            vessel_locations=lambda *a: [],
+            predict_eta=lambda dt: {},
+            skylink_board=lambda *a: [],
+            seaplane_schedule=lambda *a: [],
+        ),
+        cache,
+    )
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(clients.schedule(9, date(2026, 6, 27))))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats["misses"] + cache.stats["coalesced"] < 8 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [(9, date(2026, 6, 27))]
+    assert results == [{"schedule_id": 9}] * 8
+    assert cache.stats == {"misses": 1, "coalesced": 7}
+
+
+def test_empty_results_and_errors_are_shared_but_not_cached():
+    cache = UpstreamCache()
+    empty, empty_calls = _counting([])
+    cache.fetch("vessel_locations", (), empty)
+    cache.fetch("vessel_locations", (), empty)
+    assert len(empty_calls) == 2
+
+    def boom():
+        raise ConnectionError("upstream down")
+
+    with pytest.raises(ConnectionError):
+        cache.fetch("schedule", (9,), boom)
+    assert cache.fetch("schedule", (9,), lambda: {"ok": True}) == ({"ok": True}, 0.0)
+
+
+def test_cache_is_bounded_and_unlisted_feeds_pass_through():
+    cache = UpstreamCache({"predict_eta": 300.0}, max_entries=2)
+    for minute in range(3):
+        cache.fetch("predict_eta", (minute,), lambda: {"eta": 150.0})
+    cache.fetch("predict_eta", (0,), lambda: {"eta": 150.0})
+    assert cache.stats["misses"] == 4
+
+    board, calls = _counting([{"flight_number": "AS1"}])
+    clients = cached_clients(
+        ConnectionClients(
+            schedule=lambda *a: {},
+            sailing_space=lambda *a: [],
+            vessel_locations=lambda *a: [],
+            predict_eta=lambda dt: {},
+            skylink_board=board,
+            seaplane_schedule=lambda *a: [],
+        ),
+        cache,
+    )
+    clients.skylink_board("SEA")
+    clients.skylink_board("SEA")
+    assert clients.skylink_board is board and len(calls) == 2
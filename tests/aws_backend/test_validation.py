@@ -1,7 +1,8 @@
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
 
 from src.aws_backend.models import NormalizedSighting, SourceEvidence, ValidationStatus
-from src.aws_backend.validation import cross_validate_sightings, deduplicate_sightings, haversine_km
+from src.aws_backend.validation import cross_validate_sightings, deduplicate_sightings, haversine_km, time_score
 
 
 def _sighting(source: str, source_id: str, lat: float, lng: float, confidence: float = 0.8):
@@ -46,3 +47,94 @@ def test_deduplicate_keeps_one_nearby_canonical_sighting():
     assert deduped[0].canonical_id
     assert len(deduped[0].evidence) >= 2
 
+
+
+def _reference_dedupe_matches(sightings, spatial_radius_km, temporal_window_hours):
+    """Pairwise first-match scan the grid index must reproduce."""
+    kept = []
+    matches = []
+    for sighting in sightings:
+        matched = None
+        for position, existing in enumerate(kept):
+            distance = haversine_km(sighting.latitude, sighting.longitude, existing.latitude, existing.longitude)
+            if distance <= spatial_radius_km and time_score(sighting.timestamp, existing.timestamp, temporal_window_hours) > 0:
+                matched = position
+                break
+        matches.append(matched)
+        if matched is None:
+            kept.append(sighting)
+    return matches
+
+
+def _reference_cross_counts(sightings, spatial_radius_km, temporal_window_hours):
+    counts = []
+    for sighting in sightings:
+        spatial = temporal = 0
+        matched = []
+        for other in sightings:
+            if other.sighting_id == sighting.sighting_id:
+                continue
+            distance = haversine_km(sighting.latitude, sighting.longitude, other.latitude, other.longitude)
+            temporal_ok = time_score(sighting.timestamp, other.timestamp, temporal_window_hours) > 0
+            spatial += distance <= spatial_radius_km
+            temporal += temporal_ok
+            if distance <= spatial_radius_km and temporal_ok:
+                matched.append(other.sighting_id)
+        counts.append((spatial, temporal, matched))
+    return counts
+
+
+def _random_sightings(count, seed):
+    rng = random.Random(seed)
+    base = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    sources = ["obis_verified", "inaturalist", "orcahello", "community"]
+    sightings = []
+    for index in range(count):
+        source = rng.choice(sources)
+        sightings.append(
+            NormalizedSighting(
+                sighting_id=f"{source}:{index}",
+                source=source,
+                source_id=str(index),
+                # Whole-hour offsets put many pairs exactly on the window edge.
+                timestamp=base + timedelta(hours=rng.randint(0, 240), minutes=rng.choice([0, 0, 17])),
+                latitude=rng.uniform(48.3, 48.8),
+                longitude=rng.uniform(-123.4, -122.8),
+                confidence=rng.uniform(0.3, 0.95),
+                source_reliability=rng.uniform(0.3, 0.95),
+                evidence=[SourceEvidence(source=source, source_id=str(index))],
+            )
+        )
+    return sightings
+
+
+def test_deduplicate_grid_matches_pairwise_scan():
+    for radius_km, window_hours in [(5.0, 24.0), (0.0, 24.0), (2.5, 1.0), (50.0, 0.5)]:
+        sightings = _random_sightings(400, seed=int(radius_km * 10 + window_hours))
+        expected = _reference_dedupe_matches(sightings, radius_km, window_hours)
+        deduped = deduplicate_sightings(sightings, spatial_radius_km=radius_km, temporal_window_hours=window_hours)
+        assert len(deduped) == sum(1 for m in expected if m is None)
+        assert [s.sighting_id for s in deduped] == [s.sighting_id for s, m in zip(sightings, expected) if m is None]
+
+
+def test_cross_validate_grid_matches_pairwise_scan():
+    sightings = _random_sightings(300, seed=7)
+    # A repeated id is skipped on both sides, like the pairwise loop.
+    sightings.append(sightings[0].model_copy(deep=True))
+    for radius_km, window_hours in [(10.0, 48.0), (1.0, 6.0), (0.0, 0.0)]:
+        expected = _reference_cross_counts(sightings, radius_km, window_hours)
+        cross_validate_sightings(sightings, spatial_radius_km=radius_km, temporal_window_hours=window_hours)
+        for sighting, (spatial, temporal, matched) in zip(sightings, expected):
+            result = sighting.cross_validation
+            assert (result.spatial_matches, result.temporal_matches) == (spatial, temporal)
+            assert result.matched_sighting_ids == matched
+
+
+def test_grid_handles_antimeridian_neighbours():
+    east = _sighting("obis_verified", "e", 52.0, 179.999)
+    west = _sighting("inaturalist", "w", 52.0, -179.999)
+
+    validated = cross_validate_sightings([east, west], spatial_radius_km=1.0)
+
+    assert validated[0].cross_validation.matched_sighting_ids == ["inaturalist:w"]
+    assert validated[1].cross_validation.matched_sighting_ids == ["obis_verified:e"]
@@ -0,0 +1,45 @@
+"""Convert NDJSON time-series partitions in S3 to the binary partition format.
+
+Rewrites every ``timeseries/{stream}/{station}/{yyyy}/{mm}.ndjson`` under the
+raw-payload bucket as ``{mm}.tsb`` (see ``src/aws_backend/timeseries_partition``)
+and deletes the NDJSON object once the binary copy is in place. Safe to run
+while ingest is live and safe to re-run: months already converted are no-ops,
+and a month whose NDJSON changed mid-run is reported as a conflict and left for
+the next run (readers merge both formats meanwhile).
+
+Set ``ORCAST_TIMESERIES_PARTITION_FORMAT=binary`` on the writers first so new
+months are not written as NDJSON behind the migration.
+
+Run:
+    set -a && . ./.env && set +a && PYTHONPATH=. .venv/bin/python tools/timeseries_migrate.py
+    PYTHONPATH=. .venv/bin/python tools/timeseries_migrate.py --stream env_currents --keep-legacy
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+
+from src.aws_backend.config import settings
+from src.aws_backend.timeseries import S3TimeSeriesStore
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s timeseries_migrate %(message)s")
+log = logging.getLogger("timeseries_migrate")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stream", default=None, help="only migrate this stream (default: all)")
+    parser.add_argument("--keep-legacy", action="store_true", help="write .tsb copies but keep the NDJSON objects")
+    args = parser.parse_args()
+
+    store = S3TimeSeriesStore(settings)
+    log.info("migrating s3://%s/timeseries/%s", store.bucket, f"{args.stream}/" if args.stream else "")
+    counts = store.migrate_partitions(args.stream, delete_legacy=not args.keep_legacy)
+    print(json.dumps(counts, indent=2))
+    return 1 if counts["conflicts"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())